@@ -24,11 +24,17 @@ class LLMConfig:
     model: str
 
 
+@dataclass(frozen=True)
+class RenderConfig:
+    mode: str = "openpyxl"
+
+
 @dataclass(frozen=True)
 class AppConfig:
     templates: TemplateConfig
     llm: LLMConfig
     config_path: Path
+    render: RenderConfig = RenderConfig()
 
 
 def _resolve_path(value: str, base_dir: Path) -> Path | None:
@@ -66,4 +72,12 @@ def load_config(path: str) -> AppConfig:
         base_dir,
     )
 
-    return AppConfig(templates=TemplateConfig(assessment=template), llm=llm_config, config_path=config_path)
+    render = data.get("render", {})
+    mode = (_read_env("DOCCOLLATE_ASSESSMENT_RENDER_MODE") or str(render.get("mode", "")).strip() or "openpyxl").lower()
+
+    return AppConfig(
+        templates=TemplateConfig(assessment=template),
+        llm=llm_config,
+        config_path=config_path,
+        render=RenderConfig(mode=mode),
+    )
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
+import logging
 from pathlib import Path
 
-from openpyxl import load_workbook
 from openpyxl.styles import Alignment
 
 from .constants import (
@@ -14,50 +14,114 @@ from .constants import (
     UNCHECKED_SYMBOL,
     WRAP_TEXT_KEYS,
 )
+from ..infra.template_cache import load_workbook_template, template_bytes, template_derived
+from ..infra.xlsx_patch import XlsxPatch
+from ..infra.zip_raw import raw_copy_supported
 
+logger = logging.getLogger(__name__)
 
-def _resolve_merged_cell(ws, coord: str):
-    for cell_range in ws.merged_cells.ranges:
-        if coord in cell_range:
-            return ws.cell(row=cell_range.min_row, column=cell_range.min_col)
+RENDER_MODES = ("openpyxl", "xml")
+
+
+def _field_anchors(wb) -> list[dict[str, tuple[int, int]]]:
+    """
+    Per sheet, map each coordinate the field maps write that lies inside a
+    merged range to the range's top-left anchor (row, col).
+    """
+    targets = [*CELL_MAP_TEXT.values(), *CELL_MAP_CHECKBOX.values(), CELL_MODE_PURE, CELL_MODE_EMBEDDED]
+    index: list[dict[str, tuple[int, int]]] = [{} for _ in wb.worksheets]
+    for sheet_idx, coord in targets:
+        coord = coord.upper()
+        for cell_range in wb.worksheets[sheet_idx].merged_cells.ranges:
+            if coord in cell_range:
+                index[sheet_idx][coord] = (cell_range.min_row, cell_range.min_col)
+                break
+    return index
+
+
+def _resolve_merged_cell(ws, coord: str, anchors: dict[str, tuple[int, int]]):
+    anchor = anchors.get(coord.upper())
+    if anchor is not None:
+        return ws.cell(row=anchor[0], column=anchor[1])
     return ws[coord]
 
 
-def _set_checkbox(ws, cell_coord: str, checked: bool) -> None:
-    cell = _resolve_merged_cell(ws, cell_coord)
+def _checkbox_value(value, checked: bool) -> str:
     target = CHECKED_SYMBOL if checked else UNCHECKED_SYMBOL
-    value = cell.value
     if isinstance(value, str) and value:
-        cell.value = value.replace("□", target).replace(UNCHECKED_SYMBOL, target).replace(CHECKED_SYMBOL, target)
-    else:
-        cell.value = target
+        return value.replace("□", target).replace(UNCHECKED_SYMBOL, target).replace(CHECKED_SYMBOL, target)
+    return target
 
 
-def _set_text_cell(ws, coord: str, value: str, wrap: bool) -> None:
-    cell = _resolve_merged_cell(ws, coord)
+def _set_checkbox(ws, cell_coord: str, checked: bool, anchors: dict[str, tuple[int, int]]) -> None:
+    cell = _resolve_merged_cell(ws, cell_coord, anchors)
+    cell.value = _checkbox_value(cell.value, checked)
+
+
+def _set_text_cell(ws, coord: str, value: str, wrap: bool, anchors: dict[str, tuple[int, int]]) -> None:
+    cell = _resolve_merged_cell(ws, coord, anchors)
     cell.value = value
     if wrap:
         cell.alignment = Alignment(wrap_text=True, vertical="top", horizontal="left")
 
 
-def generate_excel(template_path: Path, output_path: Path, data: dict) -> None:
-    wb = load_workbook(template_path)
+def _is_checked(value) -> bool:
+    return bool(value) if not isinstance(value, str) else value.strip().lower() in {"true", "1", "yes", "y", "是"}
+
+
+def _mode_cell(data: dict) -> tuple[int, str]:
+    mode_value = str(data.get("assess__product_mode_val", "pure")).lower()
+    if not mode_value:
+        mode_value = "embedded" if bool(data.get("assess__is_embedded")) else "pure"
+    return CELL_MODE_PURE if mode_value != "embedded" else CELL_MODE_EMBEDDED
+
+
+def _generate_excel_xml(template_path: Path, output_path: Path, data: dict) -> None:
+    book = XlsxPatch(template_bytes(template_path))
+
+    for key, (sheet_idx, coord) in CELL_MAP_TEXT.items():
+        value = str(data.get(key, "") or "")
+        book.set_value(sheet_idx, coord, value, wrap=key in WRAP_TEXT_KEYS)
+
+    for key, (sheet_idx, coord) in CELL_MAP_CHECKBOX.items():
+        checked = _is_checked(data.get(key, False))
+        book.set_value(sheet_idx, coord, _checkbox_value(book.value(sheet_idx, coord), checked))
+
+    sheet_idx, coord = _mode_cell(data)
+    book.set_value(sheet_idx, coord, _checkbox_value(book.value(sheet_idx, coord), True))
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    book.save(output_path)
+
+
+def generate_excel(template_path: Path, output_path: Path, data: dict, mode: str = "openpyxl") -> None:
+    """
+    Fill the assessment workbook. mode="xml" patches the target cells in the
+    worksheet XML and copies every other package member unchanged; the default
+    "openpyxl" mode loads and re-saves the whole workbook. The xml mode needs
+    the zipfile internals checked by zip_raw and uses openpyxl without them.
+    """
+    if mode not in RENDER_MODES:
+        raise ValueError(f"Unknown render mode: {mode!r} (expected one of {', '.join(RENDER_MODES)})")
+    if mode == "xml":
+        if raw_copy_supported():
+            _generate_excel_xml(template_path, output_path, data)
+            return
+        logger.warning("Raw zip member copies are unsupported on this Python; rendering with openpyxl")
+
+    wb = load_workbook_template(template_path)
     sheets = wb.worksheets
+    anchors = template_derived(template_path, "field_anchors", _field_anchors)
 
     for key, (sheet_idx, coord) in CELL_MAP_TEXT.items():
         value = str(data.get(key, "") or "")
-        _set_text_cell(sheets[sheet_idx], coord, value, key in WRAP_TEXT_KEYS)
+        _set_text_cell(sheets[sheet_idx], coord, value, key in WRAP_TEXT_KEYS, anchors[sheet_idx])
 
     for key, (sheet_idx, coord) in CELL_MAP_CHECKBOX.items():
-        value = data.get(key, False)
-        checked = bool(value) if not isinstance(value, str) else value.strip().lower() in {"true", "1", "yes", "y", "是"}
-        _set_checkbox(sheets[sheet_idx], coord, checked)
+        _set_checkbox(sheets[sheet_idx], coord, _is_checked(data.get(key, False)), anchors[sheet_idx])
 
-    mode_value = str(data.get("assess__product_mode_val", "pure")).lower()
-    if not mode_value:
-        mode_value = "embedded" if bool(data.get("assess__is_embedded")) else "pure"
-    sheet_idx, coord = CELL_MODE_PURE if mode_value != "embedded" else CELL_MODE_EMBEDDED
-    _set_checkbox(sheets[sheet_idx], coord, True)
+    sheet_idx, coord = _mode_cell(data)
+    _set_checkbox(sheets[sheet_idx], coord, True, anchors[sheet_idx])
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
     wb.save(output_path)
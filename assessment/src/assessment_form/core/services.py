@@ -3,14 +3,17 @@ from __future__ import annotations
 import json
 import logging
 import re
+from dataclasses import asdict
 from pathlib import Path
 
 from .config import AppConfig, load_config
 from .models import AssessmentInputSchema
 from .renderer import generate_excel
 from ..infra.ai_agent import extract_output_with_agent
-from ..infra.fs import read_text_content
+from ..infra.fs import read_spec_document
 from ..infra.path_utils import normalize_path
+from ..infra.spec_document import SpecDocument
+from ..infra.spec_fingerprint import fingerprint_text, inputs_digest, record_run, reusable_output
 from ..utils.format import build_filename
 
 logger = logging.getLogger(__name__)
@@ -42,13 +45,25 @@ def run_from_args(args) -> int:
     model = AssessmentInputSchema.model_validate(payload)
 
     source_text = (model.source_text or "").strip()
+    spec: str | SpecDocument = source_text
     if not source_text and model.spec_path:
         logger.info("Reading source text from spec_path: %s", model.spec_path)
-        source_text = read_text_content(normalize_path(model.spec_path))
+        spec = read_spec_document(normalize_path(model.spec_path))
+        source_text = spec.text
     if not source_text:
         logger.error("Empty source text, cannot run retrieval + LLM extraction")
         return 2
 
+    out_dir = normalize_path(model.resolved_output_dir())
+    spec_fp = fingerprint_text(source_text)
+    inputs = inputs_digest(payload, cfg.config_path, cfg.templates.assessment, cfg.llm.model, asdict(cfg.render))
+    run_key = str(normalize_path(args.input_json))
+    if getattr(args, "reuse", False):
+        previous = reusable_output(out_dir, "assessment", run_key, inputs, spec_fp)
+        if previous:
+            logger.info("[output] spec and inputs unchanged, reusing %s", previous)
+            return 0
+
     guessed_name = ""
     guessed_version = "V1.0"
     if model.spec_path:
@@ -73,7 +88,7 @@ def run_from_args(args) -> int:
     try:
         output_model = extract_output_with_agent(
             cfg.llm,
-            source_text=source_text,
+            source_text=spec,
             seed_data=seed_data,
             debug_dir=debug_dir,
             base_name=Path(args.input_json).stem,
@@ -87,12 +102,12 @@ def run_from_args(args) -> int:
         logger.error("Missing assessment template path")
         return 2
 
-    out_dir = normalize_path(model.resolved_output_dir())
     out_dir.mkdir(parents=True, exist_ok=True)
     out_path = out_dir / build_filename("产品评估申请", app_name, app_version, suffix=".xlsx")
 
     logger.info("Rendering assessment excel")
-    generate_excel(template, out_path, output_model.model_dump())
+    generate_excel(template, out_path, output_model.model_dump(), mode=cfg.render.mode)
+    record_run(out_dir, "assessment", run_key, inputs, spec_fp, out_path)
     logger.info("[output] generated_file=%s", out_path)
     logger.info("[output] output_dir=%s", out_dir)
     return 0
@@ -16,6 +16,7 @@ from ..core.config import LLMConfig
 from ..core.models import AssessmentOutputSchema
 from .field_pools import load_field_pools
 from .retrieval import retrieve_field_contexts
+from .spec_document import SpecDocument
 
 logger = logging.getLogger(__name__)
 
@@ -340,7 +341,7 @@ def _normalize_main_functions(text: str, max_chars: int = 200) -> str:
 
 def extract_output_with_agent(
     llm: LLMConfig,
-    source_text: str,
+    source_text: str | SpecDocument,
     seed_data: dict[str, Any] | None = None,
     debug_dir: Path | None = None,
     base_name: str = "llm",
@@ -350,6 +351,8 @@ def extract_output_with_agent(
 
     model = _build_model(llm)
     field_contexts = retrieve_field_contexts(source_text, top_k=3)
+    if isinstance(source_text, SpecDocument):
+        source_text = source_text.text
 
     logger.info("LLM stage 1/2: pool scoring (single-field + top-%s)", POOL_TOP_N)
     pool_seed: dict[str, str] = {}
@@ -3,7 +3,11 @@ from __future__ import annotations
 import logging
 from pathlib import Path
 
+from .docx_text import docx_text
+from .mapped_text import MappedText
 from .path_utils import normalize_path
+from .spec_cache import DOCX_TEXT, cached_spec_text
+from .spec_document import SpecDocument
 
 logger = logging.getLogger(__name__)
 
@@ -16,13 +20,15 @@ def read_text_content(path: Path, max_chars: int = 50000) -> str:
     ext = p.suffix.lower()
     try:
         if ext == ".md":
-            return p.read_text(encoding="utf-8")[:max_chars]
+            with MappedText(p) as mapped:
+                return mapped.head(max_chars)
         if ext == ".docx":
-            from docx import Document
-
-            doc = Document(p)
-            parts = [para.text.strip() for para in doc.paragraphs if para.text.strip()]
-            return "\n".join(parts)[:max_chars]
+            return cached_spec_text(p, DOCX_TEXT, docx_text)[:max_chars]
     except Exception as exc:
         logger.warning("Failed to read spec text from %s: %s", p, exc)
     return ""
+
+
+def read_spec_document(path: Path, max_chars: int = 50000) -> SpecDocument:
+    """Parsed head of a spec, as read_text_content."""
+    return SpecDocument(read_text_content(path, max_chars))
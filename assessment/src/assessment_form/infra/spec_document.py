@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, Iterator
+
+# Line kinds.
+BLANK = 0
+PARAGRAPH = 1
+HEADING = 2
+TABLE = 3
+IMAGE = 4
+
+
+@dataclass(frozen=True)
+class Section:
+    title: str
+    level: int
+    # Index of the enclosing section in SpecDocument.sections, -1 at top level.
+    parent: int
+    # Heading line index (-1 for the text before the first heading) and the
+    # first line of the next heading; the section's own body lies in between.
+    line: int
+    end: int
+
+
+@dataclass(frozen=True)
+class Chunk:
+    title: str
+    # Line range [start, stop) the chunk was packed from.
+    start: int
+    stop: int
+    text: str
+
+
+class SpecDocument:
+    """
+    Line-level parse of a spec's text, shared by the chunkers and extractors.
+
+    Each line is stored once as the (start, end) offsets of its stripped
+    content in `text`, with its indentation width and a kind code in
+    parallel arrays; heading levels live on `sections`.
+    Markdown headings ("#" lines) form the section tree. Use `parse_document`
+    to get the instance for a given text; it is built once and reused.
+    """
+
+    __slots__ = ("text", "_starts", "_ends", "_indents", "_kinds", "sections")
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self._parse(_offset_lines(text))
+
+    def _parse(self, rows: Iterable[tuple[int, str]]) -> None:
+        self._starts = array("l")
+        self._ends = array("l")
+        self._indents = array("l")
+        self._kinds = bytearray()
+        sections = [Section(title="", level=0, parent=-1, line=-1, end=0)]
+        stack: list[int] = []
+        for idx, (offset, raw) in enumerate(rows):
+            content = raw.strip()
+            indent = len(raw) - len(raw.lstrip()) if content else 0
+            start = offset + indent
+            self._starts.append(start)
+            self._ends.append(start + len(content))
+            self._indents.append(indent)
+            if not content:
+                self._kinds.append(BLANK)
+                continue
+            if content.startswith("#"):
+                level = min(len(content) - len(content.lstrip("#")), 255)
+                self._kinds.append(HEADING)
+                while stack and sections[stack[-1]].level >= level:
+                    stack.pop()
+                sections.append(
+                    Section(
+                        title=content.lstrip("#").strip(),
+                        level=level,
+                        parent=stack[-1] if stack else -1,
+                        line=idx,
+                        end=0,
+                    )
+                )
+                stack.append(len(sections) - 1)
+                continue
+            if content.startswith("|"):
+                self._kinds.append(TABLE)
+            elif content.startswith("!["):
+                self._kinds.append(IMAGE)
+            else:
+                self._kinds.append(PARAGRAPH)
+
+        # Close each section at the next heading.
+        bounds = [s.line for s in sections[1:]] + [len(self._kinds)]
+        self.sections = tuple(
+            Section(s.title, s.level, s.parent, s.line, end) for s, end in zip(sections, bounds)
+        )
+
+    def __len__(self) -> int:
+        return len(self._kinds)
+
+    def line(self, idx: int) -> str:
+        """Stripped content of line `idx`."""
+        return self.text[self._starts[idx] : self._ends[idx]]
+
+    def kind(self, idx: int) -> int:
+        return self._kinds[idx]
+
+    def lines(self) -> Iterator[str]:
+        """Non-blank lines, stripped, in document order."""
+        for idx, kind in enumerate(self._kinds):
+            if kind != BLANK:
+                yield self.line(idx)
+
+    def body(self, section: int) -> Iterator[int]:
+        """Indices of the non-blank, non-heading lines directly under a section."""
+        s = self.sections[section]
+        for idx in range(s.line + 1, s.end):
+            if self._kinds[idx] not in (BLANK, HEADING):
+                yield idx
+
+    def pack(
+        self,
+        max_chars: int,
+        *,
+        split_at_headings: bool = False,
+        count_breaks: bool = True,
+        count_indent: bool = False,
+    ) -> list[Chunk]:
+        """
+        Group consecutive non-blank lines into chunks of at most about max_chars.
+
+        With split_at_headings, a heading closes the current chunk and titles
+        the following ones instead of being packed as content. count_breaks
+        counts the joining newlines toward max_chars. count_indent measures
+        lines with their leading whitespace and only takes unindented "#"
+        lines as headings, as a splitter working on rstripped raw lines does;
+        chunk text is made of stripped lines either way.
+        """
+        chunks: list[Chunk] = []
+        title = ""
+        picked: list[int] = []
+        size = 0
+        sep = 1 if count_breaks else 0
+
+        def flush(stop: int) -> None:
+            nonlocal picked, size
+            if picked:
+                text = "\n".join(self.line(i) for i in picked)
+                chunks.append(Chunk(title=title, start=picked[0], stop=stop, text=text))
+            picked = []
+            size = 0
+
+        for idx, kind in enumerate(self._kinds):
+            if kind == BLANK:
+                continue
+            if split_at_headings and kind == HEADING and not (count_indent and self._indents[idx]):
+                flush(idx)
+                title = self.heading_title(idx)
+                continue
+            length = self._ends[idx] - self._starts[idx]
+            if count_indent:
+                length += self._indents[idx]
+            if picked and size + sep + length > max_chars:
+                flush(idx)
+            size += length + (sep if picked else 0)
+            picked.append(idx)
+        flush(len(self._kinds))
+        return chunks
+
+    def heading_title(self, idx: int) -> str:
+        """Title of the heading on line `idx`."""
+        return self.line(idx).lstrip("#").strip()
+
+
+def _offset_lines(text: str) -> Iterator[tuple[int, str]]:
+    offset = 0
+    for raw in text.splitlines(keepends=True):
+        yield offset, raw
+        offset += len(raw)
+
+
+@lru_cache(maxsize=8)
+def parse_document(text: str) -> SpecDocument:
+    return SpecDocument(text)
+
+
+def as_document(source: str | SpecDocument) -> SpecDocument:
+    return source if isinstance(source, SpecDocument) else parse_document(source or "")
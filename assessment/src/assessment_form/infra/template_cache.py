@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import pickle
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+
+@dataclass
+class _Entry:
+    mtime_ns: int
+    size: int
+    digest: str
+    raw: bytes
+    workbook_snapshot: bytes | None = None
+    # Values built from the parsed template (see template_derived); they live
+    # and die with the entry, so a content change drops them.
+    derived: dict[str, Any] = field(default_factory=dict)
+
+
+_LOCK = threading.Lock()
+_ENTRIES: dict[str, _Entry] = {}
+
+
+def _entry(path: str | Path) -> _Entry:
+    """
+    Raw bytes for `path`, read once per process. A changed mtime/size triggers
+    a re-read; the parsed snapshot is only dropped if the content hash differs.
+    """
+    p = Path(path).expanduser().resolve()
+    st = p.stat()
+    key = str(p)
+    with _LOCK:
+        entry = _ENTRIES.get(key)
+        if entry is not None and entry.mtime_ns == st.st_mtime_ns and entry.size == st.st_size:
+            return entry
+    raw = p.read_bytes()
+    digest = hashlib.sha1(raw).hexdigest()
+    with _LOCK:
+        entry = _ENTRIES.get(key)
+        if entry is not None and entry.digest == digest:
+            entry.mtime_ns, entry.size = st.st_mtime_ns, st.st_size
+            return entry
+        entry = _Entry(mtime_ns=st.st_mtime_ns, size=st.st_size, digest=digest, raw=raw)
+        _ENTRIES[key] = entry
+        return entry
+
+
+def template_bytes(path: str | Path) -> bytes:
+    return _entry(path).raw
+
+
+def load_workbook_template(path: str | Path) -> Any:
+    """
+    Return a fresh openpyxl Workbook for an XLSX template.
+
+    The template is parsed once per process and kept as a pickled snapshot;
+    each call unpickles an independent copy (about 3x cheaper than
+    load_workbook). copy.deepcopy is not used because it corrupts the
+    workbook's stylesheet on save.
+    """
+    entry = _entry(path)
+    with _LOCK:
+        snapshot = entry.workbook_snapshot
+    if snapshot is None:
+        from openpyxl import load_workbook
+
+        snapshot = pickle.dumps(load_workbook(io.BytesIO(entry.raw)), protocol=pickle.HIGHEST_PROTOCOL)
+        with _LOCK:
+            entry.workbook_snapshot = snapshot
+    return pickle.loads(snapshot)
+
+
+def template_derived(path: str | Path, name: str, build: Callable[[Any], Any]) -> Any:
+    """
+    Value computed by `build` from the parsed XLSX template, built once per
+    template content and kept under `name` with its cache entry.
+    """
+    entry = _entry(path)
+    with _LOCK:
+        value = entry.derived.get(name)
+    if value is None:
+        value = build(load_workbook_template(path))
+        with _LOCK:
+            value = entry.derived.setdefault(name, value)
+    return value
@@ -0,0 +1,330 @@
+from __future__ import annotations
+
+import html
+import io
+import posixpath
+import re
+import zipfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO
+
+from openpyxl.utils import column_index_from_string, range_boundaries
+from openpyxl.utils.cell import coordinate_from_string, get_column_letter
+
+from .zip_raw import can_copy_raw, copy_raw
+
+_SHEET_RE = re.compile(r"<sheet\b[^>]*?\br:id=\"([^\"]+)\"")
+_REL_RE = re.compile(r"<Relationship\b[^>]*>")
+_ATTR_RE = re.compile(r"([\w:]+)=\"([^\"]*)\"")
+_MERGE_RE = re.compile(r"<mergeCell\b[^>]*?\bref=\"([^\"]+)\"")
+_SHEET_DATA_RE = re.compile(r"<sheetData\s*/>|<sheetData>(.*?)</sheetData>", re.S)
+_ROW_RE = re.compile(r"<row\b([^>]*?)(?:/>|>(.*?)</row>)", re.S)
+_CELL_RE = re.compile(r"<c\b([^>]*?)(?:/>|>(.*?)</c>)", re.S)
+_SI_RE = re.compile(r"<si>(.*?)</si>|<si/>", re.S)
+_SST_RE = re.compile(r"<sst\b[^>]*>")
+_T_RE = re.compile(r"<t(?:\s[^>]*)?>(.*?)</t>|<t/>", re.S)
+_RPH_RE = re.compile(r"<rPh\b.*?</rPh>", re.S)
+_V_RE = re.compile(r"<v>(.*?)</v>", re.S)
+_CELL_XFS_RE = re.compile(r"<cellXfs\b[^>]*>(.*?)</cellXfs>", re.S)
+_XF_RE = re.compile(r"<xf\b[^>]*?(?:/>|>.*?</xf>)", re.S)
+_ALIGNMENT_RE = re.compile(r"<alignment\b[^>]*?(?:/>|>.*?</alignment>)", re.S)
+_ILLEGAL_RE = re.compile(r"[\000-\010]|[\013-\014]|[\016-\037]")
+
+_WRAP_ALIGNMENT = '<alignment horizontal="left" vertical="top" wrapText="1"/>'
+
+
+def _attrs(text: str) -> dict[str, str]:
+    return dict(_ATTR_RE.findall(text))
+
+
+def _set_attr(tag: str, name: str, value: str) -> str:
+    """Set one attribute on an opening tag string, keeping the others as-is."""
+    pattern = re.compile(rf"\s{re.escape(name)}=\"[^\"]*\"")
+    if pattern.search(tag):
+        return pattern.sub(f' {name}="{value}"', tag, count=1)
+    end = len(tag) - (2 if tag.endswith("/>") else 1)
+    return f'{tag[:end]} {name}="{value}"{tag[end:]}'
+
+
+def _escape(text: str) -> str:
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def _t_element(text: str) -> str:
+    space = ' xml:space="preserve"' if text.strip() != text else ""
+    return f"<t{space}>{_escape(text)}</t>"
+
+
+def _si_text(inner: str) -> str:
+    inner = _RPH_RE.sub("", inner)
+    return "".join(html.unescape(m.group(1) or "") for m in _T_RE.finditer(inner))
+
+
+def _split_coord(coord: str) -> tuple[int, int]:
+    column, row = coordinate_from_string(coord)
+    return row, column_index_from_string(column)
+
+
+@dataclass
+class _Sheet:
+    name: str
+    xml: str
+    anchors: dict[str, str]
+    writes: dict[str, tuple[str, bool]] = field(default_factory=dict)
+
+
+class XlsxPatch:
+    """
+    Cell-level edits applied directly to the worksheet XML of an XLSX package.
+
+    Only the worksheets that received writes, the shared string table and (for
+    wrapped cells) the stylesheet are re-serialized; every other member is
+    copied from the source package as its original compressed bytes.
+    Coordinates inside a merged range address its top-left cell.
+    """
+
+    def __init__(self, source: bytes) -> None:
+        self._source = source
+        self._zip = zipfile.ZipFile(io.BytesIO(source))
+        names = set(self._zip.namelist())
+        workbook = self._zip.read("xl/workbook.xml").decode("utf-8")
+        rels = self._zip.read("xl/_rels/workbook.xml.rels").decode("utf-8")
+        targets: dict[str, str] = {}
+        sst_name = ""
+        for m in _REL_RE.finditer(rels):
+            attrs = _attrs(m.group(0))
+            target = posixpath.normpath(posixpath.join("xl", attrs.get("Target", "")))
+            if attrs.get("Target", "").startswith("/"):
+                target = attrs["Target"].lstrip("/")
+            targets[attrs.get("Id", "")] = target
+            if attrs.get("Type", "").endswith("/sharedStrings"):
+                sst_name = target
+        self._sheet_names = [targets[rid] for rid in _SHEET_RE.findall(workbook) if "worksheet" in targets.get(rid, "worksheet")]
+        self._sheets: dict[int, _Sheet] = {}
+
+        self._sst_name = sst_name if sst_name in names else ""
+        self._sst_xml = ""
+        self._strings: list[str] = []
+        self._string_index: dict[str, int] = {}
+        self._new_strings: list[str] = []
+        self._sst_delta = 0
+        if self._sst_name:
+            self._sst_xml = self._zip.read(self._sst_name).decode("utf-8")
+            self._strings = [_si_text(m.group(1) or "") for m in _SI_RE.finditer(self._sst_xml)]
+            for idx, text in enumerate(self._strings):
+                self._string_index.setdefault(text, idx)
+
+        self._styles_xml: str | None = None
+        self._wrapped_xf: dict[int, int] = {}
+        self._new_xfs: list[str] = []
+
+    def _sheet(self, sheet_idx: int) -> _Sheet:
+        sheet = self._sheets.get(sheet_idx)
+        if sheet is None:
+            name = self._sheet_names[sheet_idx]
+            xml = self._zip.read(name).decode("utf-8")
+            anchors: dict[str, str] = {}
+            for ref in _MERGE_RE.findall(xml):
+                min_col, min_row, max_col, max_row = range_boundaries(ref)
+                anchor = f"{get_column_letter(min_col)}{min_row}"
+                for row in range(min_row, max_row + 1):
+                    for col in range(min_col, max_col + 1):
+                        anchors[f"{get_column_letter(col)}{row}"] = anchor
+            sheet = _Sheet(name=name, xml=xml, anchors=anchors)
+            self._sheets[sheet_idx] = sheet
+        return sheet
+
+    def _anchor(self, sheet: _Sheet, coord: str) -> str:
+        coord = coord.upper()
+        return sheet.anchors.get(coord, coord)
+
+    def _find_cell(self, sheet: _Sheet, coord: str) -> re.Match | None:
+        row_num = str(_split_coord(coord)[0])
+        data = _SHEET_DATA_RE.search(sheet.xml)
+        if data is None or data.group(1) is None:
+            return None
+        for row in _ROW_RE.finditer(sheet.xml, data.start(1), data.end(1)):
+            if _attrs(row.group(1)).get("r") != row_num or row.group(2) is None:
+                continue
+            for cell in _CELL_RE.finditer(sheet.xml, row.start(2), row.end(2)):
+                if _attrs(cell.group(1)).get("r") == coord:
+                    return cell
+        return None
+
+    def value(self, sheet_idx: int, coord: str) -> str | None:
+        """Current text of a cell (pending writes included), or None if empty."""
+        sheet = self._sheet(sheet_idx)
+        coord = self._anchor(sheet, coord)
+        if coord in sheet.writes:
+            return sheet.writes[coord][0] or None
+        cell = self._find_cell(sheet, coord)
+        if cell is None or cell.group(2) is None:
+            return None
+        kind = _attrs(cell.group(1)).get("t", "n")
+        if kind == "inlineStr":
+            return _si_text(cell.group(2))
+        v = _V_RE.search(cell.group(2))
+        if v is None:
+            return None
+        if kind == "s":
+            return self._strings[int(v.group(1))]
+        return html.unescape(v.group(1))
+
+    def set_value(self, sheet_idx: int, coord: str, value: str, *, wrap: bool = False) -> None:
+        if _ILLEGAL_RE.search(value):
+            raise ValueError(f"Cell {coord} value contains characters not allowed in XLSX")
+        sheet = self._sheet(sheet_idx)
+        coord = self._anchor(sheet, coord)
+        _, prev_wrap = sheet.writes.get(coord, ("", False))
+        sheet.writes[coord] = (value, wrap or prev_wrap)
+
+    def _string_ref(self, text: str) -> int:
+        idx = self._string_index.get(text)
+        if idx is None:
+            idx = len(self._strings)
+            self._strings.append(text)
+            self._new_strings.append(text)
+            self._string_index[text] = idx
+        return idx
+
+    def _wrap_style(self, style: int) -> int:
+        """Index of a copy of cell style `style` with wrapped, top-left alignment."""
+        if style in self._wrapped_xf:
+            return self._wrapped_xf[style]
+        if self._styles_xml is None:
+            self._styles_xml = self._zip.read("xl/styles.xml").decode("utf-8")
+        block = _CELL_XFS_RE.search(self._styles_xml)
+        if block is None:
+            raise ValueError("Workbook stylesheet has no cellXfs")
+        xfs = _XF_RE.findall(block.group(1))
+        xf = xfs[style] if style < len(xfs) else '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+        if _ALIGNMENT_RE.search(xf):
+            xf = _ALIGNMENT_RE.sub(_WRAP_ALIGNMENT, xf, count=1)
+        elif xf.endswith("/>"):
+            xf = f"{xf[:-2]}>{_WRAP_ALIGNMENT}</xf>"
+        else:
+            open_end = xf.index(">") + 1
+            xf = xf[:open_end] + _WRAP_ALIGNMENT + xf[open_end:]
+        open_end = xf.index(">")
+        xf = _set_attr(xf[: open_end + 1], "applyAlignment", "1") + xf[open_end + 1 :]
+        new_idx = len(xfs) + len(self._new_xfs)
+        self._new_xfs.append(xf)
+        self._wrapped_xf[style] = new_idx
+        return new_idx
+
+    def _cell_xml(self, coord: str, attrs_text: str, value: str, wrap: bool) -> str:
+        attrs = _attrs(attrs_text)
+        if wrap:
+            attrs["s"] = str(self._wrap_style(int(attrs.get("s", "0"))))
+        attrs.pop("t", None)
+        attrs["r"] = coord
+        if not value:
+            body = ""
+        elif self._sst_name:
+            attrs["t"] = "s"
+            body = f"<v>{self._string_ref(value)}</v>"
+            self._sst_delta += 1
+        else:
+            attrs["t"] = "inlineStr"
+            body = f"<is>{_t_element(value)}</is>"
+        attr_text = "".join(f' {k}="{v}"' for k, v in attrs.items())
+        return f"<c{attr_text}>{body}</c>" if body else f"<c{attr_text}/>"
+
+    def _patch_row(self, row_xml: str | None, writes: dict[int, tuple[str, str, bool]]) -> str:
+        """Rewrite the cells of one row; `writes` maps column index -> (coord, value, wrap)."""
+        pieces: list[str] = []
+        pending = dict(sorted(writes.items()))
+        pos = 0
+        for cell in _CELL_RE.finditer(row_xml or ""):
+            coord = _attrs(cell.group(1)).get("r", "")
+            col = _split_coord(coord)[1] if coord else 0
+            for new_col in [c for c in pending if c < col]:
+                new_coord, value, wrap = pending.pop(new_col)
+                pieces.append(row_xml[pos : cell.start()])
+                pieces.append(self._cell_xml(new_coord, "", value, wrap))
+                pos = cell.start()
+            if col in pending:
+                new_coord, value, wrap = pending.pop(col)
+                if _attrs(cell.group(1)).get("t") == "s":
+                    self._sst_delta -= 1
+                pieces.append(row_xml[pos : cell.start()])
+                pieces.append(self._cell_xml(new_coord, cell.group(1), value, wrap))
+                pos = cell.end()
+        # Cells past the last existing one go before any trailing non-cell content.
+        for new_coord, value, wrap in pending.values():
+            pieces.append(self._cell_xml(new_coord, "", value, wrap))
+        pieces.append((row_xml or "")[pos:])
+        return "".join(pieces)
+
+    def _patch_sheet(self, sheet: _Sheet) -> str:
+        by_row: dict[int, dict[int, tuple[str, str, bool]]] = {}
+        for coord, (value, wrap) in sheet.writes.items():
+            row, col = _split_coord(coord)
+            by_row.setdefault(row, {})[col] = (coord, value, wrap)
+
+        xml = sheet.xml
+        data = _SHEET_DATA_RE.search(xml)
+        if data is None:
+            raise ValueError(f"{sheet.name} has no sheetData")
+        start, end = (data.start(1), data.end(1)) if data.group(1) is not None else (data.start(), data.end())
+        inner = data.group(1) or ""
+        pieces: list[str] = []
+        pos = 0
+        for row in _ROW_RE.finditer(inner):
+            row_num = int(_attrs(row.group(1)).get("r", "0"))
+            for new_row in [r for r in by_row if r < row_num]:
+                pieces.append(inner[pos : row.start()])
+                pieces.append(f'<row r="{new_row}">{self._patch_row(None, by_row.pop(new_row))}</row>')
+                pos = row.start()
+            if row_num in by_row:
+                pieces.append(inner[pos : row.start()])
+                pieces.append(f"<row{row.group(1)}>{self._patch_row(row.group(2), by_row.pop(row_num))}</row>")
+                pos = row.end()
+        pieces.append(inner[pos:])
+        for new_row in sorted(by_row):
+            pieces.append(f'<row r="{new_row}">{self._patch_row(None, by_row[new_row])}</row>')
+        body = "".join(pieces)
+        if data.group(1) is None:
+            return f"{xml[:start]}<sheetData>{body}</sheetData>{xml[end:]}"
+        return xml[:start] + body + xml[end:]
+
+    def _patched_members(self) -> dict[str, bytes]:
+        members: dict[str, bytes] = {}
+        for sheet in self._sheets.values():
+            if sheet.writes:
+                members[sheet.name] = self._patch_sheet(sheet).encode("utf-8")
+        if self._new_strings or self._sst_delta:
+            sst = self._sst_xml
+            head = _SST_RE.search(sst)
+            tag = head.group(0)
+            count = int(_attrs(tag).get("count", str(len(self._strings) - len(self._new_strings)))) + self._sst_delta
+            tag = _set_attr(_set_attr(tag, "count", str(max(count, 0))), "uniqueCount", str(len(self._strings)))
+            close = sst.rindex("</sst>")
+            added = "".join(f"<si>{_t_element(text)}</si>" for text in self._new_strings)
+            members[self._sst_name] = (sst[: head.start()] + tag + sst[head.end() : close] + added + sst[close:]).encode("utf-8")
+        if self._new_xfs:
+            styles = self._styles_xml
+            block = _CELL_XFS_RE.search(styles)
+            tag_end = styles.index(">", block.start()) + 1
+            tag = styles[block.start() : tag_end]
+            total = len(_XF_RE.findall(block.group(1))) + len(self._new_xfs)
+            close = block.end() - len("</cellXfs>")
+            members["xl/styles.xml"] = (
+                styles[: block.start()] + _set_attr(tag, "count", str(total)) + styles[tag_end:close] + "".join(self._new_xfs) + styles[close:]
+            ).encode("utf-8")
+        return members
+
+    def save(self, out_path: str | Path | IO[bytes]) -> None:
+        members = self._patched_members()
+        src_fp = io.BytesIO(self._source)
+        with zipfile.ZipFile(out_path, "w", compression=zipfile.ZIP_DEFLATED) as zout:
+            for info in self._zip.infolist():
+                blob = members.get(info.filename)
+                if blob is not None:
+                    zout.writestr(info.filename, blob)
+                elif can_copy_raw(info):
+                    copy_raw(src_fp, info, zout)
+                else:
+                    zout.writestr(info, self._zip.read(info))
+
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import argparse
+import io
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from openpyxl import load_workbook
+
+from assessment_form.core.constants import CELL_MAP_CHECKBOX, CELL_MAP_TEXT
+from assessment_form.core.renderer import generate_excel
+
+_TEMPLATE = ROOT / "assessment_form" / "resources" / "assessment_application_materials.xlsx"
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="compare-render-modes")
+    parser.add_argument("--template", default=str(_TEMPLATE))
+    parser.add_argument("--rounds", type=int, default=20, help="Timed renders per mode")
+    return parser
+
+
+def _sample_data(variant: int) -> dict:
+    data: dict = {}
+    for idx, key in enumerate(CELL_MAP_TEXT):
+        if variant == 1 and idx % 4 == 0:
+            data[key] = ""
+        else:
+            data[key] = f"{key} 示例内容 <{variant}> & 第{idx}项\n第二行 " * (1 + idx % 3)
+    for idx, key in enumerate(CELL_MAP_CHECKBOX):
+        data[key] = (idx + variant) % 2 == 0 if variant != 2 else "是"
+    data["assess__product_mode_val"] = "embedded" if variant % 2 else "pure"
+    return data
+
+
+def _cells(path: Path) -> dict[tuple[int, str], tuple]:
+    wb = load_workbook(path)
+    out: dict[tuple[int, str], tuple] = {}
+    for sheet_idx, ws in enumerate(wb.worksheets):
+        for row in ws.iter_rows():
+            for cell in row:
+                a = cell.alignment
+                out[(sheet_idx, cell.coordinate)] = (
+                    cell.value,
+                    a.horizontal,
+                    a.vertical,
+                    bool(a.wrap_text),
+                    cell.font.b,
+                    cell.font.sz,
+                    cell.border.left.style,
+                    cell.border.bottom.style,
+                )
+        out[(sheet_idx, "<merged>")] = tuple(sorted(str(r) for r in ws.merged_cells.ranges))
+    return out
+
+
+def _time(template: Path, out: Path, data: dict, mode: str, rounds: int) -> float:
+    generate_excel(template, out, data, mode=mode)
+    samples = []
+    for _ in range(max(1, rounds)):
+        start = time.perf_counter()
+        generate_excel(template, out, data, mode=mode)
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return min(samples)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    template = Path(args.template).expanduser()
+    failures = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        a, b = Path(tmp) / "openpyxl.xlsx", Path(tmp) / "xml.xlsx"
+        for variant in range(3):
+            data = _sample_data(variant)
+            generate_excel(template, a, data, mode="openpyxl")
+            generate_excel(template, b, data, mode="xml")
+            left, right = _cells(a), _cells(b)
+            # openpyxl drops empty cells it considers unused; only compare those both sides keep or that hold a value.
+            keys = [k for k in left.keys() | right.keys() if (k in left and k in right) or (left.get(k) or right.get(k))[0] is not None]
+            diffs = [key for key in keys if left.get(key) != right.get(key)]
+            for key in sorted(diffs)[:10]:
+                print(f"[FAIL] variant={variant} {key}: openpyxl={left.get(key)!r} xml={right.get(key)!r}")
+            failures += len(diffs)
+
+            src = zipfile.ZipFile(template)
+            out = zipfile.ZipFile(io.BytesIO(b.read_bytes()))
+            changed = [n for n in src.namelist() if src.read(n) != out.read(n)]
+            print(f"[Info] variant={variant} cells={len(left)} diffs={len(diffs)} rewritten parts={changed}")
+
+        data = _sample_data(0)
+        slow = _time(template, a, data, "openpyxl", args.rounds)
+        fast = _time(template, b, data, "xml", args.rounds)
+        print(f"[Info] openpyxl={slow:.2f} ms xml={fast:.2f} ms ({slow / fast:.1f}x)")
+
+    if failures:
+        print(f"[FAIL] {failures} cell differences")
+        return 1
+    print("[PASS] xml mode matches openpyxl mode")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
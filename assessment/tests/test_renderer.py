@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from openpyxl import load_workbook
+
+from assessment_form.core import renderer
+from assessment_form.core.constants import CELL_MAP_CHECKBOX, CELL_MAP_TEXT
+from assessment_form.core.renderer import generate_excel
+from assessment_form.infra.zip_raw import raw_copy_supported
+
+_TEMPLATE = Path(__file__).resolve().parents[1] / "src" / "assessment_form" / "resources" / "assessment_application_materials.xlsx"
+
+
+def _sample_data(variant: int) -> dict:
+    data: dict = {}
+    for idx, key in enumerate(CELL_MAP_TEXT):
+        if variant == 1 and idx % 4 == 0:
+            data[key] = ""
+        else:
+            data[key] = f"{key} 示例内容 <{variant}> & 第{idx}项\n第二行 " * (1 + idx % 3)
+    for idx, key in enumerate(CELL_MAP_CHECKBOX):
+        data[key] = (idx + variant) % 2 == 0 if variant != 2 else "是"
+    data["assess__product_mode_val"] = "embedded" if variant % 2 else "pure"
+    return data
+
+
+def _cells(path: Path) -> dict[tuple[int, str], tuple]:
+    wb = load_workbook(path)
+    out: dict[tuple[int, str], tuple] = {}
+    for sheet_idx, ws in enumerate(wb.worksheets):
+        for row in ws.iter_rows():
+            for cell in row:
+                a = cell.alignment
+                out[(sheet_idx, cell.coordinate)] = (
+                    cell.value,
+                    a.horizontal,
+                    a.vertical,
+                    bool(a.wrap_text),
+                    cell.font.b,
+                    cell.font.sz,
+                    cell.border.left.style,
+                    cell.border.bottom.style,
+                )
+        out[(sheet_idx, "<merged>")] = tuple(sorted(str(r) for r in ws.merged_cells.ranges))
+    return out
+
+
+@pytest.mark.parametrize("variant", range(3))
+def test_xml_mode_matches_openpyxl(variant: int, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    if not raw_copy_supported():
+        pytest.skip("raw zip member copies are unsupported on this Python; xml mode falls back to openpyxl")
+    data = _sample_data(variant)
+    expected_path, actual_path = tmp_path / "openpyxl.xlsx", tmp_path / "xml.xlsx"
+    generate_excel(_TEMPLATE, expected_path, data, mode="openpyxl")
+
+    def _no_openpyxl(path):
+        raise AssertionError("xml mode fell back to openpyxl")
+
+    monkeypatch.setattr(renderer, "load_workbook_template", _no_openpyxl)
+    generate_excel(_TEMPLATE, actual_path, data, mode="xml")
+
+    expected, actual = _cells(expected_path), _cells(actual_path)
+    # openpyxl drops empty cells it considers unused; compare cells both sides keep or that hold a value.
+    keys = [
+        k for k in expected.keys() | actual.keys()
+        if (k in expected and k in actual) or (expected.get(k) or actual.get(k))[0] is not None
+    ]
+    diffs = {k: (expected.get(k), actual.get(k)) for k in sorted(keys) if expected.get(k) != actual.get(k)}
+    assert not diffs
+    for key, (sheet_idx, coord) in CELL_MAP_TEXT.items():
+        assert actual[(sheet_idx, coord)][0] == (data[key] or None)
@@ -15,6 +15,7 @@ def register(subparsers: argparse._SubParsersAction) -> None:
     parser.add_argument("--app-version", default="", help="Software version override")
     parser.add_argument("--company-label", default="", help="Preset label in soft_copyright.yaml")
     parser.add_argument("--contact-info", default="", help="Path to soft_copyright.yaml")
+    parser.add_argument("--reuse", action="store_true", help="Skip generation when the spec and inputs are unchanged since the last run")
     parser.add_argument("--debug", action="store_true", help="Write debug output to debug/")
     parser.set_defaults(func=handle)
 
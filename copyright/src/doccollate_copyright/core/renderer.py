@@ -4,7 +4,9 @@ import re
 from datetime import date, datetime, timedelta
 from pathlib import Path
 
-from docx import Document
+from ..infra.docx_form import ReplacementPlan, placeholder_index, render_form
+from ..infra.docx_package import save_docx
+from ..infra.template_cache import load_docx_template
 
 logger = logging.getLogger(__name__)
 
@@ -33,54 +35,11 @@ def parse_date(value: str) -> date | None:
 #           最终版核心替换函数 (保证在纯表格文档中生效)
 # ===================================================================
 
-def docx_replace_text(doc, replacements: dict) -> None:
+def docx_replace_text(doc, replacements: dict | ReplacementPlan) -> None:
     """
     遍历Word文档的所有部分（段落和表格），执行一个可靠的文本替换。
-    此版本通过重写段落的 .text 属性并直接在文档结构中操作来保证替换生效。
     """
-    # 1. 替换文档顶层的独立段落
-    for paragraph in doc.paragraphs:
-        replace_in_paragraph(paragraph, replacements)
-
-    # 2. 替换所有表格单元格内的段落
-    for table in doc.tables:
-        for row in table.rows:
-            for cell in row.cells:
-                for paragraph in cell.paragraphs:
-                    replace_in_paragraph(paragraph, replacements)
-
-
-def replace_in_paragraph(paragraph, replacements: dict) -> None:
-    """
-    辅助函数，在一个段落内循环替换所有找到的占位符。
-    通过重写 .text 属性来确保替换的可靠性。
-    此版本经过修改，可以同时处理带软回车 (在python-docx中为 \v ) 的占位符。
-    """
-    # 在 python-docx 库中，Word的软回车(↵)通常被解析为垂直制表符 '\v'
-    soft_break = "\v"
-
-    # 只要段落中还存在 '{{'，就持续进行替换
-    while "{{" in paragraph.text:
-        original_text = paragraph.text
-        for key, value in replacements.items():
-            # 使用 str() 确保所有值（包括None）都能被处理
-            value_str = str(value if value is not None else "")
-
-            # 准备带软回车的错误占位符, 例如 '{{APP_NAME}}\v'
-            broken_placeholder = key.replace("}}", f"}}{soft_break}")
-
-            # 先替换可能存在的错误版本，再替换正常的版本
-            paragraph.text = paragraph.text.replace(broken_placeholder, value_str)
-            paragraph.text = paragraph.text.replace(key, value_str)
-
-        # 防止因无法匹配的占位符导致的死循环
-        if original_text == paragraph.text:
-            if logger.isEnabledFor(logging.WARNING):
-                logger.warning(
-                    "  > 警告: 在段落中发现无法匹配的占位符，已跳过。段落内容(repr): %s",
-                    repr(paragraph.text[:90]),
-                )
-            break
+    render_form(doc, replacements)
 
 
 def _to_workday(value: date) -> date:
@@ -381,16 +340,16 @@ def generate_document(
     replacements = build_copyright_replacements(company_profile, data)
 
     try:
-        doc = Document(template_path)
+        doc, raw = load_docx_template(template_path)
     except Exception as exc:
         logger.error("Unable to open Word template '%s': %s", template_path, exc)
         return
 
-    docx_replace_text(doc, replacements)
+    render_form(doc, replacements, placeholder_index(template_path))
 
     try:
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        doc.save(output_path)
+        save_docx(doc, output_path, raw)
     except Exception as exc:
         logger.error("Failed to save file '%s': %s", output_path, exc)
 
@@ -11,6 +11,8 @@ from pydantic import ValidationError
 
 from ..infra.ai_agent import extract_output_with_agent
 from ..infra.fs import load_yaml_config, normalize_path, normalize_path_string, read_file_content
+from ..infra.retrieval import spec_focus
+from ..infra.spec_fingerprint import fingerprint_text, inputs_digest, record_run, reusable_output
 from ..utils.format import build_copyright_filename
 from .config import AppConfig, TemplateConfig, load_config
 from .models import CompanyProfileSchema, CopyrightInputSchema, CopyrightOutputSchema
@@ -144,19 +146,23 @@ def _ensure_source_lines(data: dict[str, object]) -> dict[str, object]:
     return data
 
 
+def _read_source_text(input_model: CopyrightInputSchema) -> str:
+    source_text = (input_model.source_text or "").strip()
+    if not source_text and input_model.spec_path:
+        logger.info("Reading source text from spec_path: %s", input_model.spec_path)
+        source_text = read_file_content(normalize_path(input_model.spec_path), focus=spec_focus())
+    return source_text
+
+
 def _build_output_model(
     input_model: CopyrightInputSchema,
     app_config: AppConfig,
+    source_text: str,
     debug_dir: Path | None = None,
     base_name: str = "llm",
 ) -> CopyrightOutputSchema:
     raw_data: dict[str, object] = dict(input_model.data or {})
 
-    source_text = (input_model.source_text or "").strip()
-    if not source_text and input_model.spec_path:
-        logger.info("Reading source text from spec_path: %s", input_model.spec_path)
-        source_text = read_file_content(normalize_path(input_model.spec_path))
-
     if raw_data:
         logger.info("Using provided JSON data for output fields")
         if input_model.app_name:
@@ -215,6 +221,20 @@ def _generate_from_payload(args, app_config: AppConfig, payload: dict) -> int:
         return 2
     logger.info("[stage] input.validated")
 
+    source_text = _read_source_text(input_model)
+    output_dir = normalize_path(input_model.resolved_output_dir())
+    spec_fp = fingerprint_text(source_text)
+    llm = app_config.llm
+    inputs = inputs_digest(
+        payload, app_config.config_path, template_path, llm.model, llm.skeleton_model, llm.final_model
+    )
+    run_key = str(normalize_path(args.input_json)) if getattr(args, "input_json", "") else str(input_model.spec_path or "")
+    if getattr(args, "reuse", False):
+        previous = reusable_output(output_dir, "copyright", run_key, inputs, spec_fp)
+        if previous:
+            logger.info("[output] spec and inputs unchanged, reusing %s", previous)
+            return 0
+
     base_name = Path(args.input_json).stem if getattr(args, "input_json", "") else "spec_input"
     debug_dir = (app_config.config_path.parent / "debug") if getattr(args, "debug", False) else None
     if debug_dir:
@@ -228,6 +248,7 @@ def _generate_from_payload(args, app_config: AppConfig, payload: dict) -> int:
         output_model = _build_output_model(
             input_model,
             app_config,
+            source_text,
             debug_dir=debug_dir,
             base_name=base_name,
         )
@@ -241,7 +262,6 @@ def _generate_from_payload(args, app_config: AppConfig, payload: dict) -> int:
 
     data = output_model.model_dump(exclude_none=True)
 
-    output_dir = normalize_path(input_model.resolved_output_dir())
     output_dir.mkdir(parents=True, exist_ok=True)
     logger.info("[stage] output.dir.ready path=%s", output_dir)
 
@@ -258,6 +278,7 @@ def _generate_from_payload(args, app_config: AppConfig, payload: dict) -> int:
 
     logger.info("[stage] render.start")
     generate_document(company_profile, data, template_path, output_path)
+    record_run(output_dir, "copyright", run_key, inputs, spec_fp, output_path)
     elapsed_ms = int((perf_counter() - t0) * 1000)
     logger.info("[output] generated_file=%s", output_path)
     logger.info("[output] output_dir=%s", output_dir)
@@ -5,35 +5,87 @@ import os
 import subprocess
 import tempfile
 from pathlib import Path
+from typing import Sequence
 
 import yaml
-from docx import Document
 
 from .path_utils import normalize_path, normalize_path_string
+from .docx_markdown import docx_to_markdown
+from .docx_text import docx_text
+from .mapped_text import MappedText
+from .pdf_text import extract_pdf_text
+from .spec_budget import fit_to_budget
+from .spec_cache import DOCX_MARKDOWN, DOCX_TEXT, PANDOC_GFM, PDF_TEXT, cached_spec_text, peek_spec_text
+from .spec_stream import iter_paragraphs
 
 logger = logging.getLogger(__name__)
 
+# With focus keywords, how much of a spec (in multiples of max_chars) is read
+# before fit_to_budget picks sections; keeps PDF reads from running to the end.
+_FOCUS_READ_MULTIPLE = 8
 
-def read_file_content(file_path: Path, max_chars: int = 40000) -> str:
+
+def read_file_content(file_path: Path, max_chars: int = 40000, focus: Sequence[str] = ()) -> str:
+    """
+    Spec text capped at max_chars. Without `focus` the head of the document is
+    kept; with focus keywords up to _FOCUS_READ_MULTIPLE times max_chars is read
+    and the budget is spread over its sections by relevance (see
+    spec_budget.fit_to_budget).
+    """
     file_path = normalize_path(file_path)
     ext = file_path.suffix.lower()
+    limit = max_chars * _FOCUS_READ_MULTIPLE if focus else max_chars
     text = ""
     try:
         if ext == ".md":
-            text = file_path.read_text(encoding="utf-8")[:max_chars]
+            with MappedText(file_path) as mapped:
+                text = mapped.head(limit)
         elif ext == ".docx":
-            text = _read_docx_via_pandoc(file_path, max_chars)
+            text = _read_docx_markdown(file_path, limit)
             if not text:
-                text = _read_docx_fallback(file_path, max_chars)
+                text = _read_docx_fallback(file_path, limit)
         elif ext == ".pdf":
-            text = _read_pdf_text(file_path, max_chars)
+            text = _read_pdf_text(file_path, limit)
     except Exception as exc:
         logger.error("Failed to read %s: %s", file_path, exc)
         return ""
-    return text
+    return fit_to_budget(text, max_chars, focus)
 
 
-def _read_docx_via_pandoc(file_path: Path, max_chars: int) -> str:
+def _read_docx_markdown(file_path: Path, max_chars: int | None) -> str:
+    """
+    DOCX as Markdown, converted in-process. Set DOCCOLLATE_DOCX_CONVERTER=pandoc
+    to use the pandoc binary instead.
+    """
+    if os.getenv("DOCCOLLATE_DOCX_CONVERTER", "").strip().lower() == "pandoc":
+        return _read_docx_via_pandoc(file_path, max_chars)
+    try:
+        content = cached_spec_text(file_path, DOCX_MARKDOWN, docx_to_markdown)
+    except Exception as exc:
+        logger.warning("Markdown conversion failed for %s: %s", file_path, exc)
+        return ""
+    _save_converted_md(file_path, content)
+    return content[:max_chars]
+
+
+def _read_docx_via_pandoc(file_path: Path, max_chars: int | None) -> str:
+    content = cached_spec_text(file_path, PANDOC_GFM, _convert_docx_via_pandoc)
+    _save_converted_md(file_path, content)
+    return content[:max_chars]
+
+
+def _save_converted_md(file_path: Path, content: str) -> None:
+    save_path = _pandoc_save_path(file_path) if content else None
+    if not save_path:
+        return
+    try:
+        save_path.parent.mkdir(parents=True, exist_ok=True)
+        save_path.write_text(content, encoding="utf-8")
+    except Exception as exc:
+        logger.warning("Failed to save converted md for %s: %s", file_path, exc)
+
+
+def _convert_docx_via_pandoc(file_path: Path) -> str:
     try:
         with tempfile.TemporaryDirectory() as tmp_dir:
             md_path = Path(tmp_dir) / f"{file_path.stem}.md"
@@ -46,15 +98,7 @@ def _read_docx_via_pandoc(file_path: Path, max_chars: int) -> str:
                 stderr = result.stderr.strip() or result.stdout.strip()
                 logger.warning("Pandoc conversion failed for %s: %s", file_path, stderr)
                 return ""
-            content = md_path.read_text(encoding="utf-8")
-            save_path = _pandoc_save_path(file_path)
-            if save_path:
-                try:
-                    save_path.parent.mkdir(parents=True, exist_ok=True)
-                    save_path.write_text(content, encoding="utf-8")
-                except Exception as exc:
-                    logger.warning("Failed to save converted md for %s: %s", file_path, exc)
-            return content[:max_chars]
+            return md_path.read_text(encoding="utf-8")
     except FileNotFoundError:
         logger.warning("Pandoc not found in PATH. Falling back to basic docx parsing.")
     except Exception as exc:
@@ -62,40 +106,38 @@ def _read_docx_via_pandoc(file_path: Path, max_chars: int) -> str:
     return ""
 
 
-def _read_docx_fallback(file_path: Path, max_chars: int) -> str:
-    doc = Document(file_path)
-    parts: list[str] = []
-    for paragraph in doc.paragraphs:
-        content = paragraph.text.strip()
-        if content:
-            parts.append(content)
-    for table in doc.tables:
-        for row in table.rows:
-            row_cells = []
-            for cell in row.cells:
-                cell_text = " ".join(p.text.strip() for p in cell.paragraphs if p.text.strip())
-                row_cells.append(cell_text)
-            if any(row_cells):
-                parts.append(" | ".join(cell for cell in row_cells if cell))
-    return "\n".join(parts)[:max_chars]
-
-
-def _read_pdf_text(file_path: Path, max_chars: int) -> str:
+def _read_docx_fallback(file_path: Path, max_chars: int | None) -> str:
+    # Plain text from the document XML only; embedded media is never read.
+    full = peek_spec_text(file_path, DOCX_TEXT)
+    if full is not None:
+        return full[:max_chars]
+    if max_chars is None:
+        return cached_spec_text(file_path, DOCX_TEXT, docx_text)
+    # Budgeted reads stop parsing once max_chars is filled, so they are cached under their own kind.
+    return cached_spec_text(file_path, f"{DOCX_TEXT}-{max_chars}", lambda p: "\n".join(iter_paragraphs(p, max_chars)))
+
+
+def _read_pdf_text(file_path: Path, max_chars: int | None) -> str:
+    full = peek_spec_text(file_path, PDF_TEXT)
+    if full is not None:
+        return full[:max_chars]
+    if max_chars is None:
+        return cached_spec_text(file_path, PDF_TEXT, lambda p: _pdf_text(p, None))
+    # Budgeted reads stop early, so they are cached under their own kind.
+    return cached_spec_text(file_path, f"{PDF_TEXT}-{max_chars}", lambda p: _pdf_text(p, max_chars))
+
+
+def _pdf_text(file_path: Path, max_chars: int | None) -> str:
     try:
-        import pdfplumber
+        import pdfplumber  # noqa: F401
     except Exception:  # pragma: no cover
         logger.warning("Missing dependency: pdfplumber")
         return ""
-    parts: list[str] = []
     try:
-        with pdfplumber.open(file_path) as pdf:
-            for page in pdf.pages:
-                text = page.extract_text() or ""
-                if text:
-                    parts.append(text)
+        return extract_pdf_text(file_path, max_chars)
     except Exception as exc:
         logger.warning("PDF text extraction failed for %s: %s", file_path, exc)
-    return "\n".join(parts)[:max_chars]
+        return ""
 
 
 def _pandoc_save_path(file_path: Path) -> Path | None:
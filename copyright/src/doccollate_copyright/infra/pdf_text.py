@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PdfStats:
+    pages_total: int = 0
+    pages_read: int = 0
+    chars: int = 0
+    seconds: float = 0.0
+    workers: int = 1
+    truncated: bool = False
+    from_cache: bool = False
+
+    @property
+    def pages_per_sec(self) -> float:
+        return self.pages_read / self.seconds if self.seconds > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "pages_total": self.pages_total,
+            "pages_read": self.pages_read,
+            "chars": self.chars,
+            "seconds": round(self.seconds, 4),
+            "pages_per_sec": round(self.pages_per_sec, 2),
+            "workers": self.workers,
+            "truncated": self.truncated,
+            "from_cache": self.from_cache,
+        }
+
+
+def _close_page(page) -> None:
+    # Releases the parsed layout objects; pdfplumber keeps them per page otherwise.
+    close = getattr(page, "close", None) or getattr(page, "flush_cache", None)
+    if close is not None:
+        close()
+
+
+def _extract_range(path: str, start: int, stop: int) -> list[str]:
+    import pdfplumber
+
+    texts: list[str] = []
+    with pdfplumber.open(path) as pdf:
+        for page in pdf.pages[start:stop]:
+            texts.append(page.extract_text() or "")
+            _close_page(page)
+    return texts
+
+
+def extract_pdf_text(
+    path: str | Path,
+    max_chars: int | None = None,
+    *,
+    workers: int = 0,
+    stats: PdfStats | None = None,
+) -> str:
+    """
+    Text of a PDF, pages joined by newlines (empty pages skipped).
+
+    With max_chars, pages are read in order and extraction stops as soon as
+    the budget is filled; the result is cut to max_chars. Without a budget,
+    workers > 1 splits the pages into contiguous ranges extracted by a process
+    pool. Timing and page counts are recorded in `stats` when given.
+    """
+    import pdfplumber
+
+    stats = stats if stats is not None else PdfStats()
+    start = perf_counter()
+    parts: list[str] = []
+    size = 0
+    with pdfplumber.open(str(path)) as pdf:
+        pages = pdf.pages
+        stats.pages_total = len(pages)
+        if max_chars is None and workers > 1 and len(pages) > 1:
+            workers = min(workers, len(pages))
+            step = -(-len(pages) // workers)
+            ranges = [(i, min(i + step, len(pages))) for i in range(0, len(pages), step)]
+            with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+                chunks = list(pool.map(_extract_range, [str(path)] * len(ranges), *zip(*ranges)))
+            parts = [text for chunk in chunks for text in chunk if text]
+            stats.pages_read = len(pages)
+            stats.workers = len(ranges)
+        else:
+            stats.workers = 1
+            for page in pages:
+                text = page.extract_text() or ""
+                _close_page(page)
+                stats.pages_read += 1
+                if text:
+                    parts.append(text)
+                    size += len(text) + (1 if len(parts) > 1 else 0)
+                if max_chars is not None and size >= max_chars:
+                    stats.truncated = stats.pages_read < stats.pages_total
+                    break
+    content = "\n".join(parts)
+    if max_chars is not None:
+        content = content[:max_chars]
+    stats.chars = len(content)
+    stats.seconds = perf_counter() - start
+    logger.debug(
+        "PDF %s: %d/%d pages in %.2fs (%.1f pages/s, workers=%d)",
+        path,
+        stats.pages_read,
+        stats.pages_total,
+        stats.seconds,
+        stats.pages_per_sec,
+        stats.workers,
+    )
+    return content
+
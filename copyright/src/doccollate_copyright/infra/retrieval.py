@@ -6,6 +6,8 @@ from dataclasses import dataclass
 import jieba
 from rank_bm25 import BM25Okapi
 
+from .spec_document import SpecDocument, as_document
+
 
 @dataclass(frozen=True)
 class RetrievalChunk:
@@ -22,24 +24,11 @@ def _tokenize(text: str) -> list[str]:
     return zh_tokens + en_tokens
 
 
-def _split_chunks(text: str, max_chars: int = 480) -> list[RetrievalChunk]:
-    lines = [ln.strip() for ln in text.splitlines()]
-    lines = [ln for ln in lines if ln]
-
-    segments: list[str] = []
-    buf = ""
-    for ln in lines:
-        if len(buf) + len(ln) + 1 > max_chars:
-            if buf:
-                segments.append(buf)
-            buf = ln
-        else:
-            buf = f"{buf}\n{ln}" if buf else ln
-    if buf:
-        segments.append(buf)
-
-    if not segments and text.strip():
-        segments = [text.strip()[:max_chars]]
+def _split_chunks(source: str | SpecDocument, max_chars: int = 480) -> list[RetrievalChunk]:
+    doc = as_document(source)
+    segments = [chunk.text for chunk in doc.pack(max_chars)]
+    if not segments and doc.text.strip():
+        segments = [doc.text.strip()[:max_chars]]
     return [RetrievalChunk(chunk_id=i, text=s) for i, s in enumerate(segments, start=1)]
 
 
@@ -132,7 +121,12 @@ def _field_queries() -> dict[str, list[str]]:
     }
 
 
-def retrieve_field_contexts(source_text: str, top_k: int = 3) -> dict[str, list[dict[str, object]]]:
+def spec_focus() -> tuple[str, ...]:
+    """Every field query term, used to budget long specs toward the extracted fields."""
+    return tuple(dict.fromkeys(q for queries in _field_queries().values() for q in queries))
+
+
+def retrieve_field_contexts(source_text: str | SpecDocument, top_k: int = 3) -> dict[str, list[dict[str, object]]]:
     chunks = _split_chunks(source_text)
     if not chunks:
         return {}
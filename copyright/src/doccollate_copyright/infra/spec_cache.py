@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+# Bump when the stored layout changes; older entries are then ignored.
+_SCHEMA = 1
+_DEFAULT_MAX_MB = 256
+
+# Conversion kinds shared across generators; the same kind must produce the same text everywhere.
+# Entries are keyed by content hash and kind only, so bump a kind's version whenever its
+# converter (docx_markdown, docx_text, pdf_text, or the pandoc invocation) changes its output.
+PANDOC_GFM = "pandoc-gfm.v2"
+DOCX_MARKDOWN = "docx-markdown.v2"
+DOCX_TEXT = "docx-text.v2"
+PDF_TEXT = "pdf-text.v2"
+
+
+@dataclass(frozen=True)
+class CachedSpec:
+    """Normalized text of one spec conversion."""
+
+    text: str
+
+
+def _enabled() -> bool:
+    return os.getenv("DOCCOLLATE_SPEC_CACHE", "").strip().lower() not in {"0", "false", "no", "off"}
+
+
+def cache_dir() -> Path:
+    configured = os.getenv("DOCCOLLATE_SPEC_CACHE_DIR", "").strip()
+    if configured:
+        return Path(configured).expanduser()
+    base = os.getenv("XDG_CACHE_HOME", "").strip() or "~/.cache"
+    return Path(base).expanduser() / "doccollate" / "specs"
+
+
+def _max_bytes() -> int:
+    raw = os.getenv("DOCCOLLATE_SPEC_CACHE_MAX_MB", "").strip()
+    try:
+        return int(float(raw) * 1024 * 1024) if raw else _DEFAULT_MAX_MB * 1024 * 1024
+    except ValueError:
+        return _DEFAULT_MAX_MB * 1024 * 1024
+
+
+def spec_digest(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _entry_path(root: Path, digest: str, kind: str) -> Path:
+    return root / digest[:2] / f"{digest}.{kind}.json"
+
+
+def _load(entry: Path) -> CachedSpec | None:
+    try:
+        data = json.loads(entry.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except Exception as exc:
+        logger.warning("Ignoring unreadable spec cache entry %s: %s", entry, exc)
+        return None
+    if data.get("schema") != _SCHEMA or not isinstance(data.get("text"), str):
+        return None
+    try:
+        os.utime(entry)
+    except OSError:
+        pass
+    return CachedSpec(text=data["text"])
+
+
+def _store(entry: Path, spec: CachedSpec, source: Path) -> None:
+    payload = {
+        "schema": _SCHEMA,
+        "source": str(source),
+        "text": spec.text,
+    }
+    entry.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=entry.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False)
+        os.replace(tmp, entry)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def evict(root: Path | None = None, max_bytes: int | None = None) -> int:
+    """
+    Drop least recently used entries until the cache fits in `max_bytes`.
+    Returns the number of entries removed.
+    """
+    root = root or cache_dir()
+    limit = _max_bytes() if max_bytes is None else max_bytes
+    entries: list[tuple[float, int, Path]] = []
+    total = 0
+    for entry in root.glob("*/*.json"):
+        try:
+            st = entry.stat()
+        except OSError:
+            continue
+        entries.append((st.st_mtime, st.st_size, entry))
+        total += st.st_size
+    removed = 0
+    for _, size, entry in sorted(entries):
+        if total <= limit:
+            break
+        try:
+            entry.unlink()
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    return removed
+
+
+def cached_spec(path: Path, kind: str, convert: Callable[[Path], str]) -> CachedSpec:
+    """
+    Return the conversion `kind` of the spec at `path`, running `convert` only
+    when no entry exists for the file's content hash.
+
+    Entries live under DOCCOLLATE_SPEC_CACHE_DIR (default
+    ~/.cache/doccollate/specs) and are shared by every generator that uses the
+    same conversion kind. Empty results are not stored. The cache is bounded
+    by DOCCOLLATE_SPEC_CACHE_MAX_MB and can be disabled with
+    DOCCOLLATE_SPEC_CACHE=0.
+    """
+    if not _enabled():
+        return CachedSpec(text=convert(path))
+
+    root = cache_dir()
+    entry = _entry_path(root, spec_digest(path), kind)
+    spec = _load(entry)
+    if spec is not None:
+        logger.debug("Spec cache hit: %s (%s)", path, kind)
+        return spec
+
+    text = convert(path)
+    spec = CachedSpec(text=text)
+    if text:
+        try:
+            _store(entry, spec, path)
+            evict(root)
+        except Exception as exc:
+            logger.warning("Failed to write spec cache entry for %s: %s", path, exc)
+    return spec
+
+
+def cached_spec_text(path: Path, kind: str, convert: Callable[[Path], str]) -> str:
+    return cached_spec(path, kind, convert).text
+
+
+def peek_spec_text(path: Path, kind: str) -> str | None:
+    """Cached text for `kind` if an entry exists; never converts."""
+    if not _enabled():
+        return None
+    spec = _load(_entry_path(cache_dir(), spec_digest(path), kind))
+    return spec.text if spec is not None else None
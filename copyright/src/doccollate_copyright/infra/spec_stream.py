@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import Iterator
+
+from .docx_text import iter_docx_lines
+from .pdf_text import _close_page
+
+_SPACE_RE = re.compile(r"[ \t　\xa0]+")
+
+
+def _normalize(line: str) -> str:
+    return _SPACE_RE.sub(" ", line).strip()
+
+
+def _md_paragraphs(path: Path) -> Iterator[str]:
+    # Blank-line separated blocks, read line by line.
+    lines: list[str] = []
+    with open(path, encoding="utf-8", errors="replace") as f:
+        for raw in f:
+            line = _normalize(raw)
+            if line:
+                lines.append(line)
+            elif lines:
+                yield "\n".join(lines)
+                lines = []
+    if lines:
+        yield "\n".join(lines)
+
+
+def _pdf_paragraphs(path: Path) -> Iterator[str]:
+    import pdfplumber
+
+    with pdfplumber.open(str(path)) as pdf:
+        for page in pdf.pages:
+            text = page.extract_text() or ""
+            _close_page(page)
+            for raw in text.splitlines():
+                line = _normalize(raw)
+                if line:
+                    yield line
+
+
+def iter_paragraphs(path: str | Path, max_chars: int | None = None) -> Iterator[str]:
+    """
+    Yield a spec's paragraphs lazily, whitespace-normalized and non-empty.
+
+    MD/TXT files are read line by line, DOCX bodies are streamed from
+    word/document.xml without touching media parts (table rows come out as
+    "a | b" lines), and PDFs are extracted page by page. With max_chars the
+    stream stops once the paragraphs plus their joining newlines reach the
+    budget; the last paragraph is cut to fit. Closing the generator early
+    releases the underlying file.
+    """
+    p = Path(path)
+    ext = p.suffix.lower()
+    if ext in (".md", ".txt"):
+        source = _md_paragraphs(p)
+    elif ext == ".docx":
+        source = iter_docx_lines(p)
+    elif ext == ".pdf":
+        source = _pdf_paragraphs(p)
+    else:
+        raise ValueError(f"Unsupported spec format: {path}")
+
+    if max_chars is None:
+        yield from source
+        return
+    used = 0
+    try:
+        for paragraph in source:
+            room = max_chars - used - (1 if used else 0)
+            if room <= 0:
+                break
+            if len(paragraph) >= room:
+                yield paragraph[:room]
+                break
+            yield paragraph
+            used += len(paragraph) + (1 if used else 0)
+    finally:
+        source.close()
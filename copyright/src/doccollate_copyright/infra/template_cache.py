@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import io
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+
+@dataclass
+class _Entry:
+    mtime_ns: int
+    size: int
+    digest: str
+    raw: bytes
+    document: Any = None
+    # Values built from the parsed template (see template_derived); they live
+    # and die with the entry, so a content change drops them.
+    derived: dict[str, Any] = field(default_factory=dict)
+
+
+_LOCK = threading.Lock()
+_ENTRIES: dict[str, _Entry] = {}
+
+
+def _entry(path: str | Path) -> _Entry:
+    """
+    Raw bytes for `path`, read once per process. A changed mtime/size triggers
+    a re-read; the parsed tree is only dropped if the content hash differs.
+    """
+    p = Path(path).expanduser().resolve()
+    st = p.stat()
+    key = str(p)
+    with _LOCK:
+        entry = _ENTRIES.get(key)
+        if entry is not None and entry.mtime_ns == st.st_mtime_ns and entry.size == st.st_size:
+            return entry
+    raw = p.read_bytes()
+    digest = hashlib.sha1(raw).hexdigest()
+    with _LOCK:
+        entry = _ENTRIES.get(key)
+        if entry is not None and entry.digest == digest:
+            entry.mtime_ns, entry.size = st.st_mtime_ns, st.st_size
+            return entry
+        entry = _Entry(mtime_ns=st.st_mtime_ns, size=st.st_size, digest=digest, raw=raw)
+        _ENTRIES[key] = entry
+        return entry
+
+
+def template_bytes(path: str | Path) -> bytes:
+    return _entry(path).raw
+
+
+def load_docx_template(path: str | Path, *, readonly: bool = False) -> tuple[Any, bytes]:
+    """
+    Return (Document, raw package bytes) for a DOCX template.
+
+    The template is parsed once per process; each call gets a deep copy it may
+    modify freely. With readonly=True the shared parsed Document is returned
+    as-is and must not be modified.
+    """
+    from docx import Document
+
+    entry = _entry(path)
+    with _LOCK:
+        if entry.document is None:
+            entry.document = Document(io.BytesIO(entry.raw))
+        document = entry.document
+    if readonly:
+        return document, entry.raw
+    return copy.deepcopy(document), entry.raw
+
+
+def template_derived(path: str | Path, name: str, build: Callable[[Any], Any]) -> Any:
+    """
+    Value computed by `build` from the shared parsed DOCX template, built once
+    per template content and kept under `name` with its cache entry.
+    """
+    entry = _entry(path)
+    with _LOCK:
+        value = entry.derived.get(name)
+    if value is None:
+        document, _ = load_docx_template(path, readonly=True)
+        value = build(document)
+        with _LOCK:
+            value = entry.derived.setdefault(name, value)
+    return value
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import argparse
+import difflib
+import io
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from doccollate_copyright.infra.docx_markdown import docx_to_markdown
+
+_REPO = ROOT.parents[1]
+_BUNDLED = [
+    ROOT / "doccollate_copyright" / "resources" / "software_copyright_application_form.docx",
+    _REPO / "registration" / "src" / "registration_form" / "resources" / "test_registration_form.docx",
+    _REPO / "environment" / "src" / "environment_form" / "resources" / "non_embedded_environment.docx",
+    _REPO / "function" / "src" / "function_form" / "resources" / "test_function_form.docx",
+    _REPO / "proposal" / "assets" / "proposal_template.docx",
+]
+# Expected docx_to_markdown output per bundled template (escaping checked against pandoc 3.9).
+_GOLDEN_DIR = Path(__file__).resolve().parent / "baselines" / "docx_markdown"
+_MARKUP_RE = re.compile(r"<[^>]+>|\[\d+\]\(#[^)]*\)|\]\(#[^)]*\)|[\\*_`#>|:\-\[\]]")
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+)$", re.M)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="bench-docx-markdown")
+    parser.add_argument("files", nargs="*", help="DOCX files (default: bundled templates plus a synthetic spec)")
+    parser.add_argument("--pandoc", default=shutil.which("pandoc") or "", help="pandoc binary for parity/timing")
+    parser.add_argument("--sections", type=int, default=200, help="Sections in the synthetic spec")
+    parser.add_argument("--images", type=int, default=40, help="Embedded images in the synthetic spec")
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--min-ratio", type=float, default=0.9, help="Fail when text similarity to pandoc drops below this")
+    parser.add_argument("--update-golden", action="store_true", help="Write the bundled templates' output as the new golden files")
+    return parser
+
+
+def _synthetic_spec(path: Path, sections: int, images: int) -> None:
+    import random
+
+    from docx import Document
+    from docx.shared import Inches
+
+    rng = random.Random(7)
+    doc = Document()
+    for idx in range(sections):
+        doc.add_heading(f"{idx + 1} 功能模块{idx + 1}", 1)
+        doc.add_heading(f"{idx + 1}.1 功能说明", 2)
+        doc.add_paragraph("系统按照分层架构设计，接入层、服务层与数据层职责清晰。" * 3)
+        for item in range(3):
+            doc.add_paragraph(f"支持第{item + 1}类数据的采集与校验", style="List Bullet")
+        for item in range(2):
+            doc.add_paragraph(f"步骤{item + 1}：提交申请并等待审核", style="List Number")
+        table = doc.add_table(rows=3, cols=3)
+        for r, row in enumerate(table.rows):
+            for c, cell in enumerate(row.cells):
+                cell.text = f"字段{r}-{c}"
+        if idx < images:
+            # Distinct images, otherwise python-docx stores a single shared part.
+            doc.add_picture(io.BytesIO(_noise_png(rng, 480, 320)), width=Inches(4))
+    doc.save(str(path))
+
+
+def _noise_png(rng, width: int, height: int) -> bytes:
+    import struct
+    import zlib
+
+    raw = b"".join(b"\x00" + rng.randbytes(width * 3) for _ in range(height))
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data))
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", zlib.compress(raw, 1)) + chunk(b"IEND", b"")
+
+
+def _pandoc(binary: str, path: Path) -> str:
+    result = subprocess.run([binary, str(path), "-t", "gfm"], capture_output=True, text=True, check=True)
+    return result.stdout
+
+
+def _normalize(markdown: str) -> str:
+    return re.sub(r"\s+", "", _MARKUP_RE.sub("", markdown))
+
+
+def _golden_path(path: Path) -> Path:
+    return _GOLDEN_DIR / f"{path.stem}.md"
+
+
+def _check_golden(path: Path, markdown: str) -> str | None:
+    """Why `markdown` differs from the golden output of `path`, or None if it matches."""
+    golden_path = _golden_path(path)
+    if not golden_path.exists():
+        return f"no golden file {golden_path.name}; run with --update-golden to record one"
+    golden = golden_path.read_text(encoding="utf-8")
+    if golden == markdown:
+        return None
+    for lineno, (want, got) in enumerate(zip(golden.splitlines(), markdown.splitlines()), start=1):
+        if want != got:
+            return f"line {lineno}: expected {want[:80]!r}, got {got[:80]!r}"
+    return f"expected {len(golden.splitlines())} lines, got {len(markdown.splitlines())}"
+
+
+def _time(fn, rounds: int) -> float:
+    samples = []
+    for _ in range(max(1, rounds)):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return min(samples)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    bundled = [p for p in _BUNDLED if p.exists()]
+    if args.update_golden:
+        _GOLDEN_DIR.mkdir(parents=True, exist_ok=True)
+        for path in bundled:
+            _golden_path(path).write_text(docx_to_markdown(path), encoding="utf-8")
+            print(f"[Info] golden written: {_golden_path(path)}")
+        return 0
+
+    failures = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        files = [Path(f).expanduser() for f in args.files]
+        if not files:
+            files = list(bundled)
+            synthetic = Path(tmp) / "synthetic_spec.docx"
+            _synthetic_spec(synthetic, args.sections, args.images)
+            files.append(synthetic)
+        if not args.pandoc:
+            print("[Warn] pandoc not found; skipping parity and pandoc timings")
+
+        print(f"{'file':<44} {'MB':>6} {'ours ms':>9} {'MB/s':>8} {'pandoc ms':>10} {'ratio':>6} {'headings':>9}")
+        for path in files:
+            size_mb = path.stat().st_size / 1e6
+            ours = docx_to_markdown(path)
+            ours_ms = _time(lambda: docx_to_markdown(path), args.rounds)
+            if path in bundled:
+                mismatch = _check_golden(path, ours)
+                if mismatch:
+                    print(f"[FAIL] {path.name}: {mismatch}")
+                    failures += 1
+            pandoc_ms = ratio = None
+            headings = "-"
+            if args.pandoc:
+                reference = _pandoc(args.pandoc, path)
+                pandoc_ms = _time(lambda: _pandoc(args.pandoc, path), args.rounds)
+                ratio = difflib.SequenceMatcher(None, _normalize(reference), _normalize(ours), autojunk=False).ratio()
+                ref_h = [(len(m.group(1)), _normalize(m.group(2))) for m in _HEADING_RE.finditer(reference)]
+                our_h = [(len(m.group(1)), _normalize(m.group(2))) for m in _HEADING_RE.finditer(ours)]
+                headings = "same" if ref_h == our_h else f"{len(our_h)}/{len(ref_h)}"
+                if ratio < args.min_ratio or headings != "same":
+                    failures += 1
+            print(
+                f"{path.name[:44]:<44} {size_mb:>6.2f} {ours_ms:>9.2f} {size_mb / (ours_ms / 1000.0):>8.1f} "
+                f"{pandoc_ms if pandoc_ms is not None else float('nan'):>10.2f} "
+                f"{ratio if ratio is not None else float('nan'):>6.3f} {headings:>9}"
+            )
+
+    if failures:
+        print(f"[FAIL] {failures} check(s) failed against the golden files or pandoc")
+        return 1
+    print("[PASS] golden files match" + ("" if args.pandoc else "; pandoc parity skipped"))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
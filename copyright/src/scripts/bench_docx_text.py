@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from doccollate_copyright.infra.docx_text import docx_text
+
+_METHODS = ("python-docx", "docx-text")
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="bench-docx-text")
+    parser.add_argument("files", nargs="*", help="DOCX specs (default: synthetic image-heavy specs)")
+    parser.add_argument("--sections", type=int, default=200, help="Sections per synthetic spec")
+    parser.add_argument("--images", type=int, nargs="+", default=[0, 50, 200], help="Embedded images per synthetic spec")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed reads per method; the best is reported")
+    parser.add_argument("--run", nargs=2, metavar=("METHOD", "FILE"), help=argparse.SUPPRESS)
+    return parser
+
+
+def _peak_mb() -> float:
+    # ru_maxrss survives exec on Linux (children inherit the parent's peak); VmHWM does not.
+    try:
+        for line in Path("/proc/self/status").read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024.0
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+
+def _python_docx_text(path: Path) -> str:
+    # The fallback docx_text replaced: paragraphs, then table rows.
+    from docx import Document
+
+    doc = Document(str(path))
+    parts = [p.text.strip() for p in doc.paragraphs if p.text.strip()]
+    for table in doc.tables:
+        for row in table.rows:
+            cells = [" ".join(p.text.strip() for p in cell.paragraphs if p.text.strip()) for cell in row.cells]
+            if any(cells):
+                parts.append(" | ".join(cell for cell in cells if cell))
+    return "\n".join(parts)
+
+
+def _run_one(method: str, path: Path, repeat: int) -> dict:
+    # Imports happen before the baseline so only the read itself is measured.
+    import docx  # noqa: F401
+
+    read = _python_docx_text if method == "python-docx" else docx_text
+    base = _peak_mb()
+    best = float("inf")
+    chars = 0
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        chars = len(read(path))
+        best = min(best, time.perf_counter() - start)
+    return {"ms": best * 1000.0, "peak_mb": _peak_mb() - base, "chars": chars}
+
+
+def _media_mb(path: Path) -> float:
+    with zipfile.ZipFile(path) as zf:
+        return sum(i.file_size for i in zf.infolist() if i.filename.startswith("word/media/")) / 1e6
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    if args.run:
+        print(json.dumps(_run_one(args.run[0], Path(args.run[1]), args.repeat)))
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        files = [Path(f).expanduser() for f in args.files]
+        if not files:
+            from bench_docx_markdown import _synthetic_spec
+
+            for images in args.images:
+                path = Path(tmp) / f"spec_{images}_images.docx"
+                _synthetic_spec(path, args.sections, images)
+                files.append(path)
+
+        print(f"{'file':<24} {'MB':>7} {'media MB':>9} {'method':<12} {'ms':>9} {'peak MB':>9} {'chars':>8}")
+        for path in files:
+            for method in _METHODS:
+                out = subprocess.run(
+                    [sys.executable, __file__, "--repeat", str(args.repeat), "--run", method, str(path)],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                )
+                row = json.loads(out.stdout.strip().splitlines()[-1])
+                print(
+                    f"{path.name[:24]:<24} {path.stat().st_size / 1e6:>7.1f} {_media_mb(path):>9.1f} {method:<12} "
+                    f"{row['ms']:>9.1f} {row['peak_mb']:>9.1f} {row['chars']:>8}"
+                )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
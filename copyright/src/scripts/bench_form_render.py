@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+# infra/docx_form.py is identical in the registration and environment packages.
+REPO = ROOT.parents[1]
+
+from doccollate_copyright.core.renderer import build_copyright_replacements
+from doccollate_copyright.infra.docx_form import build_placeholder_index, render_form
+from doccollate_copyright.infra.template_cache import load_docx_template
+
+_W_P = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}p"
+
+_TEMPLATES = {
+    "copyright": REPO / "copyright/src/doccollate_copyright/resources/software_copyright_application_form.docx",
+    "registration": REPO / "registration/src/registration_form/resources/test_registration_form.docx",
+    "environment": REPO / "environment/src/environment_form/resources/non_embedded_environment.docx",
+}
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="bench-form-render")
+    parser.add_argument("--rounds", type=int, default=20, help="Documents rendered per template and mode")
+    parser.add_argument("--legacy-rounds", type=int, default=3, help="Rounds for the slow legacy loop")
+    return parser
+
+
+def _legacy_replace(doc, replacements: dict[str, str]) -> None:
+    # The per-key `paragraph.text` loop the three renderers used before the shared engine
+    # (with a real soft break; registration/environment searched for a literal backslash-v).
+    def replace_in_paragraph(p):
+        while "{{" in p.text:
+            old = p.text
+            for k, v in replacements.items():
+                p.text = p.text.replace(k, v)
+                p.text = p.text.replace(k.replace("}}", "}}\v"), v)
+            if old == p.text:
+                break
+
+    for para in doc.paragraphs:
+        replace_in_paragraph(para)
+    for table in doc.tables:
+        for row in table.rows:
+            for cell in row.cells:
+                for para in cell.paragraphs:
+                    replace_in_paragraph(para)
+
+
+def _replacements(name: str, doc) -> dict[str, str]:
+    if name == "copyright":
+        profile = {"copyright_holders": [{"name": "示例科技有限公司", "category": "企业法人", "city": "北京"}]}
+        data = {"app__name": "智慧园区管理平台", "app__version": "V1.0", "copyright__completion_date": "2024-05-01"}
+        return build_copyright_replacements(profile, data)
+    keys = build_placeholder_index(doc).all_keys
+    return {key: f"值{idx}" for idx, key in enumerate(sorted(keys))}
+
+
+def _texts(doc) -> list[str]:
+    from docx.text.paragraph import Paragraph
+
+    return [Paragraph(p, doc._body).text for p in doc.element.body.iter(_W_P)]
+
+
+def _time_ms(fn, rounds: int) -> float:
+    samples: list[float] = []
+    for _ in range(max(1, rounds)):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return min(samples)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    logging.disable(logging.WARNING)
+    print(f"{'template':<14} {'paras':>6} {'keys':>5} {'legacy ms':>10} {'one-pass':>9} {'indexed':>8}  same text")
+    ok = True
+    for name, path in _TEMPLATES.items():
+        doc, raw = load_docx_template(path)
+        index = build_placeholder_index(doc)
+        replacements = _replacements(name, doc)
+        paragraphs = sum(1 for _ in doc.element.body.iter(_W_P))
+
+        def run(mode: str):
+            job, _ = load_docx_template(path)
+            if mode == "legacy":
+                _legacy_replace(job, replacements)
+            else:
+                render_form(job, replacements, index if mode == "indexed" else None)
+            return job
+
+        legacy = _time_ms(lambda: run("legacy"), args.legacy_rounds)
+        one_pass = _time_ms(lambda: run("one-pass"), args.rounds)
+        indexed = _time_ms(lambda: run("indexed"), args.rounds)
+        same = _texts(run("legacy")) == _texts(run("indexed"))
+        ok = ok and same
+        print(
+            f"{name:<14} {paragraphs:>6} {len(replacements):>5} {legacy:>10.1f} {one_pass:>9.1f} {indexed:>8.1f}  {same}"
+        )
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from doccollate_copyright.infra.retrieval import spec_focus
+from doccollate_copyright.infra.spec_budget import fit_to_budget, split_sections
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="bench-spec-budget")
+    parser.add_argument("files", nargs="*", help="Spec text/Markdown files (default: synthetic specs)")
+    parser.add_argument("--max-chars", type=int, default=40000)
+    parser.add_argument("--filler", type=int, default=60, help="Filler chapters before the environment chapter")
+    return parser
+
+
+def _synthetic(markdown: bool, filler: int) -> str:
+    def h(level: int, number: str, title: str) -> str:
+        return f"{'#' * level} {number} {title}" if markdown else f"{number} {title}"
+
+    lines = ["智慧园区综合管理平台软件说明书", "本软件面向园区运营方，提供统一的资产、能耗与安防管理。"]
+    lines += [h(1, "1", "概述"), "平台采用微服务架构，支持多园区统一接入。" * 5]
+    for idx in range(filler):
+        lines.append(h(1, str(idx + 2), f"操作手册第{idx + 1}部分"))
+        for sub in range(4):
+            lines.append(h(2, f"{idx + 2}.{sub + 1}", f"界面说明{sub + 1}"))
+            lines.append("点击页面右上角按钮后，在弹出的窗口中填写表单并保存记录。" * 8)
+    last = filler + 2
+    lines += [h(1, str(last), "运行环境"), h(2, f"{last}.1", "硬件环境")]
+    lines.append("服务器端：CPU 8核，内存 32GB，存储 1TB SSD；客户端：CPU 4核，内存 8GB。")
+    lines += [h(2, f"{last}.2", "软件环境"), "操作系统：CentOS 7.9 / Windows 10；数据库：MySQL 8.0；中间件：Nginx 1.24。"]
+    lines += [h(1, str(last + 1), "技术特点"), "基于 Spring Cloud 与 Vue3 开发，开发语言为 Java 与 TypeScript。"]
+    return "\n".join(lines) + "\n"
+
+
+def _report(name: str, text: str, max_chars: int) -> int:
+    probes = ["CentOS 7.9", "MySQL 8.0", "Spring Cloud", "CPU 8核"]
+    head = text[:max_chars]
+    start = time.perf_counter()
+    budgeted = fit_to_budget(text, max_chars, spec_focus())
+    ms = (time.perf_counter() - start) * 1000.0
+    sections = split_sections(text)
+    kept = sum(1 for s in split_sections(budgeted) if s.title)
+    head_hits = sum(p in head for p in probes)
+    budget_hits = sum(p in budgeted for p in probes)
+    print(
+        f"{name:<24} chars={len(text):>8} sections={len(sections):>4} "
+        f"head: {len(head):>6} chars {head_hits}/{len(probes)} probes | "
+        f"budgeted: {len(budgeted):>6} chars {budget_hits}/{len(probes)} probes, {kept} headings, {ms:.1f} ms"
+    )
+    if len(budgeted) > max_chars:
+        print(f"[FAIL] {name}: budget exceeded")
+        return 1
+    if len(text) > max_chars and budget_hits < len(probes) and not sys.argv[1:]:
+        print(f"[FAIL] {name}: late environment/technology chapters dropped")
+        return 1
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    failures = 0
+    if args.files:
+        for path in args.files:
+            failures += _report(Path(path).name, Path(path).read_text(encoding="utf-8"), args.max_chars)
+    else:
+        failures += _report("synthetic.md", _synthetic(True, args.filler), args.max_chars)
+        failures += _report("synthetic.txt", _synthetic(False, args.filler), args.max_chars)
+    if failures:
+        return 1
+    print("[PASS]")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
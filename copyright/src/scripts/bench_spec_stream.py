@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from doccollate_copyright.infra.spec_stream import iter_paragraphs
+
+_METHODS = ("python-docx", "stream", "stream-budget")
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="bench-spec-stream")
+    parser.add_argument("files", nargs="*", help="Spec files (default: a synthetic image-heavy DOCX)")
+    parser.add_argument("--sections", type=int, default=300, help="Sections in the synthetic spec")
+    parser.add_argument("--images", type=int, default=300, help="Embedded images in the synthetic spec")
+    parser.add_argument("--max-chars", type=int, default=40000)
+    parser.add_argument("--run", nargs=2, metavar=("METHOD", "FILE"), help=argparse.SUPPRESS)
+    return parser
+
+
+def _peak_mb() -> float:
+    # ru_maxrss survives exec on Linux (children inherit the parent's peak); VmHWM does not.
+    try:
+        for line in Path("/proc/self/status").read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024.0
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+
+def _run_one(method: str, path: Path, max_chars: int) -> dict:
+    # Imports happen before the baseline so only the read itself is measured.
+    from docx import Document
+
+    base = _peak_mb()
+    start = time.perf_counter()
+    if method == "python-docx":
+        doc = Document(str(path))
+        chars = len("\n".join(p.text for p in doc.paragraphs if p.text.strip()))
+    elif method == "stream":
+        chars = len("\n".join(iter_paragraphs(path)))
+    else:
+        chars = len("\n".join(iter_paragraphs(path, max_chars)))
+    return {"ms": (time.perf_counter() - start) * 1000.0, "peak_mb": _peak_mb() - base, "chars": chars}
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    if args.run:
+        print(json.dumps(_run_one(args.run[0], Path(args.run[1]), args.max_chars)))
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        files = [Path(f).expanduser() for f in args.files]
+        if not files:
+            from bench_docx_markdown import _synthetic_spec
+
+            synthetic = Path(tmp) / "image_heavy_spec.docx"
+            _synthetic_spec(synthetic, args.sections, args.images)
+            files.append(synthetic)
+
+        print(f"{'file':<28} {'MB':>7} {'method':<14} {'ms':>9} {'peak MB':>9} {'chars':>9}")
+        for path in files:
+            if path.suffix.lower() != ".docx":
+                methods = [m for m in _METHODS if m != "python-docx"]
+            else:
+                methods = list(_METHODS)
+            for method in methods:
+                out = subprocess.run(
+                    [sys.executable, __file__, "--max-chars", str(args.max_chars), "--run", method, str(path)],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                )
+                row = json.loads(out.stdout.strip().splitlines()[-1])
+                print(
+                    f"{path.name[:28]:<28} {path.stat().st_size / 1e6:>7.1f} {method:<14} "
+                    f"{row['ms']:>9.1f} {row['peak_mb']:>9.1f} {row['chars']:>9}"
+                )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import re
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from doccollate_copyright.infra.docx_markdown import docx_to_markdown
+
+_SRC = Path(__file__).resolve().parents[1] / "src"
+_REPO = _SRC.parents[1]
+_GOLDEN_DIR = _SRC / "scripts" / "baselines" / "docx_markdown"
+_BUNDLED = [
+    _SRC / "doccollate_copyright" / "resources" / "software_copyright_application_form.docx",
+    _REPO / "registration" / "src" / "registration_form" / "resources" / "test_registration_form.docx",
+    _REPO / "environment" / "src" / "environment_form" / "resources" / "non_embedded_environment.docx",
+    _REPO / "function" / "src" / "function_form" / "resources" / "test_function_form.docx",
+    _REPO / "proposal" / "assets" / "proposal_template.docx",
+]
+_PANDOC = shutil.which("pandoc")
+
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.*?)\s*$")
+_LIST_RE = re.compile(r"^(\s*)([-*+]|\d+[.)])\s+(.*?)\s*$")
+_TABLE_RULE_RE = re.compile(r"[|\-: ]+")
+_CELL_SPLIT_RE = re.compile(r"(?<!\\)\|")
+
+_STRUCTURE_MARKDOWN = """# 1 总体说明
+
+正文段落，包含 \\*星号\\* 与 \\[方括号\\] 以及 a_b_c。
+
+## 1.1 功能清单
+
+- 数据采集
+- 监测分析
+
+1. 提交申请
+2. 等待审核
+
+| 字段 | 说明 |
+|---|---|
+| a\\|b | 第一行 |
+| c | 第二行 |
+
+# 2 附录
+"""
+
+
+def _structure(markdown: str) -> list[tuple]:
+    """Headings, list items and pipe-table rows, independent of spacing and column padding."""
+    out: list[tuple] = []
+    for line in markdown.splitlines():
+        if m := _HEADING_RE.match(line):
+            out.append(("heading", len(m.group(1)), m.group(2)))
+        elif m := _LIST_RE.match(line):
+            out.append(("item", len(m.group(1).expandtabs()), m.group(2)[0].isdigit(), m.group(3)))
+        elif line.startswith("|") and not _TABLE_RULE_RE.fullmatch(line):
+            out.append(("row", tuple(cell.strip() for cell in _CELL_SPLIT_RE.split(line.strip())[1:-1])))
+    return out
+
+
+def _pandoc_gfm(path: Path) -> str:
+    return subprocess.run([_PANDOC, str(path), "-t", "gfm"], capture_output=True, text=True, check=True).stdout
+
+
+@pytest.fixture
+def structure_docx(tmp_path: Path) -> Path:
+    from docx import Document
+
+    doc = Document()
+    doc.add_heading("1 总体说明", 1)
+    doc.add_paragraph("正文段落，包含 *星号* 与 [方括号] 以及 a_b_c。")
+    doc.add_heading("1.1 功能清单", 2)
+    for text in ("数据采集", "监测分析"):
+        doc.add_paragraph(text, style="List Bullet")
+    for text in ("提交申请", "等待审核"):
+        doc.add_paragraph(text, style="List Number")
+    table = doc.add_table(rows=3, cols=2)
+    for row, values in zip(table.rows, (("字段", "说明"), ("a|b", "第一行"), ("c", "第二行"))):
+        for cell, value in zip(row.cells, values):
+            cell.text = value
+    doc.add_heading("2 附录", 1)
+    path = tmp_path / "structure.docx"
+    doc.save(str(path))
+    return path
+
+
+@pytest.mark.parametrize("path", _BUNDLED, ids=lambda p: p.stem)
+def test_bundled_templates_match_golden(path: Path) -> None:
+    golden = (_GOLDEN_DIR / f"{path.stem}.md").read_text(encoding="utf-8")
+    assert docx_to_markdown(path) == golden
+
+
+def test_headings_lists_and_tables(structure_docx: Path) -> None:
+    assert docx_to_markdown(structure_docx) == _STRUCTURE_MARKDOWN
+
+
+@pytest.mark.skipif(_PANDOC is None, reason="pandoc is not installed")
+@pytest.mark.parametrize("path", _BUNDLED, ids=lambda p: p.stem)
+def test_golden_structure_matches_pandoc(path: Path) -> None:
+    golden = _structure((_GOLDEN_DIR / f"{path.stem}.md").read_text(encoding="utf-8"))
+    reference_md = _pandoc_gfm(path)
+    reference = _structure(reference_md)
+    if "<table" in reference_md:
+        # pandoc falls back to HTML for tables with merged cells; we keep a pipe grid.
+        golden = [item for item in golden if item[0] != "row"]
+    assert golden == reference
+
+
+@pytest.mark.skipif(_PANDOC is None, reason="pandoc is not installed")
+def test_structure_matches_pandoc(structure_docx: Path) -> None:
+    assert _structure(docx_to_markdown(structure_docx)) == _structure(_pandoc_gfm(structure_docx))
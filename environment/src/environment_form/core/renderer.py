@@ -3,33 +3,16 @@ from __future__ import annotations
 import logging
 from pathlib import Path
 
-from docx import Document
+from ..infra.docx_form import placeholder_index, render_form
+from ..infra.docx_package import save_docx
+from ..infra.template_cache import load_docx_template
 
 logger = logging.getLogger(__name__)
 
 
-def _replace(doc: Document, replacements: dict[str, str]) -> None:
-    def replace_in_paragraph(p):
-        while "{{" in p.text:
-            old = p.text
-            for k, v in replacements.items():
-                p.text = p.text.replace(k, v)
-                p.text = p.text.replace(k.replace("}}", "}}\\v"), v)
-            if old == p.text:
-                break
-
-    for para in doc.paragraphs:
-        replace_in_paragraph(para)
-    for table in doc.tables:
-        for row in table.rows:
-            for cell in row.cells:
-                for para in cell.paragraphs:
-                    replace_in_paragraph(para)
-
-
 def generate_document(template_path: Path, output_path: Path, data: dict[str, str]) -> None:
     try:
-        doc = Document(template_path)
+        doc, raw = load_docx_template(template_path)
     except Exception as exc:
         logger.error("Unable to open template '%s': %s", template_path, exc)
         raise
@@ -46,6 +29,6 @@ def generate_document(template_path: Path, output_path: Path, data: dict[str, st
         "{{env__client_config}}": data.get("env__client_config", ""),
         "{{env__client_id}}": data.get("env__client_id", ""),
     }
-    _replace(doc, replacements)
+    render_form(doc, replacements, placeholder_index(template_path))
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    doc.save(output_path)
+    save_docx(doc, output_path, raw)
@@ -8,10 +8,11 @@ from pathlib import Path
 from .config import AppConfig, load_config
 from .models import EnvironmentInputSchema, EnvironmentOutputSchema
 from .renderer import generate_document
-from ..infra.app_type_llm import infer_app_type_via_llm
+from ..infra.app_type_llm import APP_TYPE_FOCUS, infer_app_type_via_llm
 from ..infra.fs import read_text_content
 from ..infra.path_utils import normalize_path
 from ..infra.profile_pool import get_default_profile, select_profile
+from ..infra.spec_fingerprint import fingerprint_text, inputs_digest, record_run, reusable_output
 from ..utils.format import build_filename
 
 logger = logging.getLogger(__name__)
@@ -47,7 +48,17 @@ def run_from_args(args) -> int:
     source_text = (model.source_text or "").strip()
     if not source_text and model.spec_path:
         logger.info("Reading source text from spec_path: %s", model.spec_path)
-        source_text = read_text_content(normalize_path(model.spec_path))
+        source_text = read_text_content(normalize_path(model.spec_path), focus=APP_TYPE_FOCUS)
+
+    out_dir = normalize_path(model.resolved_output_dir())
+    spec_fp = fingerprint_text(source_text)
+    inputs = inputs_digest(payload, cfg.config_path, cfg.templates.environment, cfg.llm.model)
+    run_key = str(normalize_path(args.input_json))
+    if getattr(args, "reuse", False):
+        previous = reusable_output(out_dir, "environment", run_key, inputs, spec_fp)
+        if previous:
+            logger.info("[output] spec and inputs unchanged, reusing %s", previous)
+            return 0
 
     guessed_name = ""
     guessed_version = "V1.0"
@@ -100,12 +111,12 @@ def run_from_args(args) -> int:
         logger.error("Missing environment template path")
         return 2
 
-    out_dir = normalize_path(model.resolved_output_dir())
     out_dir.mkdir(parents=True, exist_ok=True)
     out_path = out_dir / build_filename("非嵌入式软件环境", app_name, app_version)
 
     logger.info("Rendering non-embedded environment form")
     generate_document(template, out_path, output_model.model_dump())
+    record_run(out_dir, "environment", run_key, inputs, spec_fp, out_path)
     logger.info("[output] generated_file=%s", out_path)
     logger.info("[output] output_dir=%s", out_dir)
     return 0
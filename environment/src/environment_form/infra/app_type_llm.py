@@ -6,13 +6,39 @@ from urllib import error, request
 
 from ..core.config import LLMConfig
 from .profile_pool import allowed_app_types, normalize_app_type
+from .spec_budget import fit_to_budget
 
 logger = logging.getLogger(__name__)
 
+PROMPT_CHARS = 12000
+# Spec sections that tell the deployment form apart; they get the prompt budget first.
+APP_TYPE_FOCUS = (
+    "概述",
+    "简介",
+    "架构",
+    "部署",
+    "运行环境",
+    "硬件",
+    "操作系统",
+    "客户端",
+    "服务端",
+    "服务器",
+    "浏览器",
+    "web",
+    "app",
+    "移动",
+    "小程序",
+    "嵌入式",
+    "终端",
+    "设备",
+)
+
+
 def _build_prompt(source_text: str) -> str:
     app_types = allowed_app_types()
+    spec = fit_to_budget(source_text, PROMPT_CHARS, APP_TYPE_FOCUS + tuple(app_types))
     if not app_types:
-        return source_text[:12000]
+        return spec
     allowed = "、".join(app_types)
     return (
         "你是软件系统类型判定助手。"
@@ -21,7 +47,7 @@ def _build_prompt(source_text: str) -> str:
         "输出格式: {\"app_type\":\"...\",\"reason\":\"...\"}。"
         f"app_type 只能是：{allowed}。\n\n"
         "说明书内容：\n"
-        f"{source_text[:12000]}"
+        f"{spec}"
     )
 
 
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import logging
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+from .template_cache import template_derived
+
+logger = logging.getLogger(__name__)
+
+# Word soft line breaks can reach the text as a vertical tab; a placeholder
+# followed by one is replaced together with the break.
+SOFT_BREAK = "\v"
+
+_W_P = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}p"
+_W_T = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}t"
+_KEY_RE = re.compile(r"\{\{.*?\}\}")
+
+
+def _safe_str(value: object) -> str:
+    if value is None:
+        return ""
+    return str(value)
+
+
+class ReplacementPlan:
+    """
+    Replacement map compiled once into a single longest-first alternation,
+    so each paragraph is scanned once and replaced values are not re-scanned.
+    """
+
+    def __init__(self, replacements: dict) -> None:
+        self.values = {str(k): _safe_str(v) for k, v in replacements.items() if k}
+        keys = sorted(self.values, key=len, reverse=True)
+        self.pattern = re.compile("(" + "|".join(re.escape(k) for k in keys) + f"){SOFT_BREAK}?") if keys else None
+
+    def apply(self, text: str) -> str:
+        if self.pattern is None or "{{" not in text:
+            return text
+        values = self.values
+        return self.pattern.sub(lambda m: values[m.group(1)], text)
+
+
+@dataclass(frozen=True)
+class PlaceholderIndex:
+    """
+    Template paragraphs that contain placeholders, each as its path of child
+    positions from the body element, and the keys each one holds.
+    """
+
+    paths: tuple[tuple[int, ...], ...]
+    keys: tuple[frozenset[str], ...]
+
+    @property
+    def all_keys(self) -> frozenset[str]:
+        return frozenset().union(*self.keys) if self.keys else frozenset()
+
+
+def build_placeholder_index(doc) -> PlaceholderIndex:
+    body = doc.element.body
+    paths: list[tuple[int, ...]] = []
+    keys: list[frozenset[str]] = []
+    for p in body.iter(_W_P):
+        text = "".join(t.text or "" for t in p.iter(_W_T))
+        if "{{" not in text:
+            continue
+        path: list[int] = []
+        el = p
+        while el is not body:
+            parent = el.getparent()
+            path.append(parent.index(el))
+            el = parent
+        paths.append(tuple(reversed(path)))
+        keys.append(frozenset(_KEY_RE.findall(text)))
+    return PlaceholderIndex(paths=tuple(paths), keys=tuple(keys))
+
+
+def placeholder_index(template_path: str | Path) -> PlaceholderIndex:
+    """
+    Index for a DOCX template, built on first use and kept with the template's
+    cache entry, so it is rebuilt only when the template content changes.
+    """
+    return template_derived(template_path, "placeholder_index", build_placeholder_index)
+
+
+def _indexed_paragraphs(body, index: PlaceholderIndex) -> list | None:
+    targets = []
+    for path in index.paths:
+        el = body
+        try:
+            for pos in path:
+                el = el[pos]
+        except IndexError:
+            return None
+        if el.tag != _W_P:
+            return None
+        targets.append(el)
+    return targets
+
+
+def replace_in_paragraph(paragraph, replacements: dict | ReplacementPlan) -> bool:
+    """
+    Replace placeholders in one paragraph in a single pass.
+
+    When every placeholder sits inside one run only those runs are rewritten,
+    keeping their formatting; placeholders split across runs are joined into
+    the first run. Returns True if the paragraph changed.
+    """
+    plan = replacements if isinstance(replacements, ReplacementPlan) else ReplacementPlan(replacements)
+    text = paragraph.text
+    if "{{" not in text:
+        return False
+
+    replaced = plan.apply(text)
+    if replaced != text:
+        runs = paragraph.runs
+        run_texts = [run.text for run in runs]
+        if not runs or "".join(run_texts) != text:
+            # Hyperlinks or other non-run content: rewrite the whole paragraph.
+            paragraph.text = replaced
+        else:
+            new_texts = [plan.apply(t) for t in run_texts]
+            if "".join(new_texts) == replaced:
+                for run, old, new in zip(runs, run_texts, new_texts):
+                    if new != old:
+                        run.text = new
+            else:
+                runs[0].text = replaced
+                for run in runs[1:]:
+                    run.text = ""
+
+    if "{{" in replaced and logger.isEnabledFor(logging.WARNING):
+        logger.warning("Unmatched placeholder left in paragraph: %s", repr(replaced[:90]))
+    return replaced != text
+
+
+def render_form(doc, replacements: dict | ReplacementPlan, index: PlaceholderIndex | None = None) -> int:
+    """
+    Fill placeholders in every paragraph of the document body, table cells
+    included. With an index only the indexed paragraphs are visited, so the
+    cost follows the number of placeholders rather than the document size;
+    `doc` must then be an unmodified copy of the indexed template.
+    Returns the number of paragraphs changed.
+    """
+    from docx.text.paragraph import Paragraph
+
+    plan = replacements if isinstance(replacements, ReplacementPlan) else ReplacementPlan(replacements)
+    body = doc.element.body
+    targets = _indexed_paragraphs(body, index) if index is not None else None
+    if targets is None:
+        if index is not None:
+            logger.debug("Placeholder index does not match the document; scanning every paragraph")
+        targets = [p for p in body.iter(_W_P) if "{{" in "".join(t.text or "" for t in p.iter(_W_T))]
+    elif logger.isEnabledFor(logging.DEBUG):
+        missing = index.all_keys - plan.values.keys()
+        if missing:
+            logger.debug("Template placeholders without values: %s", sorted(missing))
+
+    changed = 0
+    parent = doc._body
+    for p in targets:
+        if replace_in_paragraph(Paragraph(p, parent), plan):
+            changed += 1
+    return changed
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Sequence
+
+# Markdown headings, and the numbered heading styles plain-text specs use.
+_MD_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+?)\s*#*$")
+_NUM_HEADING_RE = re.compile(r"^(\d{1,2}(?:\.\d{1,2}){0,4})(?:[.、．]\s*|\s+)(\S.{0,40})$")
+_CHAPTER_RE = re.compile(r"^第[一二三四五六七八九十百零\d]+[章节篇部分]+\s*(.{0,40})$")
+_CN_ITEM_RE = re.compile(r"^[一二三四五六七八九十]+[、.．]\s*(\S.{0,40})$")
+_SENTENCE_END = ("。", "；", ";", "，", ",", "：", ":")
+
+# Minimum body characters kept per section so the outline stays readable.
+_FLOOR = 160
+# Text before the first heading usually names and introduces the product.
+_PREAMBLE_BONUS = 2.0
+
+
+@dataclass(frozen=True)
+class Section:
+    level: int
+    title: str
+    start: int
+    body_start: int
+    end: int
+    # Titles from the top-level ancestor down to this section.
+    path: tuple[str, ...]
+
+
+def _heading(line: str) -> tuple[int, str] | None:
+    if not line or len(line) > 60:
+        return None
+    m = _MD_HEADING_RE.match(line)
+    if m:
+        return len(m.group(1)), m.group(2)
+    if line.endswith(_SENTENCE_END):
+        return None
+    m = _NUM_HEADING_RE.match(line)
+    if m:
+        return m.group(1).count(".") + 1, m.group(2)
+    m = _CHAPTER_RE.match(line)
+    if m:
+        return 1, line
+    m = _CN_ITEM_RE.match(line)
+    if m:
+        return 1, m.group(1)
+    return None
+
+
+def split_sections(text: str) -> list[Section]:
+    """
+    Split `text` into contiguous sections at Markdown or numbered headings.
+    Text before the first heading becomes a level-0 section.
+    """
+    heads: list[tuple[int, int, int, str]] = []
+    offset = 0
+    for line in text.splitlines(keepends=True):
+        parsed = _heading(line.strip())
+        if parsed:
+            heads.append((offset, offset + len(line), *parsed))
+        offset += len(line)
+
+    sections: list[Section] = []
+    if not heads or heads[0][0] > 0:
+        sections.append(Section(0, "", 0, 0, heads[0][0] if heads else len(text), ()))
+    stack: list[tuple[int, str]] = []
+    for idx, (start, body_start, level, title) in enumerate(heads):
+        end = heads[idx + 1][0] if idx + 1 < len(heads) else len(text)
+        while stack and stack[-1][0] >= level:
+            stack.pop()
+        stack.append((level, title))
+        sections.append(Section(level, title, start, body_start, end, tuple(t for _, t in stack)))
+    return sections
+
+
+def _score(section: Section, lowered: str, keywords: list[str]) -> float:
+    title = section.title.lower()
+    parents = " ".join(section.path[:-1]).lower()
+    body = lowered[section.body_start : section.end]
+    title_hits = sum(1 for kw in keywords if kw in title)
+    parent_hits = sum(1 for kw in keywords if kw in parents)
+    body_hits = sum(body.count(kw) for kw in keywords)
+    score = 4.0 * title_hits + 2.0 * parent_hits + body_hits * 1000.0 / max(len(body), 200)
+    if section.level == 0:
+        score += _PREAMBLE_BONUS
+    return score
+
+
+def _trim(chunk: str, heading_len: int) -> str:
+    # Cut at a line break so the next section's heading starts on its own line.
+    cut = chunk.rfind("\n", heading_len)
+    if cut >= max(heading_len, len(chunk) // 2):
+        return chunk[: cut + 1]
+    return chunk[:-1] + "\n" if chunk else chunk
+
+
+def fit_to_budget(text: str, max_chars: int, focus: Sequence[str] = ()) -> str:
+    """
+    Shrink `text` to at most `max_chars` characters, keeping its section structure.
+
+    Every section keeps its heading and the start of its body; the remaining
+    budget goes to whole sections ranked by how well their title, parent
+    headings and body match the `focus` keywords. Sections are emitted in
+    document order. Without headings or focus this is a plain head cut.
+    """
+    if len(text) <= max_chars:
+        return text
+    keywords = [kw.lower() for kw in focus if kw]
+    sections = split_sections(text)
+    heads_len = sum(s.body_start - s.start for s in sections)
+    if not keywords or len(sections) < 2 or heads_len >= max_chars // 2:
+        return text[:max_chars]
+
+    floor = min(_FLOOR, (max_chars - heads_len) // (2 * len(sections)))
+    alloc = [min(s.end - s.start, s.body_start - s.start + floor) for s in sections]
+    remaining = max_chars - sum(alloc)
+    lowered = text.lower()
+    scores = [_score(s, lowered, keywords) for s in sections]
+    for idx in sorted(range(len(sections)), key=lambda i: (-scores[i], i)):
+        if remaining <= 0:
+            break
+        extra = min(sections[idx].end - sections[idx].start - alloc[idx], remaining)
+        alloc[idx] += extra
+        remaining -= extra
+
+    parts: list[str] = []
+    for section, size in zip(sections, alloc):
+        chunk = text[section.start : section.start + size]
+        if size < section.end - section.start:
+            chunk = _trim(chunk, section.body_start - section.start)
+        parts.append(chunk)
+    return "".join(parts)
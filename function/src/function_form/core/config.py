@@ -25,11 +25,17 @@ class TemplateConfig:
     function: Path | None
 
 
+@dataclass(frozen=True)
+class RenderConfig:
+    merge_level1: bool = False
+
+
 @dataclass(frozen=True)
 class AppConfig:
     llm: LLMConfig
     templates: TemplateConfig
     config_path: Path
+    render: RenderConfig = RenderConfig()
 
 
 def _resolve_path(value: str, base_dir: Path) -> Path | None:
@@ -76,8 +82,13 @@ def load_config(path: str) -> AppConfig:
         base_dir,
     )
 
+    render = data.get("render", {})
+    merge_raw = _read_env("DOCCOLLATE_FUNCTION_MERGE_LEVEL1") or str(render.get("merge_level1", "")).strip()
+    render_config = RenderConfig(merge_level1=merge_raw.lower() in {"1", "true", "yes", "on"})
+
     return AppConfig(
         llm=llm_config,
         templates=TemplateConfig(function=function_template),
         config_path=config_path,
+        render=render_config,
     )
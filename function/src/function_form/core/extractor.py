@@ -2,11 +2,11 @@ from __future__ import annotations
 
 import re
 
+from ..infra.spec_document import IMAGE, SpecDocument, as_document
 from .models import FunctionItem
 
-MODULE_HEADING_RE = re.compile(r"^###\s*\d+\.\d+\.\d+\s*模块[:：]\s*(.+?)\s*$")
-SUBSECTION_RE = re.compile(r"^###\s*\d+\.\d+\.\d+")
-HEADING_RE = re.compile(r"^#{1,6}\s+")
+MODULE_TITLE_RE = re.compile(r"^\d+\.\d+\.\d+\s*模块[:：]\s*(.+?)\s*$")
+SUBSECTION_RE = re.compile(r"^\d+\.\d+\.\d+")
 
 
 def _clean_line(line: str) -> str:
@@ -25,31 +25,30 @@ def _build_desc(name: str) -> str:
     return f"可以进行{core}相关管理"
 
 
-def _extract_module_blocks(lines: list[str]) -> list[tuple[str, list[str]]]:
+def _is_subsection(doc: SpecDocument, idx: int) -> bool:
+    section = doc.sections[idx]
+    return section.level == 3 and bool(SUBSECTION_RE.match(section.title))
+
+
+def _extract_module_blocks(doc: SpecDocument) -> list[tuple[str, list[str]]]:
     blocks: list[tuple[str, list[str]]] = []
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        m = MODULE_HEADING_RE.match(line)
+    for idx, section in enumerate(doc.sections):
+        if section.level != 3:
+            continue
+        m = MODULE_TITLE_RE.match(_clean_line(section.title))
         if not m:
-            i += 1
             continue
         name = _normalize_name(m.group(1))
-        i += 1
         body: list[str] = []
-        while i < len(lines):
-            cur = lines[i]
-            if SUBSECTION_RE.match(cur):
-                break
-            if HEADING_RE.match(cur):
-                i += 1
-                continue
-            if cur.startswith("!["):
-                i += 1
-                continue
-            if cur:
-                body.append(cur)
-            i += 1
+        # A module runs until the next numbered level-3 heading; deeper headings belong to it.
+        nxt = idx + 1
+        lines = list(doc.body(idx))
+        while nxt < len(doc.sections) and not _is_subsection(doc, nxt):
+            lines.extend(doc.body(nxt))
+            nxt += 1
+        for line in lines:
+            if doc.kind(line) != IMAGE:
+                body.append(_clean_line(doc.line(line)))
         if name:
             blocks.append((name, body))
     return blocks
@@ -60,10 +59,8 @@ def _summarize_desc(body: list[str], name: str) -> str:
     return f"可以进行{core}管理"
 
 
-def extract_function_list(source_text: str, limit: int = 30) -> list[FunctionItem]:
-    lines = [_clean_line(x) for x in (source_text or "").splitlines() if _clean_line(x)]
-
-    blocks = _extract_module_blocks(lines)
+def extract_function_list(source: str | SpecDocument, limit: int = 30) -> list[FunctionItem]:
+    blocks = _extract_module_blocks(as_document(source))
     if blocks:
         out: list[FunctionItem] = []
         seen: set[str] = set()
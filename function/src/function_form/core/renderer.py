@@ -1,13 +1,27 @@
 from __future__ import annotations
 
+import copy
 import logging
+import re
 from pathlib import Path
 from types import SimpleNamespace
 
-from docx import Document
+from ..infra.docx_package import save_docx
+from ..infra.template_cache import load_docx_template
 
 logger = logging.getLogger(__name__)
 
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_VAL = _W_NS + "val"
+_XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+_W14_NS = "{http://schemas.microsoft.com/office/word/2010/wordml}"
+# Word's per-paragraph/row ids; they must stay unique, so clones drop them.
+_W14_IDS = (_W14_NS + "paraId", _W14_NS + "textId")
+# Characters run.text turns into w:tab / w:br.
+_RUN_SPECIALS_RE = re.compile(r"([\t\r\n])")
+# tcPr children that must precede w:vMerge (schema order).
+_BEFORE_VMERGE = {_W_NS + "cnfStyle", _W_NS + "tcW", _W_NS + "gridSpan", _W_NS + "hMerge"}
+
 
 def _to_rows(module_list: list[dict]) -> list[SimpleNamespace]:
     rows: list[SimpleNamespace] = []
@@ -41,51 +55,141 @@ def _to_rows(module_list: list[dict]) -> list[SimpleNamespace]:
     return rows
 
 
-def _set_cell_text(cell, text: str) -> None:
-    while len(cell.paragraphs) > 1:
-        p = cell.paragraphs[-1]._element
-        p.getparent().remove(p)
-    para = cell.paragraphs[0]
-    for run in list(para.runs):
-        run._element.getparent().remove(run._element)
-    para.text = str(text or "")
-
-
-def _render_rows_table(template_path: Path, output_path: Path, rows: list[SimpleNamespace]) -> None:
-    doc = Document(template_path)
+def _make_element(tag: str):
+    from docx.oxml import OxmlElement
+
+    return OxmlElement(tag)
+
+
+def _prototype_row(tr):
+    """
+    Clean copy of the template data row: each cell keeps its tcPr and first
+    paragraph's pPr, plus one empty run carrying the first run's rPr. w14
+    paraId/textId attributes are dropped so the cloned rows do not repeat them.
+    """
+    proto = copy.deepcopy(tr)
+    for el in proto.iter():
+        for attr in _W14_IDS:
+            el.attrib.pop(attr, None)
+    for tc in proto.iterchildren(_W_NS + "tc"):
+        tc_pr = tc.find(_W_NS + "tcPr")
+        if tc_pr is not None:
+            for vmerge in tc_pr.findall(_W_NS + "vMerge"):
+                tc_pr.remove(vmerge)
+        paragraphs = tc.findall(_W_NS + "p")
+        for child in list(tc):
+            if child is not tc_pr and (not paragraphs or child is not paragraphs[0]):
+                tc.remove(child)
+        p = paragraphs[0] if paragraphs else None
+        if p is None:
+            p = _make_element("w:p")
+            tc.append(p)
+        first_r = p.find(_W_NS + "r")
+        r_pr = first_r.find(_W_NS + "rPr") if first_r is not None else None
+        for child in list(p):
+            if child.tag != _W_NS + "pPr":
+                p.remove(child)
+        r = _make_element("w:r")
+        if r_pr is not None:
+            r.append(r_pr)
+        t = _make_element("w:t")
+        t.set(_XML_SPACE, "preserve")
+        r.append(t)
+        p.append(r)
+    return proto
+
+
+def _write_run_text(r, text: str) -> None:
+    t = r.find(_W_NS + "t")
+    parts = _RUN_SPECIALS_RE.split(text)
+    if len(parts) == 1:
+        t.text = text
+        return
+    # Tabs and line breaks become w:tab / w:br between w:t pieces, like run.text would do.
+    r.remove(t)
+    for idx, part in enumerate(parts):
+        if idx % 2:
+            r.append(_make_element("w:tab" if part == "\t" else "w:br"))
+        elif part:
+            piece = copy.deepcopy(t)
+            piece.text = part
+            r.append(piece)
+
+
+def _set_vmerge(tc, vmerge) -> None:
+    tc_pr = tc.find(_W_NS + "tcPr")
+    if tc_pr is None:
+        tc_pr = _make_element("w:tcPr")
+        tc.insert(0, tc_pr)
+    existing = tc_pr.find(_W_NS + "vMerge")
+    if existing is not None:
+        # The prototype row may already be merged; a tcPr holds at most one vMerge.
+        tc_pr.replace(existing, vmerge)
+        return
+    pos = 0
+    for child in tc_pr:
+        if child.tag not in _BEFORE_VMERGE:
+            break
+        pos += 1
+    tc_pr.insert(pos, vmerge)
+
+
+def _build_rows(proto, rows: list[SimpleNamespace], merge_level1: bool) -> list:
+    restart = _make_element("w:vMerge")
+    restart.set(_W_VAL, "restart")
+    cont = _make_element("w:vMerge")
+    out: list = []
+    prev_level1: str | None = None
+    for row in rows:
+        tr = copy.deepcopy(proto)
+        continued = merge_level1 and row.level1 == prev_level1
+        values = [row.level1, row.level2, row.desc]
+        for idx, tc in enumerate(tr.iterchildren(_W_NS + "tc")):
+            text = str(values[idx] or "") if idx < len(values) else ""
+            if idx == 0 and merge_level1:
+                _set_vmerge(tc, copy.deepcopy(cont if continued else restart))
+                if continued:
+                    text = ""
+            _write_run_text(tc.find(_W_NS + "p").find(_W_NS + "r"), text)
+        prev_level1 = row.level1
+        out.append(tr)
+    return out
+
+
+def _render_rows_table(
+    template_path: Path,
+    output_path: Path,
+    rows: list[SimpleNamespace],
+    merge_level1: bool = False,
+) -> None:
+    doc, raw = load_docx_template(template_path)
     if not doc.tables:
         raise ValueError("Template has no table")
     table = doc.tables[0]
     if len(table.columns) < 3:
         raise ValueError("Template first table must have at least 3 columns")
 
-    # Keep only header and one data prototype row.
-    while len(table.rows) > 2:
-        table._tbl.remove(table.rows[-1]._tr)
-    if len(table.rows) < 2:
+    # Header stays; the first data row becomes the prototype cloned for every output row.
+    tbl = table._tbl
+    trs = tbl.findall(_W_NS + "tr")
+    if len(trs) < 2:
         table.add_row()
-
-    if rows:
-        first = rows[0]
-        _set_cell_text(table.rows[1].cells[0], first.level1)
-        _set_cell_text(table.rows[1].cells[1], first.level2)
-        _set_cell_text(table.rows[1].cells[2], first.desc)
-
-        for r in rows[1:]:
-            row = table.add_row()
-            _set_cell_text(row.cells[0], r.level1)
-            _set_cell_text(row.cells[1], r.level2)
-            _set_cell_text(row.cells[2], r.desc)
-    else:
-        _set_cell_text(table.rows[1].cells[0], "")
-        _set_cell_text(table.rows[1].cells[1], "")
-        _set_cell_text(table.rows[1].cells[2], "")
+        trs = tbl.findall(_W_NS + "tr")
+    proto = _prototype_row(trs[1])
+    for tr in trs[1:]:
+        tbl.remove(tr)
+    tbl.extend(_build_rows(proto, rows or [SimpleNamespace(level1="", level2="", desc="")], merge_level1))
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    doc.save(output_path)
+    save_docx(doc, output_path, raw)
 
 
-def generate_document(template_path: Path, output_path: Path, module_list: list[dict]) -> None:
+def generate_document(
+    template_path: Path,
+    output_path: Path,
+    module_list: list[dict],
+    merge_level1: bool = False,
+) -> None:
     rows = _to_rows(module_list)
-    logger.info("Renderer mode=manual_rows file=%s rows=%s", __file__, len(rows))
-    _render_rows_table(template_path, output_path, rows)
+    logger.info("Renderer mode=manual_rows file=%s rows=%s merge_level1=%s", __file__, len(rows), merge_level1)
+    _render_rows_table(template_path, output_path, rows, merge_level1)
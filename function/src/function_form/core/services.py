@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import logging
 import re
+from dataclasses import asdict
 from pathlib import Path
 
 from .config import AppConfig, load_config
@@ -15,9 +16,11 @@ from .models import (
 )
 from .renderer import generate_document
 from ..infra.function_llm import infer_functions_with_llm
-from ..infra.fs import read_text_content
+from ..infra.fs import read_spec_document
 from ..infra.path_utils import normalize_path
 from ..infra.retrieval import chunk_text, retrieve_function_chunks
+from ..infra.spec_document import SpecDocument
+from ..infra.spec_fingerprint import fingerprint_text, inputs_digest, record_run, reusable_output
 from ..utils.format import build_filename
 
 logger = logging.getLogger(__name__)
@@ -118,9 +121,21 @@ def run_from_args(args) -> int:
     raw_data = dict(model.data or {})
 
     source_text = (model.source_text or "").strip()
+    spec: str | SpecDocument = source_text
     if not source_text and model.spec_path:
         logger.info("Reading source text from spec_path: %s", model.spec_path)
-        source_text = read_text_content(normalize_path(model.spec_path))
+        spec = read_spec_document(normalize_path(model.spec_path))
+        source_text = spec.text
+
+    out_dir = normalize_path(model.resolved_output_dir())
+    spec_fp = fingerprint_text(source_text)
+    inputs = inputs_digest(payload, cfg.config_path, cfg.templates.function, cfg.llm.model, asdict(cfg.render))
+    run_key = str(normalize_path(args.input_json))
+    if getattr(args, "reuse", False):
+        previous = reusable_output(out_dir, "function", run_key, inputs, spec_fp)
+        if previous:
+            logger.info("[output] spec and inputs unchanged, reusing %s", previous)
+            return 0
 
     guessed_name = ""
     guessed_version = "V1.0"
@@ -137,7 +152,7 @@ def run_from_args(args) -> int:
     elif provided_items:
         modules = _group_items_as_modules(provided_items)
     else:
-        chunks = chunk_text(source_text)
+        chunks = chunk_text(spec)
         retrieved = retrieve_function_chunks(chunks, top_k=10)
         logger.info("Chunked spec into %s chunks; retrieved %s chunks for LLM", len(chunks), len(retrieved))
         try:
@@ -162,7 +177,6 @@ def run_from_args(args) -> int:
         logger.error("Missing function template path")
         return 2
 
-    out_dir = normalize_path(model.resolved_output_dir())
     out_dir.mkdir(parents=True, exist_ok=True)
     out_path = out_dir / build_filename("产品测试功能表", output_model.app__name, output_model.app__version)
 
@@ -171,7 +185,9 @@ def run_from_args(args) -> int:
         template,
         out_path,
         [x.model_dump() for x in output_model.module_list],
+        merge_level1=cfg.render.merge_level1,
     )
+    record_run(out_dir, "function", run_key, inputs, spec_fp, out_path)
     logger.info("[output] generated_file=%s", out_path)
     logger.info("[output] output_dir=%s", out_dir)
     return 0
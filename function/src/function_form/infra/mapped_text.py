@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import mmap
+import os
+import re
+from array import array
+from pathlib import Path
+from typing import Iterator
+
+# Line endings of a text-mode read.
+_EOL_RE = re.compile(rb"\r\n?|\n")
+
+
+def _newlines(text: str) -> str:
+    # Same translation as a text-mode read.
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+class MappedText:
+    """
+    Read-only memory map of a UTF-8 text spec.
+
+    The bytes stay in the page cache rather than the Python heap and only the
+    requested parts are decoded. Newlines come back normalized, as from a
+    text-mode read: lines end at "\\n", "\\r\\n" or a bare "\\r" and are
+    returned without their ending. The line-offset index (byte offsets in two
+    arrays) grows incrementally, only as far as the lines asked for.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        self.size = os.fstat(self._file.fileno()).st_size
+        # mmap rejects empty files.
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else None
+        self._starts = array("q")
+        self._ends = array("q")
+        # Byte offset where indexing resumes.
+        self._scan = 0
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __enter__(self) -> MappedText:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _decode(self, start: int, stop: int) -> str:
+        if self._map is None or start >= stop:
+            return ""
+        with memoryview(self._map) as view:
+            return str(view[start:stop], "utf-8")
+
+    def _index_to(self, idx: int) -> bool:
+        """Extend the index through line `idx`; False if the text has fewer lines."""
+        while len(self._ends) <= idx:
+            if self._map is None or self._scan >= self.size:
+                return False
+            m = _EOL_RE.search(self._map, self._scan)
+            self._starts.append(self._scan)
+            self._ends.append(m.start() if m else self.size)
+            self._scan = m.end() if m else self.size
+        return True
+
+    def __len__(self) -> int:
+        while self._index_to(len(self._ends)):
+            pass
+        return len(self._ends)
+
+    def lines(self, start: int = 0, stop: int | None = None) -> Iterator[str]:
+        idx = start
+        while (stop is None or idx < stop) and self._index_to(idx):
+            yield self._decode(self._starts[idx], self._ends[idx])
+            idx += 1
+
+    def text(self) -> str:
+        return _newlines(self._decode(0, self.size))
+
+    def head(self, max_chars: int) -> str:
+        """First max_chars characters; decodes only the bytes that can hold them."""
+        end = min(self.size, max_chars * 4)
+        if end < self.size and self._map is not None:
+            # Back off to a UTF-8 character boundary.
+            while end > 0 and self._map[end] & 0xC0 == 0x80:
+                end -= 1
+        return _newlines(self._decode(0, end))[:max_chars]
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from .spec_document import SpecDocument, as_document
+
 KEYWORDS = [
     "软件主要功能",
     "功能架构",
@@ -22,38 +24,12 @@ class TextChunk:
     content: str
 
 
-def chunk_text(source_text: str, max_chars: int = 1200) -> list[TextChunk]:
-    lines = (source_text or "").splitlines()
-    chunks: list[TextChunk] = []
-    cur_title = "未命名段落"
-    cur_lines: list[str] = []
-    cur_len = 0
-
-    def flush() -> None:
-        nonlocal cur_lines, cur_len
-        text = "\n".join(x for x in cur_lines if x.strip()).strip()
-        if text:
-            chunks.append(TextChunk(title=cur_title, content=text))
-        cur_lines = []
-        cur_len = 0
-
-    for raw in lines:
-        line = raw.rstrip()
-        if line.startswith("#"):
-            flush()
-            cur_title = line.lstrip("#").strip() or "未命名段落"
-            continue
-
-        if not line.strip():
-            continue
-
-        if cur_len + len(line) > max_chars and cur_lines:
-            flush()
-        cur_lines.append(line)
-        cur_len += len(line)
-
-    flush()
-    return chunks
+def chunk_text(source: str | SpecDocument, max_chars: int = 1200) -> list[TextChunk]:
+    doc = as_document(source)
+    return [
+        TextChunk(title=chunk.title or "未命名段落", content=chunk.text)
+        for chunk in doc.pack(max_chars, split_at_headings=True, count_breaks=False, count_indent=True)
+    ]
 
 
 def retrieve_function_chunks(chunks: list[TextChunk], top_k: int = 10) -> list[TextChunk]:
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Bump when the stored layout or the normalization changes; older records are then ignored.
+_SCHEMA = 1
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$")
+_SPACE_RE = re.compile(r"\s+")
+
+
+@dataclass(frozen=True)
+class SpecFingerprint:
+    """Content hash of a spec's text and of each of its Markdown heading sections."""
+
+    digest: str
+    # (heading path such as "2 功能 / 2.1 登录", digest) in document order; the
+    # text before the first heading has the path "".
+    sections: tuple[tuple[str, str], ...]
+
+    def changed_sections(self, previous: SpecFingerprint) -> list[str]:
+        """
+        Heading paths added, edited or removed since `previous`, in document
+        order. Sections sharing a path are matched by occurrence, so each
+        changed one is listed.
+        """
+        old = dict(_keyed(previous.sections))
+        new = dict(_keyed(self.sections))
+        changed = [key for key, digest in new.items() if old.get(key) != digest]
+        changed.extend(key for key in old if key not in new)
+        return [path for path, _ in changed]
+
+
+def _keyed(sections: tuple[tuple[str, str], ...]) -> list[tuple[tuple[str, int], str]]:
+    # ((path, occurrence of that path), digest)
+    seen: dict[str, int] = {}
+    keyed = []
+    for path, digest in sections:
+        seen[path] = seen.get(path, -1) + 1
+        keyed.append(((path, seen[path]), digest))
+    return keyed
+
+
+def _hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def fingerprint_text(text: str) -> SpecFingerprint:
+    """
+    Fingerprint spec text. Runs of whitespace are collapsed and blank lines
+    dropped first, so re-wrapping or re-indenting a spec does not count as a
+    change.
+    """
+    lines = [_SPACE_RE.sub(" ", line).strip() for line in (text or "").splitlines()]
+    lines = [line for line in lines if line]
+    sections: list[tuple[str, str]] = []
+    stack: list[tuple[int, str]] = []
+    path = ""
+    body: list[str] = []
+
+    def close() -> None:
+        if body or path:
+            sections.append((path, _hash("\n".join(body))))
+
+    for line in lines:
+        m = _HEADING_RE.match(line)
+        if m is None:
+            body.append(line)
+            continue
+        close()
+        level = len(m.group(1))
+        while stack and stack[-1][0] >= level:
+            stack.pop()
+        stack.append((level, m.group(2)))
+        path = " / ".join(title for _, title in stack)
+        body = [line]
+    close()
+    return SpecFingerprint(digest=_hash("\n".join(lines)), sections=tuple(sections))
+
+
+def inputs_digest(*parts: object) -> str:
+    """
+    Hash of everything besides the spec that shapes an output: payload dicts,
+    config values and file paths (a file counts by path, size and mtime).
+    """
+    items: list[object] = []
+    for part in parts:
+        if isinstance(part, Path):
+            try:
+                stat = part.stat()
+                items.append([str(part), stat.st_size, stat.st_mtime_ns])
+            except OSError:
+                items.append([str(part), None, None])
+        else:
+            items.append(part)
+    return _hash(json.dumps(items, ensure_ascii=False, sort_keys=True, default=str))
+
+
+def _store_path(out_dir: Path, generator: str) -> Path:
+    return out_dir / f".{generator}.fingerprints.json"
+
+
+def _load_records(out_dir: Path, generator: str) -> dict[str, dict]:
+    try:
+        data = json.loads(_store_path(out_dir, generator).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("schema") != _SCHEMA or not isinstance(data.get("runs"), dict):
+        return {}
+    return data["runs"]
+
+
+def reusable_output(
+    out_dir: Path,
+    generator: str,
+    key: str,
+    inputs: str,
+    spec: SpecFingerprint,
+) -> Path | None:
+    """
+    Output of the last run for `key` in `out_dir` if neither its inputs nor the
+    spec have changed and the file is still there. When the spec changed, the
+    affected sections are logged.
+    """
+    record = _load_records(out_dir, generator).get(key)
+    if not isinstance(record, dict):
+        return None
+    previous = SpecFingerprint(
+        digest=str(record.get("spec", "")),
+        sections=tuple((str(p), str(d)) for p, d in record.get("sections", [])),
+    )
+    if previous.digest != spec.digest:
+        changed = spec.changed_sections(previous)
+        logger.info(
+            "Spec changed since last run: %s section(s): %s",
+            len(changed),
+            ", ".join(path or "(preamble)" for path in changed[:10]),
+        )
+        return None
+    if record.get("inputs") != inputs:
+        logger.info("Spec unchanged but inputs differ since last run; regenerating")
+        return None
+    output = out_dir / str(record.get("output", ""))
+    return output if record.get("output") and output.is_file() else None
+
+
+def record_run(
+    out_dir: Path,
+    generator: str,
+    key: str,
+    inputs: str,
+    spec: SpecFingerprint,
+    output: Path,
+) -> None:
+    """Persist the fingerprint of a finished run next to its output."""
+    runs = _load_records(out_dir, generator)
+    runs[key] = {
+        "spec": spec.digest,
+        "sections": [list(item) for item in spec.sections],
+        "inputs": inputs,
+        "output": os.path.relpath(output, out_dir),
+    }
+    store = _store_path(out_dir, generator)
+    try:
+        fd, tmp = tempfile.mkstemp(dir=out_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"schema": _SCHEMA, "runs": runs}, f, ensure_ascii=False, indent=2)
+            os.replace(tmp, store)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+    except OSError as exc:
+        logger.warning("Failed to save spec fingerprint to %s: %s", store, exc)
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import io
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+
+@dataclass
+class _Entry:
+    mtime_ns: int
+    size: int
+    digest: str
+    raw: bytes
+    document: Any = None
+
+
+_LOCK = threading.Lock()
+_ENTRIES: dict[str, _Entry] = {}
+
+
+def _entry(path: str | Path) -> _Entry:
+    """
+    Raw bytes for `path`, read once per process. A changed mtime/size triggers
+    a re-read; the parsed tree is only dropped if the content hash differs.
+    """
+    p = Path(path).expanduser().resolve()
+    st = p.stat()
+    key = str(p)
+    with _LOCK:
+        entry = _ENTRIES.get(key)
+        if entry is not None and entry.mtime_ns == st.st_mtime_ns and entry.size == st.st_size:
+            return entry
+    raw = p.read_bytes()
+    digest = hashlib.sha1(raw).hexdigest()
+    with _LOCK:
+        entry = _ENTRIES.get(key)
+        if entry is not None and entry.digest == digest:
+            entry.mtime_ns, entry.size = st.st_mtime_ns, st.st_size
+            return entry
+        entry = _Entry(mtime_ns=st.st_mtime_ns, size=st.st_size, digest=digest, raw=raw)
+        _ENTRIES[key] = entry
+        return entry
+
+
+def template_bytes(path: str | Path) -> bytes:
+    return _entry(path).raw
+
+
+def load_docx_template(path: str | Path, *, readonly: bool = False) -> tuple[Any, bytes]:
+    """
+    Return (Document, raw package bytes) for a DOCX template.
+
+    The template is parsed once per process; each call gets a deep copy it may
+    modify freely. With readonly=True the shared parsed Document is returned
+    as-is and must not be modified.
+    """
+    from docx import Document
+
+    entry = _entry(path)
+    with _LOCK:
+        if entry.document is None:
+            entry.document = Document(io.BytesIO(entry.raw))
+        document = entry.document
+    if readonly:
+        return document, entry.raw
+    return copy.deepcopy(document), entry.raw
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from function_form.core.renderer import _render_rows_table, _to_rows
+
+_TEMPLATE = ROOT / "function_form" / "resources" / "test_function_form.docx"
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="bench-rows-table")
+    parser.add_argument("--rows", type=int, default=2000, help="Secondary functions in the module list")
+    parser.add_argument("--per-module", type=int, default=8, help="Secondary functions per level-1 module")
+    parser.add_argument("--template", default=str(_TEMPLATE))
+    return parser
+
+
+def _module_list(rows: int, per_module: int) -> list[dict]:
+    modules: list[dict] = []
+    for idx in range(rows):
+        if idx % per_module == 0:
+            modules.append({"name": f"模块{idx // per_module + 1}", "items": []})
+        modules[-1]["items"].append({"name": f"功能{idx + 1}", "desc": f"支持第{idx + 1}项业务操作，包括查询、编辑与导出。"})
+    return modules
+
+
+def _legacy_render(template_path: Path, output_path: Path, rows) -> None:
+    # add_row() + per-cell paragraph rebuild, as the renderer did before the bulk path.
+    from docx import Document
+
+    def set_cell_text(cell, text: str) -> None:
+        while len(cell.paragraphs) > 1:
+            p = cell.paragraphs[-1]._element
+            p.getparent().remove(p)
+        para = cell.paragraphs[0]
+        for run in list(para.runs):
+            run._element.getparent().remove(run._element)
+        para.text = str(text or "")
+
+    doc = Document(template_path)
+    table = doc.tables[0]
+    while len(table.rows) > 2:
+        table._tbl.remove(table.rows[-1]._tr)
+    first = rows[0]
+    set_cell_text(table.rows[1].cells[0], first.level1)
+    set_cell_text(table.rows[1].cells[1], first.level2)
+    set_cell_text(table.rows[1].cells[2], first.desc)
+    for r in rows[1:]:
+        row = table.add_row()
+        set_cell_text(row.cells[0], r.level1)
+        set_cell_text(row.cells[1], r.level2)
+        set_cell_text(row.cells[2], r.desc)
+    doc.save(output_path)
+
+
+def _cells(path: Path) -> list[tuple[str, ...]]:
+    from docx import Document
+
+    table = Document(path).tables[0]
+    return [tuple(tc.xpath("string(.)") for tc in tr.tc_lst) for tr in table._tbl.tr_lst]
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    template = Path(args.template)
+    rows = _to_rows(_module_list(args.rows, args.per_module))
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_out = Path(tmp) / "legacy.docx"
+        bulk_out = Path(tmp) / "bulk.docx"
+        merged_out = Path(tmp) / "merged.docx"
+        timings: dict[str, float] = {}
+        for name, fn in (
+            ("legacy add_row", lambda: _legacy_render(template, legacy_out, rows)),
+            ("bulk clone", lambda: _render_rows_table(template, bulk_out, rows)),
+            ("bulk clone + merge", lambda: _render_rows_table(template, merged_out, rows, merge_level1=True)),
+        ):
+            start = time.perf_counter()
+            fn()
+            timings[name] = (time.perf_counter() - start) * 1000.0
+        same = _cells(legacy_out) == _cells(bulk_out)
+        merged_rows = len(_cells(merged_out))
+
+    print(f"[Info] rows={len(rows)} modules={len({r.level1 for r in rows})}")
+    base = timings["legacy add_row"]
+    for name, ms in timings.items():
+        print(f"[Render] {name:<20} {ms:>9.1f} ms ({base / ms if ms else 0:.1f}x)")
+    print(f"[Check] same cell text as legacy: {same}; merged table rows: {merged_rows}")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -33,6 +33,11 @@ class TemplateConfig:
 @dataclass(frozen=True)
 class ProposalConfig:
     topk_default: int
+    rules_executor: str
+    rules_workers: int
+    # Per-rule timing/payload stats in metrics.json; off by default since it serializes each payload.
+    rule_stats: bool
+    pdf_workers: int
 
 
 @dataclass(frozen=True)
@@ -95,6 +100,10 @@ def load_config(path: str) -> AppConfig:
     proposal = data.get("proposal", {})
     proposal_config = ProposalConfig(
         topk_default=int(proposal.get("topk_default", 8)),
+        rules_executor=_read_env("PROPOSAL_RULES_EXECUTOR") or str(proposal.get("rules_executor", "serial")).strip() or "serial",
+        rules_workers=int(_read_env("PROPOSAL_RULES_WORKERS") or proposal.get("rules_workers", 0) or 0),
+        rule_stats=(_read_env("PROPOSAL_RULE_STATS") or str(proposal.get("rule_stats", ""))).lower() in {"1", "true", "yes", "y"},
+        pdf_workers=int(_read_env("PROPOSAL_PDF_WORKERS") or proposal.get("pdf_workers", 0) or 0),
     )
 
     contact_raw = _read_env("PROPOSAL_CONTACT_INFO") or str(
@@ -0,0 +1,404 @@
+from __future__ import annotations
+
+import re
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Iterator
+
+from lxml import etree
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_R_ID = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+
+_W_BODY = f"{_W}body"
+_W_P = f"{_W}p"
+_W_TBL = f"{_W}tbl"
+_W_TR = f"{_W}tr"
+_W_TC = f"{_W}tc"
+_W_SDT = f"{_W}sdt"
+_W_SDT_CONTENT = f"{_W}sdtContent"
+_W_R = f"{_W}r"
+_W_VAL = f"{_W}val"
+
+_HEADING_NAME_RE = re.compile(r"^(?:heading|标题)\s*([1-9])$", re.I)
+# Styles pandoc moves into document metadata instead of the body.
+_METADATA_STYLES = {"title", "subtitle", "author", "date", "abstract"}
+_FALSE = {"0", "false", "off", "none"}
+
+# Markdown characters escaped in running text, as pandoc's gfm writer does; line-start
+# markers are handled separately. Like pandoc, a single underscore between two letters
+# or digits stays literal, a backslash before one too, and "![" escapes only the "!".
+_ESCAPE_RE = re.compile(r"!\[|[`*\[\]<>|$]|\\(?![^\W_])|(?<!\S)#|_(?![^\W_])|(?<![^\W_])_")
+_SPACE_RE = re.compile(r"[ \t]+")
+_LINE_START_RE = re.compile(r"^(?:([#>]|[-+](?=\s))|(\d+)([.)])(?=\s|$))")
+
+
+@dataclass(frozen=True)
+class Block:
+    """
+    One body-level unit of a DOCX document, in document order.
+
+    kind is "heading" (level 1-6), "list" (level = nesting depth, ordered set
+    for numbered lists), "paragraph" or "table" (rows of cell text).
+    """
+
+    kind: str
+    text: str = ""
+    level: int = 0
+    ordered: bool = False
+    rows: tuple[tuple[str, ...], ...] = ()
+
+
+@dataclass(frozen=True)
+class _Style:
+    heading: int
+    metadata: bool
+    num_id: str
+    ilvl: int
+
+
+def _read_part(zf: zipfile.ZipFile, name: str) -> etree._Element | None:
+    try:
+        data = zf.read(name)
+    except KeyError:
+        return None
+    return etree.fromstring(data, parser=etree.XMLParser(resolve_entities=False, huge_tree=True))
+
+
+def _on(el: etree._Element | None) -> bool:
+    return el is not None and el.get(_W_VAL, "1").lower() not in _FALSE
+
+
+def _load_styles(zf: zipfile.ZipFile) -> dict[str, _Style]:
+    root = _read_part(zf, "word/styles.xml")
+    if root is None:
+        return {}
+    raw: dict[str, tuple[str, str, int | None, str, int]] = {}
+    for style in root.iterchildren(f"{_W}style"):
+        if style.get(f"{_W}type") != "paragraph":
+            continue
+        style_id = style.get(f"{_W}styleId", "")
+        name_el = style.find(f"{_W}name")
+        based_el = style.find(f"{_W}basedOn")
+        outline = style.find(f"{_W}pPr/{_W}outlineLvl")
+        num_id = style.find(f"{_W}pPr/{_W}numPr/{_W}numId")
+        ilvl = style.find(f"{_W}pPr/{_W}numPr/{_W}ilvl")
+        raw[style_id] = (
+            (name_el.get(_W_VAL, "") if name_el is not None else "").strip(),
+            based_el.get(_W_VAL, "") if based_el is not None else "",
+            int(outline.get(_W_VAL, "9")) if outline is not None else None,
+            num_id.get(_W_VAL, "") if num_id is not None else "",
+            int(ilvl.get(_W_VAL, "0")) if ilvl is not None else 0,
+        )
+
+    styles: dict[str, _Style] = {}
+    for style_id in raw:
+        heading, metadata, num_id, ilvl = 0, False, "", 0
+        seen: set[str] = set()
+        current = style_id
+        # Walk the basedOn chain; the nearest definition of each property wins.
+        while current in raw and current not in seen:
+            seen.add(current)
+            name, based_on, outline, s_num, s_ilvl = raw[current]
+            m = _HEADING_NAME_RE.match(name)
+            if not heading and m:
+                heading = int(m.group(1))
+            if not heading and outline is not None and outline < 6 and current == style_id:
+                heading = outline + 1
+            if current == style_id and name.lower() in _METADATA_STYLES:
+                metadata = True
+            if not num_id and s_num:
+                num_id, ilvl = s_num, s_ilvl
+            current = based_on
+        styles[style_id] = _Style(heading=min(heading, 6), metadata=metadata, num_id=num_id, ilvl=ilvl)
+    return styles
+
+
+def _load_numbering(zf: zipfile.ZipFile) -> dict[tuple[str, int], bool]:
+    """(numId, ilvl) -> True when that level is numbered rather than bulleted."""
+    root = _read_part(zf, "word/numbering.xml")
+    if root is None:
+        return {}
+    abstract: dict[str, dict[int, bool]] = {}
+    for an in root.iterchildren(f"{_W}abstractNum"):
+        levels: dict[int, bool] = {}
+        for lvl in an.iterchildren(f"{_W}lvl"):
+            fmt = lvl.find(f"{_W}numFmt")
+            value = fmt.get(_W_VAL, "bullet") if fmt is not None else "bullet"
+            levels[int(lvl.get(f"{_W}ilvl", "0"))] = value not in {"bullet", "none"}
+        abstract[an.get(f"{_W}abstractNumId", "")] = levels
+    result: dict[tuple[str, int], bool] = {}
+    for num in root.iterchildren(f"{_W}num"):
+        ref = num.find(f"{_W}abstractNumId")
+        levels = abstract.get(ref.get(_W_VAL, "") if ref is not None else "", {})
+        for ilvl, ordered in levels.items():
+            result[(num.get(f"{_W}numId", ""), ilvl)] = ordered
+    return result
+
+
+def _load_links(zf: zipfile.ZipFile) -> dict[str, str]:
+    root = _read_part(zf, "word/_rels/document.xml.rels")
+    if root is None:
+        return {}
+    return {
+        rel.get("Id", ""): rel.get("Target", "")
+        for rel in root.iterchildren(_REL)
+        if rel.get("TargetMode") == "External" and rel.get("Type", "").endswith("/hyperlink")
+    }
+
+
+def _escape(text: str) -> str:
+    return _ESCAPE_RE.sub(lambda m: "\\" + m.group(0), text)
+
+
+def _escape_line_start(text: str) -> str:
+    m = _LINE_START_RE.match(text)
+    if m is None:
+        return text
+    if m.group(1):
+        return "\\" + text
+    return f"{m.group(2)}\\{m.group(3)}{text[m.end():]}"
+
+
+def _wrap(text: str, marker: str) -> str:
+    core = text.strip()
+    if not core or not marker:
+        return text
+    lead = text[: len(text) - len(text.lstrip())]
+    trail = text[len(text.rstrip()) :]
+    return f"{lead}{marker}{core}{marker}{trail}"
+
+
+def _render(pieces: list[tuple[str, str, bool]], markup: bool) -> str:
+    """
+    Join (marker, text, already Markdown) pieces. Runs sharing a marker are
+    merged first and escaped as one text, so a run boundary inside a word
+    does not look like a word edge.
+    """
+    groups: list[tuple[str, list[tuple[str, bool]]]] = []
+    for marker, text, literal in pieces:
+        if groups and groups[-1][0] == marker:
+            groups[-1][1].append((text, literal))
+        else:
+            groups.append((marker, [(text, literal)]))
+    out: list[str] = []
+    for marker, parts in groups:
+        text: list[str] = []
+        plain: list[str] = []
+        for part, literal in parts:
+            if literal:
+                if plain:
+                    text.append(_escape("".join(plain)) if markup else "".join(plain))
+                    plain = []
+                text.append(part)
+            else:
+                plain.append(part)
+        if plain:
+            text.append(_escape("".join(plain)) if markup else "".join(plain))
+        out.append(_wrap("".join(text), marker))
+    return "".join(out)
+
+
+class _Converter:
+    def __init__(self, zf: zipfile.ZipFile) -> None:
+        self.styles = _load_styles(zf)
+        self.numbering = _load_numbering(zf)
+        self.links = _load_links(zf)
+
+    def inline(self, p: etree._Element, *, markup: bool, line_break: str) -> str:
+        """Text of a paragraph; with markup, bold/italic and links become Markdown."""
+        pieces: list[tuple[str, str, bool]] = []  # (marker, text, already Markdown)
+
+        def add_run(r: etree._Element) -> None:
+            rpr = r.find(f"{_W}rPr")
+            marker = ""
+            if markup and rpr is not None:
+                bold = _on(rpr.find(f"{_W}b"))
+                italic = _on(rpr.find(f"{_W}i"))
+                marker = "***" if bold and italic else "**" if bold else "*" if italic else ""
+            for child in r:
+                tag = child.tag
+                if tag == f"{_W}t":
+                    pieces.append((marker, child.text or "", False))
+                elif tag in (f"{_W}tab", f"{_W}ptab"):
+                    pieces.append(("", " ", False))
+                elif tag in (f"{_W}br", f"{_W}cr"):
+                    if child.get(f"{_W}type") not in ("page", "column"):
+                        pieces.append(("", line_break, True))
+                elif tag == f"{_W}noBreakHyphen":
+                    pieces.append(("", "-", False))
+
+        def walk(parent: etree._Element) -> None:
+            for child in parent:
+                tag = child.tag
+                if tag == _W_R:
+                    add_run(child)
+                elif tag == f"{_W}hyperlink":
+                    target = self.links.get(child.get(_R_ID, ""))
+                    if markup and target:
+                        start = len(pieces)
+                        walk(child)
+                        label = _render(pieces[start:], markup)
+                        del pieces[start:]
+                        pieces.append(("", f"[{label}]({target})", True))
+                    else:
+                        walk(child)
+                elif tag in (f"{_W}del", f"{_W}moveFrom", f"{_W}pPr", f"{_W}rPr"):
+                    continue
+                elif isinstance(tag, str):
+                    # ins, smartTag, sdt/sdtContent, fldSimple, customXml...
+                    walk(child)
+
+        walk(p)
+        return _render(pieces, markup)
+
+    def paragraph(self, p: etree._Element, *, markup: bool = True) -> Block | None:
+        ppr = p.find(f"{_W}pPr")
+        style = None
+        num_id, ilvl = "", 0
+        if ppr is not None:
+            style_el = ppr.find(f"{_W}pStyle")
+            style = self.styles.get(style_el.get(_W_VAL, "")) if style_el is not None else None
+            num_el = ppr.find(f"{_W}numPr/{_W}numId")
+            ilvl_el = ppr.find(f"{_W}numPr/{_W}ilvl")
+            if num_el is not None:
+                num_id = num_el.get(_W_VAL, "")
+                ilvl = int(ilvl_el.get(_W_VAL, "0")) if ilvl_el is not None else 0
+        if style is None:
+            style = self.styles.get("Normal") or _Style(0, False, "", 0)
+        if style.metadata:
+            return None
+
+        text = self.inline(p, markup=markup, line_break="\\\n" if markup else "\n").strip()
+        if markup:
+            text = _SPACE_RE.sub(" ", text)
+        if not text:
+            return None
+        if style.heading:
+            return Block("heading", text.replace("\\\n", " "), level=style.heading)
+        if not num_id and style.num_id:
+            num_id, ilvl = style.num_id, style.ilvl
+        if num_id and num_id != "0":
+            ordered = self.numbering.get((num_id, ilvl))
+            if ordered is not None:
+                return Block("list", text, level=ilvl, ordered=ordered)
+        return Block("paragraph", text)
+
+    def table(self, tbl: etree._Element, *, markup: bool = True) -> Block | None:
+        rows: list[tuple[str, ...]] = []
+        for tr in tbl.iterchildren(_W_TR):
+            cells: list[str] = []
+            for tc in tr.iter(_W_TC):
+                if tc.getparent() is not tr and tc.getparent().tag != _W_SDT_CONTENT:
+                    continue
+                vmerge = tc.find(f"{_W}tcPr/{_W}vMerge")
+                span_el = tc.find(f"{_W}tcPr/{_W}gridSpan")
+                span = int(span_el.get(_W_VAL, "1")) if span_el is not None else 1
+                if vmerge is not None and vmerge.get(_W_VAL, "continue") == "continue":
+                    text = ""
+                else:
+                    parts = [self.inline(p, markup=markup, line_break=" ").strip() for p in tc.iter(_W_P)]
+                    text = _SPACE_RE.sub(" ", " ".join(part for part in parts if part))
+                cells.append(text)
+                cells.extend("" for _ in range(span - 1))
+            rows.append(tuple(cells))
+        if not rows:
+            return None
+        return Block("table", rows=tuple(rows))
+
+
+def _body_level(el: etree._Element) -> bool:
+    parent = el.getparent()
+    while parent is not None and parent.tag in (_W_SDT_CONTENT, _W_SDT):
+        parent = parent.getparent()
+    return parent is not None and parent.tag == _W_BODY
+
+
+def iter_blocks(source: str | Path | IO[bytes], *, markup: bool = True) -> Iterator[Block]:
+    """
+    Stream the body of a DOCX as blocks in document order.
+
+    Only word/document.xml, styles.xml, numbering.xml and the document rels
+    are read; media and other parts are never decompressed. Body elements are
+    released as soon as they are converted, so memory stays bounded by the
+    largest single paragraph or table.
+    """
+    with zipfile.ZipFile(source) as zf:
+        conv = _Converter(zf)
+        with zf.open("word/document.xml") as fp:
+            for _, el in etree.iterparse(fp, events=("end",), tag=(_W_P, _W_TBL), huge_tree=True, resolve_entities=False):
+                if not _body_level(el):
+                    continue
+                block = conv.paragraph(el, markup=markup) if el.tag == _W_P else conv.table(el, markup=markup)
+                if block is not None:
+                    yield block
+                el.clear()
+                parent = el.getparent()
+                while el.getprevious() is not None:
+                    del parent[0]
+
+
+def _table_markdown(rows: tuple[tuple[str, ...], ...]) -> str:
+    width = max(len(row) for row in rows)
+
+    def line(row: tuple[str, ...]) -> str:
+        # Cell text is already escaped, "|" included.
+        cells = list(row) + [""] * (width - len(row))
+        return "| " + " | ".join(cells) + " |"
+
+    out = [line(rows[0]), "|" + "|".join("---" for _ in range(width)) + "|"]
+    out.extend(line(row) for row in rows[1:])
+    return "\n".join(out)
+
+
+def blocks_to_markdown(blocks: Iterator[Block]) -> str:
+    """
+    Render blocks as GitHub-flavored Markdown, following pandoc's gfm layout:
+    blank lines between blocks, tight lists, pipe tables with the first row
+    as header.
+    """
+    out: list[str] = []
+    counters: dict[int, int] = {}
+    prev_list = False
+    top_ordered = False
+    for block in blocks:
+        if block.kind == "list":
+            if prev_list and block.level == 0 and block.ordered != top_ordered:
+                # Bullets followed by numbers (or the reverse) start a new list.
+                prev_list = False
+                counters.clear()
+            if block.level == 0:
+                top_ordered = block.ordered
+            for deeper in [lvl for lvl in counters if lvl > block.level]:
+                del counters[deeper]
+            if block.ordered:
+                counters[block.level] = counters.get(block.level, 0) + 1
+                marker = f"{counters[block.level]}."
+            else:
+                counters.pop(block.level, None)
+                marker = "-"
+            indent = "    " * block.level
+            body = block.text.replace("\\\n", "\\\n" + indent + " " * (len(marker) + 1))
+            item = f"{indent}{marker} {body}"
+            if prev_list:
+                out[-1] += "\n" + item
+            else:
+                out.append(item)
+            prev_list = True
+            continue
+        counters.clear()
+        prev_list = False
+        if block.kind == "heading":
+            out.append(f"{'#' * block.level} {block.text}")
+        elif block.kind == "table":
+            out.append(_table_markdown(block.rows))
+        else:
+            out.append(_escape_line_start(block.text))
+    return "\n\n".join(out) + ("\n" if out else "")
+
+
+def docx_to_markdown(source: str | Path | IO[bytes]) -> str:
+    """Convert a DOCX to Markdown in-process (headings, lists, tables, emphasis, links)."""
+    return blocks_to_markdown(iter_blocks(source))
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import IO, Iterator
+
+from .docx_markdown import iter_blocks
+
+_SPACE_RE = re.compile(r"[ \t　\xa0]+")
+
+
+def _normalize(line: str) -> str:
+    return _SPACE_RE.sub(" ", line).strip()
+
+
+def iter_docx_lines(source: str | Path | IO[bytes]) -> Iterator[str]:
+    """
+    Stream a DOCX body as plain text in document order, one item per
+    paragraph or table row.
+
+    Built on docx_markdown.iter_blocks without Markdown markup, so only the
+    document XML parts are read and embedded media costs nothing. Headings
+    keep their "#" prefix so the section outline survives, list items get a
+    bullet or their number, and table rows come out as "a | b".
+    """
+    counters: dict[int, int] = {}
+    for block in iter_blocks(source, markup=False):
+        if block.kind != "list":
+            counters.clear()
+        if block.kind == "table":
+            for row in block.rows:
+                cells = [cell for cell in (_normalize(c) for c in row) if cell]
+                if cells:
+                    yield " | ".join(cells)
+            continue
+        lines = [line for line in (_normalize(x) for x in block.text.splitlines()) if line]
+        if not lines:
+            continue
+        if block.kind == "heading":
+            yield f"{'#' * block.level} {' '.join(lines)}"
+        elif block.kind == "list":
+            for deeper in [lvl for lvl in counters if lvl > block.level]:
+                del counters[deeper]
+            marker = "-"
+            if block.ordered:
+                counters[block.level] = counters.get(block.level, 0) + 1
+                marker = f"{counters[block.level]}."
+            yield f"{'  ' * block.level}{marker} " + "\n".join(lines)
+        else:
+            yield "\n".join(lines)
+
+
+def docx_text(source: str | Path | IO[bytes]) -> str:
+    """Text of a DOCX without loading its media; see iter_docx_lines."""
+    return "\n".join(iter_docx_lines(source))
@@ -7,7 +7,12 @@ import tempfile
 from pathlib import Path
 
 import yaml
-from docx import Document
+
+from .docx_markdown import docx_to_markdown
+from .mapped_text import MappedText
+from .pdf_text import extract_pdf_text
+from .spec_cache import DOCX_MARKDOWN, DOCX_TEXT, PANDOC_GFM, PDF_TEXT, cached_spec_text, peek_spec_text
+from .spec_stream import iter_paragraphs
 
 
 def read_file_content(file_path: Path, max_chars: int = 40000) -> str:
@@ -15,9 +20,10 @@ def read_file_content(file_path: Path, max_chars: int = 40000) -> str:
     text = ""
     try:
         if ext == ".md":
-            text = file_path.read_text(encoding="utf-8")[:max_chars]
+            with MappedText(file_path) as mapped:
+                text = mapped.head(max_chars)
         elif ext == ".docx":
-            text = _read_docx_via_pandoc(file_path, max_chars)
+            text = _read_docx_markdown(file_path, max_chars)
             if not text:
                 text = _read_docx_fallback(file_path, max_chars)
         elif ext == ".pdf":
@@ -28,7 +34,40 @@ def read_file_content(file_path: Path, max_chars: int = 40000) -> str:
     return text
 
 
+def _read_docx_markdown(file_path: Path, max_chars: int) -> str:
+    """
+    DOCX as Markdown, converted in-process. Set PROPOSAL_DOCX_CONVERTER=pandoc
+    to use the pandoc binary instead.
+    """
+    if os.getenv("PROPOSAL_DOCX_CONVERTER", "").strip().lower() == "pandoc":
+        return _read_docx_via_pandoc(file_path, max_chars)
+    try:
+        content = cached_spec_text(file_path, DOCX_MARKDOWN, docx_to_markdown)
+    except Exception as exc:
+        logging.warning("Markdown conversion failed for %s: %s", file_path, exc)
+        return ""
+    _save_converted_md(file_path, content)
+    return content[:max_chars]
+
+
 def _read_docx_via_pandoc(file_path: Path, max_chars: int) -> str:
+    content = cached_spec_text(file_path, PANDOC_GFM, _convert_docx_via_pandoc)
+    _save_converted_md(file_path, content)
+    return content[:max_chars]
+
+
+def _save_converted_md(file_path: Path, content: str) -> None:
+    save_path = _pandoc_save_path(file_path) if content else None
+    if not save_path:
+        return
+    try:
+        save_path.parent.mkdir(parents=True, exist_ok=True)
+        save_path.write_text(content, encoding="utf-8")
+    except Exception as exc:
+        logging.warning("Failed to save converted md for %s: %s", file_path, exc)
+
+
+def _convert_docx_via_pandoc(file_path: Path) -> str:
     try:
         with tempfile.TemporaryDirectory() as tmp_dir:
             md_path = Path(tmp_dir) / f"{file_path.stem}.md"
@@ -41,15 +80,7 @@ def _read_docx_via_pandoc(file_path: Path, max_chars: int) -> str:
                 stderr = result.stderr.strip() or result.stdout.strip()
                 logging.warning("Pandoc conversion failed for %s: %s", file_path, stderr)
                 return ""
-            content = md_path.read_text(encoding="utf-8")
-            save_path = _pandoc_save_path(file_path)
-            if save_path:
-                try:
-                    save_path.parent.mkdir(parents=True, exist_ok=True)
-                    save_path.write_text(content, encoding="utf-8")
-                except Exception as exc:
-                    logging.warning("Failed to save converted md for %s: %s", file_path, exc)
-            return content[:max_chars]
+            return md_path.read_text(encoding="utf-8")
     except FileNotFoundError:
         logging.warning("Pandoc not found in PATH. Falling back to basic docx parsing.")
     except Exception as exc:
@@ -58,39 +89,33 @@ def _read_docx_via_pandoc(file_path: Path, max_chars: int) -> str:
 
 
 def _read_docx_fallback(file_path: Path, max_chars: int) -> str:
-    doc = Document(file_path)
-    parts: list[str] = []
-    for paragraph in doc.paragraphs:
-        content = paragraph.text.strip()
-        if content:
-            parts.append(content)
-    for table in doc.tables:
-        for row in table.rows:
-            row_cells = []
-            for cell in row.cells:
-                cell_text = " ".join(p.text.strip() for p in cell.paragraphs if p.text.strip())
-                row_cells.append(cell_text)
-            if any(row_cells):
-                parts.append(" | ".join(cell for cell in row_cells if cell))
-    return "\n".join(parts)[:max_chars]
+    # Plain text from the document XML only; embedded media is never read.
+    full = peek_spec_text(file_path, DOCX_TEXT)
+    if full is not None:
+        return full[:max_chars]
+    # Budgeted reads stop parsing once max_chars is filled, so they are cached under their own kind.
+    return cached_spec_text(file_path, f"{DOCX_TEXT}-{max_chars}", lambda p: "\n".join(iter_paragraphs(p, max_chars)))
 
 
 def _read_pdf_text(file_path: Path, max_chars: int) -> str:
+    full = peek_spec_text(file_path, PDF_TEXT)
+    if full is not None:
+        return full[:max_chars]
+    # Budgeted reads stop early, so they are cached under their own kind.
+    return cached_spec_text(file_path, f"{PDF_TEXT}-{max_chars}", lambda p: _pdf_text(p, max_chars))
+
+
+def _pdf_text(file_path: Path, max_chars: int) -> str:
     try:
-        import pdfplumber
+        import pdfplumber  # noqa: F401
     except Exception:  # pragma: no cover
         logging.warning("Missing dependency: pdfplumber")
         return ""
-    parts: list[str] = []
     try:
-        with pdfplumber.open(file_path) as pdf:
-            for page in pdf.pages:
-                text = page.extract_text() or ""
-                if text:
-                    parts.append(text)
+        return extract_pdf_text(file_path, max_chars)
     except Exception as exc:
         logging.warning("PDF text extraction failed for %s: %s", file_path, exc)
-    return "\n".join(parts)[:max_chars]
+        return ""
 
 
 def _pandoc_save_path(file_path: Path) -> Path | None:
@@ -3,6 +3,8 @@ from __future__ import annotations
 import re
 from typing import Any
 
+from .term_matcher import TermMatcher
+
 
 _STRONG_TRADE_TRIGGERS = (
     "撮合",
@@ -27,6 +29,7 @@ _TRADE_CONFUSION_PATTERNS = (
     "交易与溯源",
     "交易看板",
 )
+_TRADE_MATCHER = TermMatcher({"strong": _STRONG_TRADE_TRIGGERS, "confusion": _TRADE_CONFUSION_PATTERNS})
 
 _LEDGER_REF_RE = re.compile(r"\bledger\.[a-zA-Z0-9_.]+\b")
 _INTERNAL_REF_REWRITE = (
@@ -88,7 +91,7 @@ def postprocess_llm_output(llm_output: dict[str, Any]) -> dict[str, Any]:
         for p in paragraphs:
             if not p.strip():
                 continue
-            strong_hit = any(t in p for t in _STRONG_TRADE_TRIGGERS) or any(t in p for t in _TRADE_CONFUSION_PATTERNS)
+            strong_hit = bool(_TRADE_MATCHER.hits(p))
             sentences = _split_sentences(p)
             boundary_sentences = [s for s in sentences if _is_boundary_sentence(s)]
             if not boundary_sentences:
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import atexit
+import json
 import re
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
+from .term_matcher import TermMatcher
 
 
 class Stage(str, Enum):
@@ -13,6 +18,12 @@ class Stage(str, Enum):
     DOC_POST = "doc_post"
 
 
+class RuleExecutor(str, Enum):
+    SERIAL = "serial"
+    THREAD = "thread"
+    PROCESS = "process"
+
+
 class ActionType(str, Enum):
     REPAIR_LEDGER = "repair_ledger"
     REWRITE_DOC_SECTION = "rewrite_doc_section"
@@ -52,7 +63,133 @@ class PipelineContext:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-def run_rules(ctx: PipelineContext, rules: List[Rule], stage: Stage) -> List[Issue]:
+@dataclass
+class RuleStat:
+    rule_id: str
+    stage: str
+    calls: int = 0
+    failures: int = 0
+    issues: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    payload_chars: int = 0
+    max_payload_chars: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "stage": self.stage,
+            "calls": self.calls,
+            "failures": self.failures,
+            "issues": self.issues,
+            "total_ms": round(self.total_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+            "mean_ms": round(self.total_ms / self.calls, 3) if self.calls else 0.0,
+            "payload_chars": self.payload_chars,
+            "max_payload_chars": self.max_payload_chars,
+        }
+
+
+@dataclass
+class RuleStats:
+    rules: Dict[str, RuleStat] = field(default_factory=dict)
+
+    def record(self, rule: Rule, result: RuleResult, elapsed_s: float, payload_chars: int) -> None:
+        stat = self.rules.get(rule.rule_id)
+        if stat is None:
+            stat = RuleStat(rule_id=rule.rule_id, stage=rule.stage.value)
+            self.rules[rule.rule_id] = stat
+        elapsed_ms = elapsed_s * 1000.0
+        stat.calls += 1
+        stat.total_ms += elapsed_ms
+        stat.max_ms = max(stat.max_ms, elapsed_ms)
+        stat.payload_chars += payload_chars
+        stat.max_payload_chars = max(stat.max_payload_chars, payload_chars)
+        if not result.passed:
+            stat.failures += 1
+            stat.issues += len(result.issues)
+
+    def merge(self, other: "RuleStats") -> None:
+        for rule_id, src in other.rules.items():
+            stat = self.rules.get(rule_id)
+            if stat is None:
+                self.rules[rule_id] = RuleStat(**vars(src))
+                continue
+            stat.calls += src.calls
+            stat.failures += src.failures
+            stat.issues += src.issues
+            stat.total_ms += src.total_ms
+            stat.max_ms = max(stat.max_ms, src.max_ms)
+            stat.payload_chars += src.payload_chars
+            stat.max_payload_chars = max(stat.max_payload_chars, src.max_payload_chars)
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        return {rule_id: stat.to_dict() for rule_id, stat in self.rules.items()}
+
+    @classmethod
+    def from_dict(cls, data: Any) -> "RuleStats":
+        stats = cls()
+        if not isinstance(data, dict):
+            return stats
+        for rule_id, item in data.items():
+            if not isinstance(item, dict):
+                continue
+            stats.rules[rule_id] = RuleStat(
+                rule_id=rule_id,
+                stage=str(item.get("stage", "")),
+                calls=int(item.get("calls", 0) or 0),
+                failures=int(item.get("failures", 0) or 0),
+                issues=int(item.get("issues", 0) or 0),
+                total_ms=float(item.get("total_ms", 0.0) or 0.0),
+                max_ms=float(item.get("max_ms", 0.0) or 0.0),
+                payload_chars=int(item.get("payload_chars", 0) or 0),
+                max_payload_chars=int(item.get("max_payload_chars", 0) or 0),
+            )
+        return stats
+
+
+def _payload_chars(payload: Dict[str, Any]) -> int:
+    return len(json.dumps(payload, ensure_ascii=False, default=str))
+
+
+_RULE_POOLS: Dict[tuple[RuleExecutor, Optional[int]], Executor] = {}
+
+
+def _rule_pool(executor: RuleExecutor, max_workers: Optional[int]) -> Executor:
+    # Pools are reused across gate/post-lint rounds; spinning up processes per call would dominate.
+    key = (executor, max_workers)
+    pool = _RULE_POOLS.get(key)
+    if pool is None:
+        if executor == RuleExecutor.PROCESS:
+            pool = ProcessPoolExecutor(max_workers=max_workers)
+        else:
+            pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="rules")
+        _RULE_POOLS[key] = pool
+    return pool
+
+
+@atexit.register
+def _shutdown_rule_pools() -> None:
+    while _RULE_POOLS:
+        _, pool = _RULE_POOLS.popitem()
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _timed_check(check: Callable[[Dict[str, Any]], RuleResult], payload: Dict[str, Any]) -> tuple[RuleResult, float]:
+    start = time.perf_counter()
+    res = check(payload)
+    return res, time.perf_counter() - start
+
+
+def run_rules(
+    ctx: PipelineContext,
+    rules: List[Rule],
+    stage: Stage,
+    *,
+    executor: RuleExecutor | str = RuleExecutor.SERIAL,
+    max_workers: Optional[int] = None,
+    stats: Optional[RuleStats] = None,
+    timings: Optional[Dict[str, float]] = None,
+) -> List[Issue]:
     issues: List[Issue] = []
     payload = {
         "ledger": ctx.ledger,
@@ -60,10 +197,22 @@ def run_rules(ctx: PipelineContext, rules: List[Rule], stage: Stage) -> List[Iss
         "ledger_scope": ctx.ledger_scope,
         "metadata": ctx.metadata,
     }
-    for rule in rules:
-        if rule.stage != stage:
-            continue
-        res = rule.check(payload)
+    selected = [rule for rule in rules if rule.stage == stage]
+    mode = RuleExecutor(executor)
+    if mode == RuleExecutor.SERIAL or len(selected) < 2:
+        results = [_timed_check(rule.check, payload) for rule in selected]
+    else:
+        # Rules are pure functions of the payload; results are collected in submission
+        # order so issues keep the same ordering as a serial run.
+        pool = _rule_pool(mode, max_workers or None)
+        futures = [pool.submit(_timed_check, rule.check, payload) for rule in selected]
+        results = [future.result() for future in futures]
+    payload_chars = _payload_chars(payload) if stats is not None and selected else 0
+    for rule, (res, elapsed) in zip(selected, results):
+        if timings is not None:
+            timings[rule.rule_id] = round(timings.get(rule.rule_id, 0.0) + elapsed * 1000.0, 3)
+        if stats is not None:
+            stats.record(rule, res, elapsed, payload_chars)
         if not res.passed:
             issues.extend(res.issues)
     return issues
@@ -915,6 +1064,16 @@ _BOUNDARY_HINTS = (
     "非撮合",
     "非清结算",
 )
+_TRADE_MATCHER = TermMatcher(
+    {
+        "boundary": _BOUNDARY_HINTS,
+        "weak": _WEAK_TRADE_TRIGGERS,
+        "strong": _STRONG_TRADE_TRIGGERS,
+        "confusion": _TRADE_CONFUSION_PATTERNS,
+    }
+)
+_TRADE_MENTION_HITS = frozenset({"weak", "strong", "confusion"})
+_STRONG_TRADE_HITS = frozenset({"strong", "confusion"})
 
 
 def _is_title_like_paragraph(text: str) -> bool:
@@ -932,17 +1091,18 @@ def rule_trade_boundary_sentence(payload: Dict[str, Any]) -> RuleResult:
     doc_has_boundary = False
     doc_has_trade_mention = False
     first_trade_loc: str | None = None
+    scanned: list[tuple[str, int, frozenset[str]]] = []
 
     for key, text in _iter_placeholder_texts(llm_output):
         paragraphs = text.split("\n\n")
         for idx, p in enumerate(paragraphs):
             if _is_title_like_paragraph(p):
                 continue
-            if any(b in p for b in _BOUNDARY_HINTS):
+            hits = _TRADE_MATCHER.hits(p)
+            scanned.append((key, idx, hits))
+            if "boundary" in hits:
                 doc_has_boundary = True
-            if any(t in p for t in _WEAK_TRADE_TRIGGERS) or any(t in p for t in _STRONG_TRADE_TRIGGERS) or any(
-                t in p for t in _TRADE_CONFUSION_PATTERNS
-            ):
+            if hits & _TRADE_MENTION_HITS:
                 doc_has_trade_mention = True
                 if first_trade_loc is None:
                     first_trade_loc = f"placeholders.{key}#p{idx}"
@@ -959,26 +1119,21 @@ def rule_trade_boundary_sentence(payload: Dict[str, Any]) -> RuleResult:
             )
         )
 
-    for key, text in _iter_placeholder_texts(llm_output):
-        paragraphs = text.split("\n\n")
-        for idx, p in enumerate(paragraphs):
-            if _is_title_like_paragraph(p):
-                continue
-            strong_hit = any(t in p for t in _STRONG_TRADE_TRIGGERS) or any(t in p for t in _TRADE_CONFUSION_PATTERNS)
-            if not strong_hit:
-                continue
-            if any(b in p for b in _BOUNDARY_HINTS):
-                continue
-            issues.append(
-                Issue(
-                    rule_id="R5",
-                    severity="error",
-                    message="段落出现可能被误解为交易平台能力的表述，但未同段给出边界声明（非撮合/非清结算/不对接外部交易平台）。",
-                    location=f"placeholders.{key}#p{idx}",
-                    suggested_action=ActionType.REWRITE_DOC_SECTION,
-                    repair_hint="优先将“交易”改写为“存证核验/凭证流转/交付确认”等，再补一句边界声明：不提供撮合清结算，不对接外部交易平台/交易所。",
-                )
+    for key, idx, hits in scanned:
+        if not hits & _STRONG_TRADE_HITS:
+            continue
+        if "boundary" in hits:
+            continue
+        issues.append(
+            Issue(
+                rule_id="R5",
+                severity="error",
+                message="段落出现可能被误解为交易平台能力的表述，但未同段给出边界声明（非撮合/非清结算/不对接外部交易平台）。",
+                location=f"placeholders.{key}#p{idx}",
+                suggested_action=ActionType.REWRITE_DOC_SECTION,
+                repair_hint="优先将“交易”改写为“存证核验/凭证流转/交付确认”等，再补一句边界声明：不提供撮合清结算，不对接外部交易平台/交易所。",
             )
+        )
     return RuleResult(passed=(len(issues) == 0), issues=issues)
 
 
@@ -1015,6 +1170,34 @@ _REF_MEETING_WORDS = ("纪要", "会议", "访谈", "评审", "确认单")
 _REF_CONTRACT_WORDS = ("合同", "意向书", "签署", "框架协议")
 _REF_ACCEPTANCE_WORDS = ("验收", "UAT", "上线", "投产")
 _REF_SECURITY_WORDS = ("等保", "测评", "安全评估", "渗透测试", "漏洞扫描")
+_PLAN_TOKENS = ("计划", "拟", "预计", "将", "目标", "计划验证", "拟验证", "预计验证", "计划通过", "拟通过")
+_REQUIREMENT_TOKENS = ("应", "需", "必须", "要求", "目标", "计划", "拟", "预计")
+_CLAIM_MATCHER = TermMatcher(
+    {
+        "plan": _PLAN_TOKENS,
+        "claim_a": _CLAIM_A_TERMS,
+        "claim_b": _CLAIM_B_TERMS,
+        "verb": _CLAIM_VERBS,
+        "perf": _PERF_TERMS,
+        "requirement": _REQUIREMENT_TOKENS,
+        "contract": ("签署", "意向书", "合同"),
+        "acceptance": ("验收", "UAT", "上线", "投产"),
+        "security": ("等保", "安全", "渗透"),
+    }
+)
+# Insertion order is the category priority used by _ref_category.
+_REF_MATCHER = TermMatcher(
+    {
+        "policy": _REF_POLICY_WORDS,
+        "security": _REF_SECURITY_WORDS,
+        "acceptance": _REF_ACCEPTANCE_WORDS,
+        "contract": _REF_CONTRACT_WORDS,
+        "test": _REF_TEST_WORDS,
+        "poc": _REF_POC_WORDS,
+        "meeting": _REF_MEETING_WORDS,
+    }
+)
+_NUMBER_RE = re.compile(r"\d+\.?\d*")
 
 
 def _ref_text_fields(ref: Any) -> list[str]:
@@ -1051,21 +1234,7 @@ def _ref_title(ref: Any) -> str:
 
 def _ref_category(ref: Any) -> str:
     text = " ".join(_ref_text_fields(ref))
-    if any(w in text for w in _REF_POLICY_WORDS):
-        return "policy"
-    if any(w in text for w in _REF_SECURITY_WORDS):
-        return "security"
-    if any(w in text for w in _REF_ACCEPTANCE_WORDS):
-        return "acceptance"
-    if any(w in text for w in _REF_CONTRACT_WORDS):
-        return "contract"
-    if any(w in text for w in _REF_TEST_WORDS):
-        return "test"
-    if any(w in text for w in _REF_POC_WORDS):
-        return "poc"
-    if any(w in text for w in _REF_MEETING_WORDS):
-        return "meeting"
-    return "other"
+    return _REF_MATCHER.first(text) or "other"
 
 
 def _matched_refs_in_paragraph(paragraph: str, references: Any) -> list[Any]:
@@ -1084,14 +1253,16 @@ def _matched_refs_in_paragraph(paragraph: str, references: Any) -> list[Any]:
     return hits
 
 
-def _claim_required_categories(paragraph: str, claim_level: str) -> set[str]:
-    if "签署" in paragraph or "意向书" in paragraph or "合同" in paragraph:
+def _claim_required_categories(paragraph: str, claim_level: str, hits: frozenset[str] | None = None) -> set[str]:
+    if hits is None:
+        hits = _CLAIM_MATCHER.hits(paragraph)
+    if "contract" in hits:
         return {"contract"}
-    if "验收" in paragraph or "UAT" in paragraph or "上线" in paragraph or "投产" in paragraph:
+    if "acceptance" in hits:
         return {"acceptance"}
-    if "等保" in paragraph or "安全" in paragraph or "渗透" in paragraph:
+    if "security" in hits:
         return {"security"}
-    if any(t in paragraph for t in _PERF_TERMS) and re.search(r"\d+\.?\d*", paragraph):
+    if "perf" in hits and _NUMBER_RE.search(paragraph):
         return {"test"}
     if claim_level == "B":
         return {"meeting", "poc", "test"}
@@ -1109,24 +1280,23 @@ def rule_strong_claim_requires_evidence(payload: Dict[str, Any]) -> RuleResult:
         for idx, p in enumerate(paragraphs):
             if _is_title_like_paragraph(p):
                 continue
+            hits = _CLAIM_MATCHER.hits(p)
             # Planned statements should not be treated as completed strong claims.
-            plan_tokens = ("计划", "拟", "预计", "将", "目标", "计划验证", "拟验证", "预计验证", "计划通过", "拟通过")
-            if any(t in p for t in plan_tokens):
+            if "plan" in hits:
                 continue
             has_done = bool(_DONE_RE.search(p))
             claim_level: str | None = None
-            if any(t in p for t in _CLAIM_A_TERMS):
+            if "claim_a" in hits:
                 claim_level = "A"
-            elif any(t in p for t in _CLAIM_B_TERMS):
+            elif "claim_b" in hits:
                 claim_level = "B"
             else:
-                has_number = bool(re.search(r"\d+\.?\d*", p))
-                has_perf = any(t in p for t in _PERF_TERMS)
-                has_claim_verb = any(t in p for t in _CLAIM_VERBS)
+                has_number = bool(_NUMBER_RE.search(p))
+                has_perf = "perf" in hits
+                has_claim_verb = "verb" in hits
                 # Only treat as strong claim if there is a completion verb.
                 # Requirement-style sentences (e.g., "应/需/必须/目标") should not be treated as completed claims.
-                requirement_tokens = ("应", "需", "必须", "要求", "目标", "计划", "拟", "预计")
-                has_requirement = any(t in p for t in requirement_tokens)
+                has_requirement = "requirement" in hits
                 if has_done and not has_requirement and ((has_perf and has_number) or has_claim_verb):
                     claim_level = "A"
 
@@ -1178,7 +1348,7 @@ def rule_strong_claim_requires_evidence(payload: Dict[str, Any]) -> RuleResult:
                 )
                 continue
 
-            required = _claim_required_categories(p, claim_level)
+            required = _claim_required_categories(p, claim_level, hits)
             acceptable = []
             for ref in matched:
                 cat = _ref_category(ref)
@@ -1370,55 +1540,51 @@ def rule_risk_trigger_threshold_consistency(payload: Dict[str, Any]) -> RuleResu
 
 
 _FORBIDDEN_SUBJECTIVE_WORDS = ("极其", "绝对", "最先进", "第一", "领先", "完美", "无与伦比")
+_SUBJECTIVE_MATCHER = TermMatcher({"subjective": _FORBIDDEN_SUBJECTIVE_WORDS})
+
+
+def _extract_numbers(data: Any, nums: set[str]) -> set[str]:
+    if isinstance(data, dict):
+        for v in data.values():
+            _extract_numbers(v, nums)
+    elif isinstance(data, list):
+        for v in data:
+            _extract_numbers(v, nums)
+    elif isinstance(data, (int, float)):
+        nums.add(str(data))
+    elif isinstance(data, str):
+        nums.update(_NUMBER_RE.findall(data))
+    return nums
 
 
-def compute_soft_metrics(ctx: PipelineContext) -> Dict[str, Any]:
-    llm_output = ctx.llm_output or {}
-    ledger = ctx.ledger or {}
-    
+def ledger_number_vocab(ledger: Dict[str, Any]) -> frozenset[str]:
+    # Numbers/date parts that appear anywhere in the ledger.
+    return frozenset(_extract_numbers(ledger, set()))
+
+
+def _soft_metrics(llm_output: Dict[str, Any], ledger_numbers: frozenset[str]) -> Dict[str, Any]:
     # 1. Subjective density (S1)
     subjective_hits = 0
     total_chars = 0
     total_paragraphs = 0
-    
+
     # 2. New number risk (S2)
-    # Extract numbers from ledger
-    def _extract_numbers(data: Any) -> set[str]:
-        nums = set()
-        if isinstance(data, dict):
-            for v in data.values():
-                nums.update(_extract_numbers(v))
-        elif isinstance(data, list):
-            for v in data:
-                nums.update(_extract_numbers(v))
-        elif isinstance(data, (int, float)):
-            nums.add(str(data))
-        elif isinstance(data, str):
-            # Find numbers in string
-            for n in re.findall(r"\d+\.?\d*", data):
-                nums.add(n)
-        return nums
-
-    ledger_numbers = _extract_numbers(ledger)
     new_number_hits = 0
-    
+
     for _, text in _iter_placeholder_texts(llm_output):
         total_chars += len(text)
-        paragraphs = text.split("\n\n")
-        total_paragraphs += len(paragraphs)
-        
+        total_paragraphs += text.count("\n\n") + 1
+
         # S1 count
-        for word in _FORBIDDEN_SUBJECTIVE_WORDS:
-            subjective_hits += text.count(word)
-        
+        subjective_hits += _SUBJECTIVE_MATCHER.count(text, "subjective")
+
         # S2 count
-        doc_numbers = re.findall(r"\d+\.?\d*", text)
-        for n in doc_numbers:
+        for n in _NUMBER_RE.findall(text):
             if n not in ledger_numbers:
                 new_number_hits += 1
-                
+
     char_count_k = total_chars / 1000.0 if total_chars > 0 else 1.0
-    
+
     return {
         "subjective_density_per_k": subjective_hits / char_count_k,
         "new_number_risk_per_k": new_number_hits / char_count_k,
@@ -1427,6 +1593,27 @@ def compute_soft_metrics(ctx: PipelineContext) -> Dict[str, Any]:
     }
 
 
+def compute_soft_metrics(ctx: PipelineContext, ledger_numbers: Optional[frozenset[str]] = None) -> Dict[str, Any]:
+    if ledger_numbers is None:
+        ledger_numbers = ledger_number_vocab(ctx.ledger or {})
+    return _soft_metrics(ctx.llm_output or {}, ledger_numbers)
+
+
+def compute_soft_metrics_batch(ctxs: Iterable[PipelineContext]) -> List[Dict[str, Any]]:
+    # The vocab is computed once per ledger object in the batch.
+    # Each entry keeps its ledger alive so the id cannot be reused by another ledger mid-batch.
+    vocab_by_id: Dict[int, tuple[Dict[str, Any], frozenset[str]]] = {}
+    results: List[Dict[str, Any]] = []
+    for ctx in ctxs:
+        ledger = ctx.ledger or {}
+        entry = vocab_by_id.get(id(ledger))
+        if entry is None or entry[0] is not ledger:
+            entry = (ledger, ledger_number_vocab(ledger))
+            vocab_by_id[id(ledger)] = entry
+        results.append(_soft_metrics(ctx.llm_output or {}, entry[1]))
+    return results
+
+
 RULES: List[Rule] = [
     Rule("LG1", Stage.LEDGER, "Ledger/时间窗口有效性", "error", rule_time_windows_valid),
     Rule("LG2", Stage.LEDGER, "Ledger/范围边界完整性", "error", rule_scope_boundary_minimum),
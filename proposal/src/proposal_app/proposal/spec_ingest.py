@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable
+
+from ..io.docx_markdown import docx_to_markdown
+from ..io.docx_text import docx_text
+from ..io.io_utils import collect_inputs
+from ..io.spec_cache import DOCX_MARKDOWN, DOCX_TEXT, PANDOC_GFM, PDF_TEXT, cached_spec_text, peek_spec_text
+from .spec_loader import _convert_docx_via_pandoc, parse_pdf
+
+logger = logging.getLogger(__name__)
+
+# Formats with a parsed-spec cache kind; .md/.txt specs are read directly and have nothing to warm.
+SPEC_SUFFIXES = (".docx", ".pdf")
+
+
+@dataclass
+class IngestRecord:
+    path: str
+    ok: bool
+    seconds: float
+    chars: int = 0
+    # True when the parsed-spec cache already held this file's conversion.
+    cached: bool = False
+    error: str = ""
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "path": self.path,
+            "ok": self.ok,
+            "ms": round(self.seconds * 1000.0, 3),
+            "chars": self.chars,
+            "cached": self.cached,
+            "error": self.error,
+        }
+
+
+@dataclass
+class IngestReport:
+    records: list[IngestRecord] = field(default_factory=list)
+    seconds: float = 0.0
+    workers: int = 1
+
+    @property
+    def failures(self) -> list[IngestRecord]:
+        return [r for r in self.records if not r.ok]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "files": len(self.records),
+            "failed": len(self.failures),
+            "cached": sum(1 for r in self.records if r.cached),
+            "workers": self.workers,
+            "elapsed_ms": round(self.seconds * 1000.0, 3),
+            "records": [r.to_dict() for r in self.records],
+        }
+
+
+def collect_specs(inputs: list[str]) -> list[Path]:
+    """Cacheable spec files (.docx/.pdf) under `inputs` (files or directories); Office lock files are skipped."""
+    return [
+        p
+        for p in collect_inputs(inputs)
+        if p.suffix.lower() in SPEC_SUFFIXES and not p.name.startswith("~$")
+    ]
+
+
+def _cache_kind(path: Path) -> str | None:
+    ext = path.suffix.lower()
+    if ext == ".pdf":
+        return PDF_TEXT
+    if ext == ".docx":
+        return PANDOC_GFM if os.getenv("PROPOSAL_DOCX_CONVERTER", "").strip().lower() == "pandoc" else DOCX_MARKDOWN
+    return None
+
+
+def _warm(path: Path, kind: str) -> str:
+    if kind == PDF_TEXT:
+        return parse_pdf(str(path))
+    if kind == PANDOC_GFM:
+        text = cached_spec_text(path, PANDOC_GFM, _convert_docx_via_pandoc)
+    else:
+        text = cached_spec_text(path, DOCX_MARKDOWN, docx_to_markdown)
+    # load_spec_text falls back to plain DOCX text when Markdown comes back empty.
+    return text or cached_spec_text(path, DOCX_TEXT, docx_text)
+
+
+def ingest_spec(path: str) -> IngestRecord:
+    """
+    Convert one spec into the parsed-spec cache under the kind the pipeline
+    reads. Nothing is written next to the spec.
+    """
+    start = perf_counter()
+    kind = _cache_kind(Path(path))
+    if kind is None:
+        return IngestRecord(path=path, ok=False, seconds=0.0, error="not cacheable (only .docx/.pdf specs are cached)")
+    try:
+        cached = peek_spec_text(Path(path), kind) is not None
+        text = _warm(Path(path), kind)
+    except Exception as exc:
+        return IngestRecord(path=path, ok=False, seconds=perf_counter() - start, error=f"{type(exc).__name__}: {exc}")
+    return IngestRecord(
+        path=path,
+        ok=bool(text.strip()),
+        seconds=perf_counter() - start,
+        chars=len(text),
+        cached=cached,
+        error="" if text.strip() else "empty text",
+    )
+
+
+def ingest_specs(
+    paths: list[str | Path],
+    *,
+    workers: int = 0,
+    on_record: Callable[[IngestRecord], None] | None = None,
+) -> IngestReport:
+    """
+    Convert many specs concurrently and populate the parsed-spec cache.
+
+    Each file is converted under the cache kind load_spec_text reads, so later
+    pipeline runs on the same content are cache hits. workers <= 1 converts in-process; otherwise a
+    process pool of that size is used (0 means one per CPU). A file that fails
+    is recorded with its error and does not stop the batch. Records come back
+    in input order; `on_record` is called as each one finishes.
+    """
+    items = [str(p) for p in paths]
+    workers = (os.cpu_count() or 1) if workers == 0 else workers
+    workers = max(1, min(workers, len(items) or 1))
+    report = IngestReport(workers=workers)
+    start = perf_counter()
+    done: dict[int, IngestRecord] = {}
+
+    if workers == 1:
+        for idx, item in enumerate(items):
+            done[idx] = ingest_spec(item)
+            if on_record:
+                on_record(done[idx])
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(ingest_spec, item): idx for idx, item in enumerate(items)}
+            for future in as_completed(futures):
+                idx = futures[future]
+                try:
+                    done[idx] = future.result()
+                except Exception as exc:
+                    # The worker itself died (e.g. BrokenProcessPool); no timing is available.
+                    done[idx] = IngestRecord(path=items[idx], ok=False, seconds=0.0, error=f"{type(exc).__name__}: {exc}")
+                if on_record:
+                    on_record(done[idx])
+
+    report.records = [done[idx] for idx in range(len(items))]
+    report.seconds = perf_counter() - start
+    return report
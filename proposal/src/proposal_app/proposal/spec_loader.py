@@ -1,27 +1,33 @@
 from __future__ import annotations
 
+import os
 import subprocess
 import tempfile
 from pathlib import Path
 from typing import Callable
 
 
-from .utils import read_text
+from ..io.docx_markdown import docx_to_markdown
+from ..io.docx_text import docx_text
+from ..io.mapped_text import MappedText
+from ..io.pdf_text import PdfStats, extract_pdf_text
+from ..io.spec_cache import DOCX_MARKDOWN, DOCX_TEXT, PANDOC_GFM, PDF_TEXT, cached_spec_text, peek_spec_text
 
 
-def load_spec_text(path: str) -> str:
+def load_spec_text(path: str, *, pdf_workers: int = 0, pdf_stats: PdfStats | None = None) -> str:
     lower = path.lower()
     if lower.endswith(".md") or lower.endswith(".txt"):
         return parse_md(path)
     if lower.endswith(".docx"):
         return parse_docx(path)
     if lower.endswith(".pdf"):
-        return parse_pdf(path)
+        return parse_pdf(path, workers=pdf_workers, stats=pdf_stats)
     raise ValueError(f"Unsupported spec format: {path}")
 
 
 def parse_md(path: str) -> str:
-    return read_text(path)
+    with MappedText(path) as mapped:
+        return mapped.text()
 
 
 def _require(module_name: str) -> Callable:
@@ -35,19 +41,35 @@ def parse_docx(path: str) -> str:
     return convert_docx_to_md(path)
 
 
+def _read_docx_markdown(path: str, max_chars: int = 40000) -> str:
+    """
+    DOCX as Markdown, converted in-process. Set PROPOSAL_DOCX_CONVERTER=pandoc
+    to use the pandoc binary instead.
+    """
+    if os.getenv("PROPOSAL_DOCX_CONVERTER", "").strip().lower() == "pandoc":
+        return _read_docx_via_pandoc(path, max_chars=max_chars)
+    try:
+        return cached_spec_text(Path(path), DOCX_MARKDOWN, docx_to_markdown)[:max_chars]
+    except Exception:
+        return ""
+
+
 def _read_docx_via_pandoc(path: str, max_chars: int = 40000) -> str:
+    return cached_spec_text(Path(path), PANDOC_GFM, _convert_docx_via_pandoc)[:max_chars]
+
+
+def _convert_docx_via_pandoc(path: Path) -> str:
     try:
         with tempfile.TemporaryDirectory() as tmp_dir:
             md_path = Path(tmp_dir) / "spec.md"
             result = subprocess.run(
-                ["pandoc", path, "-t", "gfm", "-o", str(md_path)],
+                ["pandoc", str(path), "-t", "gfm", "-o", str(md_path)],
                 capture_output=True,
                 text=True,
             )
             if result.returncode != 0:
                 return ""
-            content = md_path.read_text(encoding="utf-8")
-            return content[:max_chars]
+            return md_path.read_text(encoding="utf-8")
     except Exception:
         return ""
 
@@ -61,31 +83,33 @@ def _write_md(path: str, content: str) -> None:
 
 
 def convert_docx_to_md(path: str, max_chars: int = 40000) -> str:
-    text = _read_docx_via_pandoc(path, max_chars=max_chars)
+    text = _read_docx_markdown(path, max_chars=max_chars)
     if text:
         _write_md(path, text)
         return text
-    try:
-        from docx import Document
-    except Exception:  # pragma: no cover - import error path
-        _require("python-docx")()
-    doc = Document(path)
-    parts = [p.text for p in doc.paragraphs if p.text]
-    content = "\n".join(parts)
+    content = cached_spec_text(Path(path), DOCX_TEXT, docx_text)
     if content:
         _write_md(path, content)
     return content
 
 
-def parse_pdf(path: str) -> str:
+def parse_pdf(path: str, *, workers: int = 0, stats: PdfStats | None = None) -> str:
+    """
+    Full text of a PDF spec. workers > 1 extracts page ranges in a process
+    pool; `stats` receives page counts and throughput.
+    """
+    cached = peek_spec_text(Path(path), PDF_TEXT)
+    if cached is not None:
+        if stats is not None:
+            stats.from_cache = True
+            stats.chars = len(cached)
+        return cached
+    return cached_spec_text(Path(path), PDF_TEXT, lambda p: _pdf_text(p, workers, stats))
+
+
+def _pdf_text(path: Path, workers: int = 0, stats: PdfStats | None = None) -> str:
     try:
-        import pdfplumber
+        import pdfplumber  # noqa: F401
     except Exception:  # pragma: no cover - import error path
         _require("pdfplumber")()
-    parts: list[str] = []
-    with pdfplumber.open(path) as pdf:
-        for page in pdf.pages:
-            text = page.extract_text() or ""
-            if text:
-                parts.append(text)
-    return "\n".join(parts)
+    return extract_pdf_text(path, workers=workers, stats=stats)
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import re
+from typing import Iterable, Mapping
+
+try:
+    import ahocorasick
+except ModuleNotFoundError:
+    ahocorasick = None
+
+
+class TermMatcher:
+    # Compiled once per term table; reports every category hit in a paragraph with a single call.
+    # With pyahocorasick installed the whole table is one automaton scanned in C; otherwise each
+    # category is a longest-first alternation regex, which stops at the first hit.
+
+    def __init__(self, categories: Mapping[str, Iterable[str]]) -> None:
+        self.names: tuple[str, ...] = tuple(categories)
+        self._terms: dict[str, tuple[str, ...]] = {}
+        self._regexes: dict[str, re.Pattern[str]] = {}
+        for name, terms in categories.items():
+            uniq = tuple(sorted({t for t in terms if t}, key=len, reverse=True))
+            self._terms[name] = uniq
+            if uniq:
+                self._regexes[name] = re.compile("|".join(re.escape(t) for t in uniq))
+        self._automaton = self._build_automaton() if ahocorasick is not None else None
+
+    def _build_automaton(self) -> object | None:
+        term_cats: dict[str, set[str]] = {}
+        for name, terms in self._terms.items():
+            for term in terms:
+                term_cats.setdefault(term, set()).add(name)
+        if not term_cats:
+            return None
+        automaton = ahocorasick.Automaton()
+        for term, cats in term_cats.items():
+            automaton.add_word(term, frozenset(cats))
+        automaton.make_automaton()
+        return automaton
+
+    def hits(self, text: str) -> frozenset[str]:
+        if not text:
+            return frozenset()
+        if self._automaton is not None:
+            found: set[str] = set()
+            total = len(self._regexes)
+            for _, cats in self._automaton.iter(text):
+                found.update(cats)
+                if len(found) == total:
+                    break
+            return frozenset(found)
+        return frozenset(name for name, rx in self._regexes.items() if rx.search(text))
+
+    def count(self, text: str, name: str) -> int:
+        # Non-overlapping, leftmost-longest occurrences of the category's terms.
+        rx = self._regexes.get(name)
+        if not text or rx is None:
+            return 0
+        return sum(1 for _ in rx.finditer(text))
+
+    def first(self, text: str, order: Iterable[str] | None = None) -> str | None:
+        found = self.hits(text)
+        for name in order if order is not None else self.names:
+            if name in found:
+                return name
+        return None
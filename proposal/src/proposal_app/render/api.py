@@ -15,21 +15,25 @@ def render_docx_from_maps(
     Stable, single entrypoint for rendering:
     1) docxtpl render (layout/loops/blocks)
     2) placeholder fill (run-safe replacement)
+
+    Both stages work on the same in-memory document, so the DOCX is parsed
+    once and written once; unchanged zip members are copied from the template.
     """
-    from .docx_render import render_with_docxtpl
-    from .docx_fill import fill_docx
+    from .docx_render import render_docxtpl
+    from .docx_fill import fill_document
+    from .docx_package import save_docx
+    from .template_cache import template_bytes
 
     out = Path(out_path)
     out.parent.mkdir(parents=True, exist_ok=True)
 
-    tmp_path = out.with_suffix(out.suffix + ".tmp")
-    render_with_docxtpl(template_path, context, str(tmp_path))
-    fill_docx(str(tmp_path), placeholder_map, out_path)
-
-    try:
-        tmp_path.unlink(missing_ok=True)  # py>=3.8
-    except Exception:
-        pass
+    tpl = render_docxtpl(template_path, context)
+    fill_document(tpl.docx, placeholder_map)
+    # DocxTemplate.save() minus the doc.save() in the middle.
+    tpl.pre_processing()
+    save_docx(tpl.docx, out, template_bytes(template_path))
+    tpl.post_processing(str(out))
+    tpl.is_saved = True
 
 
 def render_docx_from_output(
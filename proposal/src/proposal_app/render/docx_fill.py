@@ -7,6 +7,11 @@ from typing import Any
 _BULLET_RE = re.compile(r"^\s*(?:- |\u2022 )(.+?)\s*$")
 _NUMBER_RE = re.compile(r"^\s*\d+(?:[.)]|、)\s+(.+?)\s*$")
 
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_R = _W_NS + "r"
+_W_T = _W_NS + "t"
+_XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+
 
 def _coerce_map(placeholder_map: dict[str, Any]) -> dict[str, str]:
     out: dict[str, str] = {}
@@ -20,14 +25,35 @@ def _coerce_map(placeholder_map: dict[str, Any]) -> dict[str, str]:
     return out
 
 
-def _replace_text(text: str, placeholder_map: dict[str, str]) -> str:
+class PlaceholderReplacer:
     """
-    Replace placeholders in a stable order (longest keys first).
+    Placeholder map compiled once per render into a single alternation regex.
+    Longest keys win at the same position; replaced values are not re-scanned.
     """
-    for key in sorted(placeholder_map.keys(), key=len, reverse=True):
-        if key in text:
-            text = text.replace(key, placeholder_map[key])
-    return text
+
+    def __init__(self, placeholder_map: dict[str, str]) -> None:
+        self.mapping = placeholder_map
+        keys = sorted((k for k in placeholder_map if k), key=len, reverse=True)
+        self.pattern = re.compile("|".join(re.escape(k) for k in keys)) if keys else None
+        # Every template key is "{{ ... }}"; when that holds, texts without "{{" are skipped outright.
+        self.marker = "{{" if keys and all("{{" in k for k in keys) else ""
+
+    def might_match(self, text: str) -> bool:
+        if not text or self.pattern is None:
+            return False
+        return not self.marker or self.marker in text
+
+    def replace(self, text: str) -> str:
+        if not self.might_match(text):
+            return text
+        mapping = self.mapping
+        return self.pattern.sub(lambda m: mapping[m.group(0)], text)
+
+
+def compile_placeholder_map(placeholder_map: dict[str, Any] | PlaceholderReplacer) -> PlaceholderReplacer:
+    if isinstance(placeholder_map, PlaceholderReplacer):
+        return placeholder_map
+    return PlaceholderReplacer(_coerce_map(placeholder_map))
 
 
 def _copy_paragraph_format(src, dst) -> None:
@@ -189,32 +215,44 @@ def _render_rich_text_into_paragraph(paragraph, value: str) -> None:
             cursor = _insert_paragraph_after(cursor, joined, style=None, template_paragraph=anchor)
 
 
-def replace_in_paragraph(paragraph, placeholder_map: dict[str, str]) -> None:
-    if not paragraph.runs:
-        if paragraph.text:
-            paragraph.text = _replace_text(paragraph.text, placeholder_map)
+def replace_in_paragraph(paragraph, placeholder_map: dict[str, str] | PlaceholderReplacer) -> None:
+    replacer = compile_placeholder_map(placeholder_map)
+    runs = paragraph.runs
+    if not runs:
+        text = paragraph.text
+        if replacer.might_match(text):
+            paragraph.text = replacer.replace(text)
         return
-    full_text = "".join(run.text for run in paragraph.runs)
-    replaced = _replace_text(full_text, placeholder_map)
+    full_text = "".join(run.text for run in runs)
+    if not replacer.might_match(full_text):
+        return
+    replaced = replacer.replace(full_text)
     if replaced == full_text:
         return
     # If the replacement introduces structure, render it as real paragraphs/lists.
     if "\n" in replaced:
         _render_rich_text_into_paragraph(paragraph, replaced)
         return
-    paragraph.runs[0].text = replaced
-    for run in paragraph.runs[1:]:
+    runs[0].text = replaced
+    for run in runs[1:]:
         run.text = ""
 
 
-def replace_in_table(table, placeholder_map: dict[str, str]) -> None:
+def replace_in_table(table, placeholder_map: dict[str, str] | PlaceholderReplacer) -> None:
+    replacer = compile_placeholder_map(placeholder_map)
+    seen: set = set()
     for row in table.rows:
         for cell in row.cells:
+            # Merged regions return the same w:tc for every grid position they span.
+            if cell._tc in seen:
+                continue
+            seen.add(cell._tc)
             for paragraph in cell.paragraphs:
-                replace_in_paragraph(paragraph, placeholder_map)
+                replace_in_paragraph(paragraph, replacer)
 
 
-def replace_in_header_footer(doc, placeholder_map: dict[str, str]) -> None:
+def replace_in_header_footer(doc, placeholder_map: dict[str, str] | PlaceholderReplacer) -> None:
+    placeholder_map = compile_placeholder_map(placeholder_map)
     for section in doc.sections:
         header = section.header
         footer = section.footer
@@ -228,11 +266,12 @@ def replace_in_header_footer(doc, placeholder_map: dict[str, str]) -> None:
             replace_in_table(table, placeholder_map)
 
 
-def _replace_in_part_xml(part, placeholder_map: dict[str, str]) -> None:
+def _replace_in_part_xml(part, placeholder_map: dict[str, str] | PlaceholderReplacer) -> None:
     """
     Fallback replacer for textboxes/shapes where python-docx doesn't expose
     a friendly paragraph API. This is plain text replacement (no list/paragraph insert).
     """
+    replacer = compile_placeholder_map(placeholder_map)
     element = part._element
     textbox_ps = element.xpath(".//w:txbxContent//w:p")
     for p in list(textbox_ps):
@@ -242,36 +281,99 @@ def _replace_in_part_xml(part, placeholder_map: dict[str, str]) -> None:
         full_text = "".join(t.text or "" for t in texts)
         if "{{" not in full_text or "}}" not in full_text:
             continue
-        replaced = _replace_text(full_text, placeholder_map)
+        replaced = replacer.replace(full_text)
+        if replaced == full_text:
+            continue
+        texts[0].text = replaced
+        for t in texts[1:]:
+            t.text = ""
+
+
+class _PartParent:
+    """
+    Minimal parent for Paragraph proxies built straight from lxml elements;
+    python-docx only needs `.part` to resolve styles.
+    """
+
+    def __init__(self, part) -> None:
+        self.part = part
+
+
+def _fill_element(root, replacer: PlaceholderReplacer, parent) -> None:
+    """
+    Fill every w:p under `root` at the lxml level.
+
+    Text is joined across the paragraph's direct runs so run-split placeholders
+    still match. A Paragraph proxy is only built when the replacement contains
+    line breaks and must be expanded by `_render_rich_text_into_paragraph`;
+    textbox paragraphs always get plain replacement.
+    """
+    if replacer.pattern is None:
+        return
+    query = ".//w:p[contains(string(.), '{{')]" if replacer.marker else ".//w:p"
+    candidates = root.xpath(query)
+    if not candidates:
+        return
+    textbox_ps = set(root.xpath(".//w:txbxContent//w:p"))
+    for p in candidates:
+        texts = [t for r in p.iterchildren(_W_R) for t in r.iterchildren(_W_T)]
+        if not texts:
+            continue
+        full_text = "".join(t.text or "" for t in texts)
+        if not replacer.might_match(full_text):
+            continue
+        replaced = replacer.replace(full_text)
         if replaced == full_text:
             continue
+        if "\n" in replaced and p not in textbox_ps:
+            from docx.text.paragraph import Paragraph
+
+            _render_rich_text_into_paragraph(Paragraph(p, parent), replaced)
+            continue
         texts[0].text = replaced
+        texts[0].set(_XML_SPACE, "preserve")
         for t in texts[1:]:
             t.text = ""
 
 
+def _story_parts(doc) -> list:
+    """
+    Main document part plus each distinct header/footer part. Sections that
+    link to a previous header share its part and are only filled once.
+    """
+    from docx.opc.constants import RELATIONSHIP_TYPE as RT
+
+    parts = [doc.part]
+    seen = {id(doc.part)}
+    for rel in doc.part.rels.values():
+        if rel.is_external or rel.reltype not in (RT.HEADER, RT.FOOTER):
+            continue
+        part = rel.target_part
+        if id(part) not in seen:
+            seen.add(id(part))
+            parts.append(part)
+    return parts
+
+
+def fill_document(doc, placeholder_map: dict[str, Any] | PlaceholderReplacer) -> None:
+    """
+    Fill placeholders in an already loaded python-docx Document in place:
+    body, tables, headers/footers and textboxes in one lxml pass per part.
+    """
+    replacer = compile_placeholder_map(placeholder_map)
+    for part in _story_parts(doc):
+        _fill_element(part.element, replacer, _PartParent(part))
+
+
 def fill_docx(template_path: str, placeholder_map: dict[str, Any], out_path: str) -> None:
     try:
-        from docx import Document
+        import docx  # noqa: F401
     except Exception as exc:  # pragma: no cover
         raise ImportError("Missing dependency: python-docx") from exc
 
-    placeholder_map_s = _coerce_map(placeholder_map)
-    doc = Document(template_path)
-
-    # 1) Normal document body (paragraphs + tables)
-    for paragraph in doc.paragraphs:
-        replace_in_paragraph(paragraph, placeholder_map_s)
-    for table in doc.tables:
-        replace_in_table(table, placeholder_map_s)
-
-    # 2) Header/Footer (paragraphs + tables)
-    replace_in_header_footer(doc, placeholder_map_s)
-
-    # 3) Textboxes / shapes via raw XML fallback
-    _replace_in_part_xml(doc.part, placeholder_map_s)
-    for section in doc.sections:
-        _replace_in_part_xml(section.header.part, placeholder_map_s)
-        _replace_in_part_xml(section.footer.part, placeholder_map_s)
+    from .docx_package import save_docx
+    from .template_cache import load_docx_template
 
-    doc.save(out_path)
+    doc, raw = load_docx_template(template_path)
+    fill_document(doc, placeholder_map)
+    save_docx(doc, out_path, raw)
@@ -1,14 +1,28 @@
 from __future__ import annotations
 
+import io
 from typing import Any
 
 
-def render_with_docxtpl(template_path: str, context: dict[str, Any], out_path: str) -> None:
+def render_docxtpl(template_path: str, context: dict[str, Any]):
+    """
+    Render a docxtpl template and return the rendered DocxTemplate without saving.
+    The underlying python-docx Document is available as `.docx`; it starts as a
+    copy of the process-wide parsed template.
+    """
     try:
         from docxtpl import DocxTemplate
     except Exception as exc:  # pragma: no cover
         raise ImportError("Missing dependency: docxtpl") from exc
 
-    doc = DocxTemplate(template_path)
+    from .template_cache import load_docx_template
+
+    document, raw = load_docx_template(template_path)
+    doc = DocxTemplate(io.BytesIO(raw))
+    doc.docx = document
     doc.render(context)
-    doc.save(out_path)
+    return doc
+
+
+def render_with_docxtpl(template_path: str, context: dict[str, Any], out_path: str) -> None:
+    render_docxtpl(template_path, context).save(out_path)
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import io
+import struct
+import zipfile
+from functools import lru_cache
+from typing import IO
+
+# Raw member copies reach into CPython's zipfile writer: ZipFile._lock,
+# _writecheck(), _didModify and start_dir, the same bookkeeping ZipFile.mkdir()
+# does. They are unchanged from CPython 3.10 through 3.13 (checked here on 3.11).
+# Callers check raw_copy_supported() first and recompress as usual when it is False.
+_INTERNALS = ("_lock", "_writecheck", "_didModify", "start_dir", "fp", "filelist", "NameToInfo")
+_LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+
+
+@lru_cache(maxsize=1)
+def raw_copy_supported() -> bool:
+    """True when this interpreter's ZipFile writer has the internals copy_raw uses."""
+    with zipfile.ZipFile(io.BytesIO(), "w") as zf:
+        return all(hasattr(zf, name) for name in _INTERNALS) and callable(getattr(zf, "_writecheck", None))
+
+
+def can_copy_raw(info: zipfile.ZipInfo) -> bool:
+    """Unencrypted stored/deflated members can be copied without recompressing."""
+    return not info.flag_bits & 0x1 and info.compress_type in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED)
+
+
+def copy_raw(src_fp: IO[bytes], src_info: zipfile.ZipInfo, zf: zipfile.ZipFile) -> None:
+    """Append a member to `zf` as its already-compressed bytes from the source archive."""
+    src_fp.seek(src_info.header_offset)
+    header = _LOCAL_HEADER.unpack(src_fp.read(_LOCAL_HEADER.size))
+    src_fp.seek(header[9] + header[10], 1)
+    data = src_fp.read(src_info.compress_size)
+
+    zinfo = zipfile.ZipInfo(src_info.filename, date_time=src_info.date_time)
+    zinfo.compress_type = src_info.compress_type
+    zinfo.CRC = src_info.CRC
+    zinfo.compress_size = src_info.compress_size
+    zinfo.file_size = src_info.file_size
+    zinfo.external_attr = src_info.external_attr
+    # Sizes are known up front, so no trailing data descriptor is written.
+    zinfo.flag_bits = src_info.flag_bits & ~0x08
+    with zf._lock:
+        zf.fp.seek(zf.start_dir)
+        zinfo.header_offset = zf.fp.tell()
+        zf._writecheck(zinfo)
+        zf._didModify = True
+        zf.filelist.append(zinfo)
+        zf.NameToInfo[zinfo.filename] = zinfo
+        zf.fp.write(zinfo.FileHeader(None))
+        zf.fp.write(data)
+        zf.start_dir = zf.fp.tell()
@@ -8,7 +8,9 @@ from typing import Any
 from proposal_app.core.input_flow import prompt_text
 from proposal_app.proposal.inputs import prompt_schedule_dates
 
+from .ingest import run_ingest
 from .pipeline import run_pipeline
+from .rules_bench import run_rules_bench
 
 
 def _load_run_config(path: str) -> dict[str, Any]:
@@ -86,6 +88,20 @@ def main() -> int:
     run_parser = subparsers.add_parser("run", help="Run the proposal pipeline")
     run_parser.add_argument("--run-config", required=True, help="Run config JSON path")
 
+    bench_parser = subparsers.add_parser("rules-bench", help="Replay saved debug outputs through the rules engine")
+    bench_parser.add_argument("paths", nargs="*", default=["debug"], help="Debug dirs containing ledger_output.json/llm_output.json")
+    bench_parser.add_argument("--stage", choices=["all", "ledger", "doc_post"], default="all", help="Rule stage to replay")
+    bench_parser.add_argument("--repeat", type=int, default=1, help="Replays per saved run")
+    bench_parser.add_argument("--executor", choices=["serial", "thread", "process"], default="serial", help="Rule executor")
+    bench_parser.add_argument("--workers", type=int, default=0, help="Pool size for thread/process executors")
+    bench_parser.add_argument("--soft-metrics", action="store_true", help="Also compute S1/S2 soft metrics per saved run")
+    bench_parser.add_argument("--json", action="store_true", help="Print rule_stats as JSON")
+
+    ingest_parser = subparsers.add_parser("ingest", help="Convert spec files/directories into the parsed-spec cache")
+    ingest_parser.add_argument("paths", nargs="+", help="Spec files or directories to scan")
+    ingest_parser.add_argument("--workers", type=int, default=0, help="Worker processes (0 = one per CPU, 1 = in-process)")
+    ingest_parser.add_argument("--json", action="store_true", help="Print the ingest report as JSON")
+
     args = parser.parse_args()
 
     if args.version:
@@ -118,6 +134,20 @@ def main() -> int:
             logging.getLogger(__name__).error("[Error] %s", exc)
             return 1
 
+    if args.command == "rules-bench":
+        try:
+            return run_rules_bench(args)
+        except Exception as exc:
+            logging.getLogger(__name__).error("[Error] %s", exc)
+            return 1
+
+    if args.command == "ingest":
+        try:
+            return run_ingest(args)
+        except Exception as exc:
+            logging.getLogger(__name__).error("[Error] %s", exc)
+            return 1
+
     parser.print_help()
     return 1
 
@@ -33,8 +33,11 @@ from proposal_app.proposal.ledger_mapping import build_ledger_scope
 from proposal_app.proposal.postprocess import postprocess_llm_output
 from proposal_app.proposal.table_generators import build_milestones_table, build_risk_register_table
 from proposal_app.proposal.rules_engine import (
+    Issue,
     PipelineContext,
     RULES,
+    RuleExecutor,
+    RuleStats,
     Stage,
     compute_soft_metrics,
     run_rules,
@@ -67,6 +70,26 @@ MAX_GATE_REPAIR = 2
 MAX_REWRITE = 2
 
 
+def _run_rules_profiled(
+    ctx: PipelineContext,
+    stage: Stage,
+    metrics: dict[str, Any],
+    rule_executor: RuleExecutor,
+    rule_workers: int | None,
+    rule_stats: bool = False,
+) -> list[Issue]:
+    # Per-rule wall time is always recorded; the detailed RuleStats dump is opt-in.
+    timings = dict(metrics.get("rule_wall_ms") or {})
+    stats = RuleStats.from_dict(metrics.get("rule_stats")) if rule_stats else None
+    issues = run_rules(
+        ctx, RULES, stage, executor=rule_executor, max_workers=rule_workers, stats=stats, timings=timings
+    )
+    metrics["rule_wall_ms"] = timings
+    if stats is not None:
+        metrics["rule_stats"] = stats.to_dict()
+    return issues
+
+
 def _norm_placeholder_key(key: str) -> str:
     s = key.strip()
     if s.startswith("placeholders."):
@@ -421,7 +444,12 @@ def _generate_node(final_runtime: LLMRuntime) -> Callable[[ProposalState], dict[
     return _node
 
 
-def _gate_node(ledger_runtime: LLMRuntime) -> Callable[[ProposalState], dict[str, Any]]:
+def _gate_node(
+    ledger_runtime: LLMRuntime,
+    rule_executor: RuleExecutor,
+    rule_workers: int | None,
+    rule_stats: bool = False,
+) -> Callable[[ProposalState], dict[str, Any]]:
     def _node(state: ProposalState) -> dict[str, Any]:
         logger.info("[Step] Ledger gate")
         ledger = state.get("ledger", {})
@@ -442,7 +470,7 @@ def _gate_node(ledger_runtime: LLMRuntime) -> Callable[[ProposalState], dict[str
                 ledger=ledger if isinstance(ledger, dict) else {},
                 metadata={"manual_inputs": manual_inputs} if isinstance(manual_inputs, dict) else {},
             )
-            issues = run_rules(ctx, RULES, Stage.LEDGER)
+            issues = _run_rules_profiled(ctx, Stage.LEDGER, metrics, rule_executor, rule_workers, rule_stats)
             logger.info("[Gate] round=%s issues=%s", rounds, len(issues))
             
             if not first_pass_checked:
@@ -479,7 +507,12 @@ def _gate_node(ledger_runtime: LLMRuntime) -> Callable[[ProposalState], dict[str
     return _node
 
 
-def _post_lint_node(final_runtime: LLMRuntime) -> Callable[[ProposalState], dict[str, Any]]:
+def _post_lint_node(
+    final_runtime: LLMRuntime,
+    rule_executor: RuleExecutor,
+    rule_workers: int | None,
+    rule_stats: bool = False,
+) -> Callable[[ProposalState], dict[str, Any]]:
     def _node(state: ProposalState) -> dict[str, Any]:
         logger.info("[Step] Post lint & rewrite")
         ledger = state.get("ledger", {})
@@ -500,7 +533,7 @@ def _post_lint_node(final_runtime: LLMRuntime) -> Callable[[ProposalState], dict
             metrics["rewrite_rounds"] = rounds
 
             ctx = PipelineContext(ledger=ledger if isinstance(ledger, dict) else {}, llm_output=llm_output)
-            issues = run_rules(ctx, RULES, Stage.DOC_POST)
+            issues = _run_rules_profiled(ctx, Stage.DOC_POST, metrics, rule_executor, rule_workers, rule_stats)
             logger.info("[Rewrite] round=%s issues=%s", rounds, len(issues))
             
             if not first_pass_checked:
@@ -762,7 +795,11 @@ def _missing_patch_node(final_runtime: LLMRuntime) -> Callable[[ProposalState],
     return _node
 
 
-def _metrics_node() -> Callable[[ProposalState], dict[str, Any]]:
+def _metrics_node(
+    rule_executor: RuleExecutor,
+    rule_workers: int | None,
+    rule_stats: bool = False,
+) -> Callable[[ProposalState], dict[str, Any]]:
     def _node(state: ProposalState) -> dict[str, Any]:
         ledger = state.get("ledger", {})
         llm_output = state.get("llm_output", {})
@@ -773,7 +810,7 @@ def _metrics_node() -> Callable[[ProposalState], dict[str, Any]]:
         metrics.update(soft)
         
         # Final issues check for Hard Gate (L0)
-        final_issues = run_rules(ctx, RULES, Stage.DOC_POST)
+        final_issues = _run_rules_profiled(ctx, Stage.DOC_POST, metrics, rule_executor, rule_workers, rule_stats)
         metrics["final_issues_by_rule"] = {}
         for it in final_issues:
             metrics["final_issues_by_rule"][it.rule_id] = metrics["final_issues_by_rule"].get(it.rule_id, 0) + 1
@@ -788,11 +825,16 @@ def build_graph(
     final_runtime: LLMRuntime,
     section_chunks: list[list[str]] | None = None,
     table_chunks: list[list[str]] | None = None,
+    rule_executor: RuleExecutor | str = RuleExecutor.SERIAL,
+    rule_workers: int | None = None,
+    rule_stats: bool = False,
 ) -> StateGraph:
     graph = StateGraph(ProposalState)
+    rule_executor = RuleExecutor(rule_executor)
+    rule_workers = rule_workers or None
 
     graph.add_node("ledger", _ledger_node(ledger_runtime))
-    graph.add_node("gate", _gate_node(ledger_runtime))
+    graph.add_node("gate", _gate_node(ledger_runtime, rule_executor, rule_workers, rule_stats))
     section_chunks = section_chunks or []
     table_chunks = table_chunks or []
     section_nodes: list[str] = []
@@ -809,10 +851,10 @@ def build_graph(
         graph.add_node("merge_sections", _merge_sections_node())
     else:
         graph.add_node("generate", _generate_node(final_runtime))
-    graph.add_node("post_lint", _post_lint_node(final_runtime))
+    graph.add_node("post_lint", _post_lint_node(final_runtime, rule_executor, rule_workers, rule_stats))
     graph.add_node("complete", _complete_node(final_runtime))
     graph.add_node("missing_patch", _missing_patch_node(final_runtime))
-    graph.add_node("metrics", _metrics_node())
+    graph.add_node("metrics", _metrics_node(rule_executor, rule_workers, rule_stats))
     
     graph.add_edge("ledger", "gate")
     if section_nodes or table_nodes:
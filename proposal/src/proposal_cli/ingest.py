@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any
+
+from proposal_app.proposal.spec_ingest import IngestRecord, collect_specs, ingest_specs
+
+logger = logging.getLogger(__name__)
+
+
+def _log_record(record: IngestRecord) -> None:
+    if record.ok:
+        logger.info(
+            "[Ingest] ok %8.1f ms %7s chars%s %s",
+            record.seconds * 1000.0,
+            record.chars,
+            " (cached)" if record.cached else "",
+            record.path,
+        )
+    else:
+        logger.warning("[Ingest] FAILED %s: %s", record.path, record.error)
+
+
+def run_ingest(args: Any) -> int:
+    paths = list(getattr(args, "paths", None) or [])
+    specs = collect_specs(paths)
+    if not specs:
+        logger.error("[Error] No cacheable spec files (.docx/.pdf) found under: %s", ", ".join(paths))
+        return 2
+    as_json = getattr(args, "json", False)
+    report = ingest_specs(
+        specs,
+        workers=int(getattr(args, "workers", 0) or 0),
+        on_record=None if as_json else _log_record,
+    )
+    if as_json:
+        print(json.dumps(report.to_dict(), ensure_ascii=False, indent=2))
+    else:
+        summary = report.to_dict()
+        logger.info(
+            "[Info] Ingested %s spec(s) in %.1f ms with %s worker(s): %s cached, %s failed",
+            summary["files"],
+            summary["elapsed_ms"],
+            summary["workers"],
+            summary["cached"],
+            summary["failed"],
+        )
+    return 1 if report.failures else 0
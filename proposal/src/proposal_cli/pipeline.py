@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import Any
 
 from proposal_app.config import AppConfig, load_config, load_dotenv
+from proposal_app.io.pdf_text import PdfStats
 from proposal_app.llm.api import translate_to_english
 from proposal_app.llm.client import LLMRuntime, init_llm
 from proposal_app.proposal.cluster_defs import PLACEHOLDER_FIELDS, TABLE_MIN_SPECS
@@ -110,9 +111,9 @@ def _extract_required_placeholders(template_path: Path) -> list[str]:
 
     seq: list[str] = []
     try:
-        from docx import Document
+        from proposal_app.render.template_cache import load_docx_template
 
-        doc = Document(str(template_path))
+        doc, _ = load_docx_template(template_path, readonly=True)
         for text in _iter_paragraph_texts(doc):
             for m in _PLACEHOLDER_RE.finditer(text):
                 tag = _norm(m.group(0))
@@ -211,13 +212,13 @@ def _extract_placeholder_sections_by_heading(template_path: Path) -> list[list[s
             ended = True
 
     try:
-        from docx import Document
         from docx.oxml.table import CT_Tbl
         from docx.oxml.text.paragraph import CT_P
         from docx.table import Table
         from docx.text.paragraph import Paragraph
+        from proposal_app.render.template_cache import load_docx_template
 
-        doc = Document(str(template_path))
+        doc, _ = load_docx_template(template_path, readonly=True)
 
         def _iter_blocks(parent: Any) -> list[tuple[str, Any]]:
             out: list[tuple[str, Any]] = []
@@ -518,6 +519,14 @@ def _print_metrics_summary(metrics: dict[str, Any]) -> None:
         final_issues.get("R7", 0),
     )
     
+    rule_stats = metrics.get("rule_stats", {})
+    if isinstance(rule_stats, dict) and rule_stats:
+        slowest = sorted(rule_stats.items(), key=lambda kv: kv[1].get("total_ms", 0.0), reverse=True)[:3]
+        logger.info(
+            "Rule Time (Top 3): %s",
+            ", ".join(f"{rule_id}={item.get('total_ms', 0.0):.1f}ms" for rule_id, item in slowest),
+        )
+
     has_l0_fail = any(final_issues.get(r, 0) > 0 for r in ["R4", "R5", "R6", "R7"])
     logger.info("Final L0 Status:  %s", "FAIL" if has_l0_fail else "PASS")
         
@@ -586,6 +595,7 @@ def run_pipeline(args: Any) -> dict[str, Any]:
     manual_inputs: dict[str, Any] = {}
     stage = "init"
     error_info: dict[str, Any] | None = None
+    spec_stats: PdfStats | None = None
 
     try:
         stage = "load_config"
@@ -596,7 +606,9 @@ def run_pipeline(args: Any) -> dict[str, Any]:
         runtime, ledger_runtime, final_runtime = _init_runtimes(app_config, args)
 
         stage = "load_spec"
-        spec_text = load_spec_text(args.spec)
+        if str(args.spec).lower().endswith(".pdf"):
+            spec_stats = PdfStats()
+        spec_text = load_spec_text(args.spec, pdf_workers=app_config.proposal.pdf_workers, pdf_stats=spec_stats)
         manual_inputs = _load_manual_inputs(args, app_config, runtime)
 
         stage = "prepare_placeholders"
@@ -659,6 +671,9 @@ def run_pipeline(args: Any) -> dict[str, Any]:
             final_runtime=final_runtime,
             section_chunks=placeholder_chunks,
             table_chunks=gen_table_chunks,
+            rule_executor=app_config.proposal.rules_executor,
+            rule_workers=app_config.proposal.rules_workers,
+            rule_stats=app_config.proposal.rule_stats,
         )
         compiled = graph.compile()
         # Required tables = template table order + TABLE_MIN_SPECS keys (base set)
@@ -730,4 +745,6 @@ def run_pipeline(args: Any) -> dict[str, Any]:
             safe_metrics = metrics if isinstance(metrics, dict) else {}
             if error_info:
                 safe_metrics.setdefault("error", error_info)
+            if spec_stats is not None:
+                safe_metrics.setdefault("spec_load", spec_stats.to_dict())
             _write_debug(debug_dir, safe_llm_output, safe_placeholder_map, safe_ledger, safe_metrics)
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any
+
+from proposal_app.proposal.rules_engine import (
+    PipelineContext,
+    RULES,
+    RuleExecutor,
+    RuleStats,
+    Stage,
+    compute_soft_metrics_batch,
+    run_rules,
+)
+
+logger = logging.getLogger(__name__)
+
+_LEDGER_FILE = "ledger_output.json"
+_LLM_OUTPUT_FILE = "llm_output.json"
+
+
+def _load_json(path: Path) -> dict[str, Any]:
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return data if isinstance(data, dict) else {}
+
+
+def find_debug_runs(paths: list[str]) -> list[Path]:
+    runs: list[Path] = []
+    seen: set[Path] = set()
+    for raw in paths:
+        root = Path(raw).expanduser()
+        if root.is_file():
+            root = root.parent
+        if not root.is_dir():
+            continue
+        candidates = [root] if (root / _LEDGER_FILE).exists() else []
+        candidates.extend(sorted(p.parent for p in root.rglob(_LEDGER_FILE) if p.parent != root))
+        for run_dir in candidates:
+            resolved = run_dir.resolve()
+            if resolved in seen:
+                continue
+            seen.add(resolved)
+            runs.append(run_dir)
+    return runs
+
+
+def replay_runs(
+    run_dirs: list[Path],
+    *,
+    stages: tuple[Stage, ...] = (Stage.LEDGER, Stage.DOC_POST),
+    repeat: int = 1,
+    executor: RuleExecutor | str = RuleExecutor.SERIAL,
+    max_workers: int | None = None,
+) -> tuple[RuleStats, float]:
+    stats = RuleStats()
+    start = time.perf_counter()
+    for run_dir in run_dirs:
+        ledger = _load_json(run_dir / _LEDGER_FILE)
+        llm_output = _load_json(run_dir / _LLM_OUTPUT_FILE)
+        for stage in stages:
+            ctx = PipelineContext(
+                ledger=ledger,
+                llm_output=llm_output if stage == Stage.DOC_POST else None,
+            )
+            for _ in range(max(1, repeat)):
+                run_rules(ctx, RULES, stage, executor=executor, max_workers=max_workers, stats=stats)
+    return stats, time.perf_counter() - start
+
+
+def soft_metrics_for_runs(run_dirs: list[Path]) -> list[dict[str, Any]]:
+    ctxs = [
+        PipelineContext(ledger=_load_json(run_dir / _LEDGER_FILE), llm_output=_load_json(run_dir / _LLM_OUTPUT_FILE))
+        for run_dir in run_dirs
+    ]
+    return [{"run": str(run_dir), **soft} for run_dir, soft in zip(run_dirs, compute_soft_metrics_batch(ctxs))]
+
+
+def format_profile(stats: RuleStats) -> list[str]:
+    rows = sorted(stats.to_dict().items(), key=lambda kv: kv[1]["total_ms"], reverse=True)
+    grand_total = sum(item["total_ms"] for _, item in rows) or 1.0
+    lines = [
+        f"{'rule':<6} {'stage':<9} {'calls':>6} {'fail':>6} {'issues':>7} "
+        f"{'total ms':>10} {'share':>6} {'mean ms':>9} {'max ms':>9} {'avg kchr':>8}"
+    ]
+    for rule_id, item in rows:
+        calls = item["calls"] or 1
+        lines.append(
+            f"{rule_id:<6} {item['stage']:<9} {item['calls']:>6} {item['failures']:>6} {item['issues']:>7} "
+            f"{item['total_ms']:>10.2f} {item['total_ms'] / grand_total:>6.1%} {item['mean_ms']:>9.3f} "
+            f"{item['max_ms']:>9.3f} {item['payload_chars'] / calls / 1024:>8.1f}"
+        )
+    return lines
+
+
+def run_rules_bench(args: Any) -> int:
+    run_dirs = find_debug_runs(list(getattr(args, "paths", None) or ["debug"]))
+    if not run_dirs:
+        logger.error("[Error] No %s found under: %s", _LEDGER_FILE, ", ".join(getattr(args, "paths", None) or ["debug"]))
+        return 2
+    stage_arg = getattr(args, "stage", "all")
+    stages = (Stage.LEDGER, Stage.DOC_POST) if stage_arg == "all" else (Stage(stage_arg),)
+    stats, elapsed = replay_runs(
+        run_dirs,
+        stages=stages,
+        repeat=int(getattr(args, "repeat", 1) or 1),
+        executor=getattr(args, "executor", RuleExecutor.SERIAL.value),
+        max_workers=int(getattr(args, "workers", 0) or 0) or None,
+    )
+    soft = soft_metrics_for_runs(run_dirs) if getattr(args, "soft_metrics", False) else []
+    if getattr(args, "json", False):
+        report: dict[str, Any] = {"runs": len(run_dirs), "elapsed_ms": round(elapsed * 1000.0, 3), "rule_stats": stats.to_dict()}
+        if soft:
+            report["soft_metrics"] = soft
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return 0
+    logger.info("[Info] Replayed %s run(s) in %.1f ms", len(run_dirs), elapsed * 1000.0)
+    for line in format_profile(stats):
+        logger.info("%s", line)
+    for item in soft:
+        logger.info(
+            "[Soft] %s S1=%.2f/k S2=%.2f/k chars=%s",
+            item["run"],
+            item["subjective_density_per_k"],
+            item["new_number_risk_per_k"],
+            item["doc_char_count"],
+        )
+    return 0
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from proposal_app.render.docx_fill import (
+    compile_placeholder_map,
+    fill_docx,
+    fill_document,
+    replace_in_header_footer,
+    replace_in_paragraph,
+    replace_in_table,
+)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="bench-docx-fill")
+    parser.add_argument("--paragraphs", type=int, default=5000, help="Body paragraphs in the synthetic template")
+    parser.add_argument("--keys", type=int, default=300, help="Placeholder keys in the map")
+    parser.add_argument("--tables", type=int, default=20, help="3x4 tables with placeholders")
+    parser.add_argument("--seed", type=int, default=7)
+    return parser
+
+
+def _naive_replace(text: str, placeholder_map: dict[str, str]) -> str:
+    # Previous behaviour: sort the whole map per paragraph, one str.replace per key.
+    for key in sorted(placeholder_map.keys(), key=len, reverse=True):
+        if key in text:
+            text = text.replace(key, placeholder_map[key])
+    return text
+
+
+def _proxy_fill(doc, replacer) -> None:
+    # Walk through python-docx wrappers, the way fill_docx did before the lxml engine.
+    for paragraph in doc.paragraphs:
+        replace_in_paragraph(paragraph, replacer)
+    for table in doc.tables:
+        replace_in_table(table, replacer)
+    replace_in_header_footer(doc, replacer)
+
+
+def _make_texts(paragraphs: int, keys: list[str], rng: random.Random) -> list[str]:
+    texts: list[str] = []
+    for idx in range(paragraphs):
+        if idx % 4 == 0:
+            texts.append(f"第{idx}段：{rng.choice(keys)}，以及{rng.choice(keys)}。")
+        else:
+            texts.append(f"第{idx}段正文内容，说明系统建设目标与实施路径。")
+    return texts
+
+
+def _build_template(path: Path, texts: list[str], keys: list[str], tables: int, rng: random.Random) -> None:
+    from docx import Document
+
+    doc = Document()
+    doc.sections[0].header.paragraphs[0].text = f"页眉 {keys[0]}"
+    for text in texts:
+        doc.add_paragraph(text)
+    for _ in range(tables):
+        table = doc.add_table(rows=3, cols=4)
+        for row in table.rows:
+            for cell in row.cells:
+                cell.text = rng.choice(keys)
+    doc.save(str(path))
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    rng = random.Random(args.seed)
+    keys = [f"{{{{ field_{i:04d} }}}}" for i in range(args.keys)]
+    placeholder_map = {k: f"值{i}" for i, k in enumerate(keys)}
+    texts = _make_texts(args.paragraphs, keys, rng)
+
+    start = time.perf_counter()
+    naive = [_naive_replace(t, placeholder_map) for t in texts]
+    naive_s = time.perf_counter() - start
+    start = time.perf_counter()
+    replacer = compile_placeholder_map(placeholder_map)
+    compiled = [replacer.replace(t) for t in texts]
+    compiled_s = time.perf_counter() - start
+    print(f"[Info] paragraphs={args.paragraphs} keys={args.keys} tables={args.tables}")
+    print(f"[Text] sorted str.replace: {naive_s * 1000:.1f} ms")
+    print(f"[Text] compiled regex:     {compiled_s * 1000:.1f} ms ({naive_s / compiled_s if compiled_s else 0:.1f}x)")
+    if naive != compiled:
+        print("[FAIL] compiled output differs from sorted str.replace")
+        return 1
+
+    try:
+        import docx  # noqa: F401
+    except ModuleNotFoundError:
+        print("[Warn] python-docx not installed; skipping end-to-end fill_docx timing")
+        return 0
+    from docx import Document
+
+    with tempfile.TemporaryDirectory() as tmp:
+        template = Path(tmp) / "template.docx"
+        out = Path(tmp) / "out.docx"
+        _build_template(template, texts, keys, args.tables, rng)
+
+        doc = Document(str(template))
+        start = time.perf_counter()
+        _proxy_fill(doc, replacer)
+        proxy_s = time.perf_counter() - start
+        doc = Document(str(template))
+        start = time.perf_counter()
+        fill_document(doc, replacer)
+        xml_s = time.perf_counter() - start
+        print(f"[Fill] python-docx proxies: {proxy_s * 1000:.1f} ms")
+        print(f"[Fill] lxml engine:         {xml_s * 1000:.1f} ms ({proxy_s / xml_s if xml_s else 0:.1f}x)")
+
+        start = time.perf_counter()
+        fill_docx(str(template), placeholder_map, str(out))
+        print(f"[Docx] fill_docx (load + fill + save): {(time.perf_counter() - start) * 1000:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import argparse
+import random
+import struct
+import sys
+import tempfile
+import time
+import zlib
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from proposal_app.render.docx_package import save_docx
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="bench-docx-save")
+    parser.add_argument("--images", type=int, default=20, help="Embedded images in the synthetic template")
+    parser.add_argument("--size", type=int, default=512, help="Image edge in pixels (noise, barely compressible)")
+    parser.add_argument("--paragraphs", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    return parser
+
+
+def _noise_png(rng: random.Random, size: int) -> bytes:
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    raw = b"".join(b"\x00" + rng.randbytes(size * 3) for _ in range(size))
+    ihdr = struct.pack(">IIBBBBB", size, size, 8, 2, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", ihdr) + chunk(b"IDAT", zlib.compress(raw, 1)) + chunk(b"IEND", b"")
+
+
+def _build_template(path: Path, args: argparse.Namespace) -> None:
+    import io
+
+    from docx import Document
+    from docx.shared import Cm
+
+    rng = random.Random(args.seed)
+    doc = Document()
+    for idx in range(args.paragraphs):
+        doc.add_paragraph(f"第{idx}段正文 {{{{ field_{idx % 50} }}}}")
+    for _ in range(args.images):
+        doc.add_picture(io.BytesIO(_noise_png(rng, args.size)), width=Cm(4))
+    doc.save(str(path))
+
+
+def _best(fn, rounds: int) -> float:
+    samples: list[float] = []
+    for _ in range(max(1, rounds)):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return min(samples)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    try:
+        from docx import Document
+    except ModuleNotFoundError:
+        print("[Warn] python-docx not installed; nothing to benchmark")
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        template = Path(tmp) / "template.docx"
+        _build_template(template, args)
+        doc = Document(str(template))
+        doc.paragraphs[0].text = "已修改"
+        full_ms = _best(lambda: doc.save(str(Path(tmp) / "full.docx")), args.rounds)
+        counts: list[tuple[int, int]] = []
+        pass_ms = _best(lambda: counts.append(save_docx(doc, Path(tmp) / "pass.docx", template)), args.rounds)
+        copied, written = counts[-1]
+        print(f"[Info] template={template.stat().st_size / 1e6:.1f} MB images={args.images} paragraphs={args.paragraphs}")
+        print(f"[Save] doc.save:    {full_ms:.1f} ms")
+        print(f"[Save] passthrough: {pass_ms:.1f} ms ({full_ms / pass_ms if pass_ms else 0:.1f}x, copied={copied} rewritten={written})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
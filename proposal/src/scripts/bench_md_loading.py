@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from proposal_app.io.mapped_text import MappedText
+
+_METHODS = ("read_text", "mapped-text", "mapped-head")
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="bench-md-loading")
+    parser.add_argument("files", nargs="*", help="Markdown specs (default: a synthetic one)")
+    parser.add_argument("--mb", type=float, default=40.0, help="Size of the synthetic spec")
+    parser.add_argument("--max-chars", type=int, default=50000)
+    parser.add_argument("--run", nargs=2, metavar=("METHOD", "FILE"), help=argparse.SUPPRESS)
+    return parser
+
+
+def _peak_mb() -> float:
+    # VmHWM resets on exec, unlike ru_maxrss.
+    for line in Path("/proc/self/status").read_text().splitlines():
+        if line.startswith("VmHWM:"):
+            return int(line.split()[1]) / 1024.0
+    return 0.0
+
+
+def _synthetic(path: Path, mb: float) -> None:
+    rng = random.Random(7)
+    target = int(mb * 1024 * 1024)
+    size = 0
+    with open(path, "w", encoding="utf-8") as f:
+        idx = 0
+        while size < target:
+            line = f"## {idx} 功能模块\n" if idx % 40 == 0 else "系统支持数据采集、校验与统计分析。" * rng.randint(1, 12) + "\n"
+            f.write(line)
+            size += len(line.encode("utf-8"))
+            idx += 1
+
+
+def _run_one(method: str, path: Path, max_chars: int) -> dict:
+    base = _peak_mb()
+    start = time.perf_counter()
+    if method == "read_text":
+        chars = len(path.read_text(encoding="utf-8"))
+    elif method == "mapped-text":
+        with MappedText(path) as mapped:
+            chars = len(mapped.text())
+    else:
+        with MappedText(path) as mapped:
+            chars = len(mapped.head(max_chars))
+    return {"ms": (time.perf_counter() - start) * 1000.0, "peak_mb": _peak_mb() - base, "chars": chars}
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    if args.run:
+        print(json.dumps(_run_one(args.run[0], Path(args.run[1]), args.max_chars)))
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        files = [Path(f).expanduser() for f in args.files]
+        if not files:
+            synthetic = Path(tmp) / "synthetic_spec.md"
+            _synthetic(synthetic, args.mb)
+            files.append(synthetic)
+
+        print(f"{'file':<24} {'MB':>7} {'method':<13} {'ms':>9} {'peak MB':>9} {'chars':>10}")
+        for path in files:
+            for method in _METHODS:
+                out = subprocess.run(
+                    [sys.executable, __file__, "--max-chars", str(args.max_chars), "--run", method, str(path)],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                )
+                row = json.loads(out.stdout.strip().splitlines()[-1])
+                print(
+                    f"{path.name[:24]:<24} {path.stat().st_size / 1e6:>7.1f} {method:<13} "
+                    f"{row['ms']:>9.1f} {row['peak_mb']:>9.1f} {row['chars']:>10}"
+                )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from proposal_app.io.pdf_text import PdfStats, extract_pdf_text
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="bench-pdf-text")
+    parser.add_argument("files", nargs="*", help="PDF files (default: a synthetic spec, needs reportlab)")
+    parser.add_argument("--pages", type=int, default=120, help="Pages in the synthetic spec")
+    parser.add_argument("--max-chars", type=int, default=40000, help="Budget for the early-stop run")
+    parser.add_argument("--workers", type=int, default=4, help="Process pool size for the parallel run")
+    return parser
+
+
+def _synthetic_pdf(path: Path, pages: int) -> None:
+    from reportlab.lib.pagesizes import A4
+    from reportlab.pdfgen import canvas
+
+    c = canvas.Canvas(str(path), pagesize=A4)
+    for page in range(pages):
+        y = 800
+        for line in range(50):
+            c.drawString(40, y, f"Section {page + 1}.{line + 1} The system stores records and validates each field on save.")
+            y -= 15
+        c.showPage()
+    c.save()
+
+
+def _run(path: Path, **kwargs) -> tuple[str, PdfStats, float]:
+    stats = PdfStats()
+    start = time.perf_counter()
+    text = extract_pdf_text(path, stats=stats, **kwargs)
+    return text, stats, (time.perf_counter() - start) * 1000.0
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    failures = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        files = [Path(f).expanduser() for f in args.files]
+        if not files:
+            synthetic = Path(tmp) / "synthetic_spec.pdf"
+            _synthetic_pdf(synthetic, args.pages)
+            files.append(synthetic)
+
+        print(f"{'file':<32} {'mode':<10} {'pages':>9} {'chars':>9} {'ms':>9} {'pages/s':>9}")
+        for path in files:
+            full, full_stats, full_ms = _run(path)
+            budget, budget_stats, budget_ms = _run(path, max_chars=args.max_chars)
+            parallel, parallel_stats, parallel_ms = _run(path, workers=args.workers)
+            for mode, stats, ms in (
+                ("full", full_stats, full_ms),
+                ("budget", budget_stats, budget_ms),
+                (f"parallel{parallel_stats.workers}", parallel_stats, parallel_ms),
+            ):
+                pages = f"{stats.pages_read}/{stats.pages_total}"
+                print(f"{path.name[:32]:<32} {mode:<10} {pages:>9} {stats.chars:>9} {ms:>9.1f} {stats.pages_per_sec:>9.1f}")
+            if budget != full[: args.max_chars]:
+                print(f"[FAIL] {path.name}: budgeted text is not a prefix of the full text")
+                failures += 1
+            if parallel != full:
+                print(f"[FAIL] {path.name}: parallel text differs from sequential")
+                failures += 1
+
+    if failures:
+        return 1
+    print("[PASS]")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
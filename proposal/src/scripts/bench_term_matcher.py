@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import argparse
+import copy
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from proposal_app.proposal import rules_engine as re_mod
+from proposal_app.proposal.postprocess import postprocess_llm_output
+from proposal_app.proposal.rules_engine import PipelineContext, compute_soft_metrics
+from proposal_app.proposal.term_matcher import TermMatcher
+
+_FILLER = "系统平台数据服务接口模块用户管理监测分析能力建设运行保障方案流程指标采集展示业务支撑能力"
+_CATEGORIES = {
+    "boundary": re_mod._BOUNDARY_HINTS,
+    "weak": re_mod._WEAK_TRADE_TRIGGERS,
+    "strong": re_mod._STRONG_TRADE_TRIGGERS,
+    "confusion": re_mod._TRADE_CONFUSION_PATTERNS,
+    "claim_a": re_mod._CLAIM_A_TERMS,
+    "claim_b": re_mod._CLAIM_B_TERMS,
+    "verb": re_mod._CLAIM_VERBS,
+    "perf": re_mod._PERF_TERMS,
+    "subjective": re_mod._FORBIDDEN_SUBJECTIVE_WORDS,
+}
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="bench-term-matcher")
+    parser.add_argument("--chars", type=int, default=100_000, help="Characters per document")
+    parser.add_argument("--docs", type=int, default=5, help="Number of documents")
+    parser.add_argument("--hit-rate", type=float, default=0.03, help="Probability a token is a rule term")
+    parser.add_argument("--seed", type=int, default=7)
+    return parser
+
+
+def _make_document(chars: int, hit_rate: float, rng: random.Random) -> dict:
+    terms = [t for ts in _CATEGORIES.values() for t in ts]
+    placeholders: dict[str, str] = {}
+    total = 0
+    idx = 0
+    while total < chars:
+        paragraphs: list[str] = []
+        for _ in range(rng.randint(3, 8)):
+            parts: list[str] = []
+            for _ in range(rng.randint(8, 30)):
+                if rng.random() < hit_rate:
+                    parts.append(rng.choice(terms))
+                else:
+                    start = rng.randrange(len(_FILLER) - 8)
+                    parts.append(_FILLER[start : start + rng.randint(2, 8)])
+                if rng.random() < 0.15:
+                    parts.append("。")
+            paragraphs.append("".join(parts) + "。")
+        text = "\n\n".join(paragraphs)
+        placeholders[f"{{{{ section_{idx:03d} }}}}"] = text
+        total += len(text)
+        idx += 1
+    return {"placeholders": placeholders, "tables": {}}
+
+
+def _naive_hits(paragraph: str) -> frozenset[str]:
+    return frozenset(name for name, terms in _CATEGORIES.items() if any(t in paragraph for t in terms))
+
+
+def _timed(fn, docs: list[dict]) -> float:
+    start = time.perf_counter()
+    for doc in docs:
+        fn(doc)
+    return time.perf_counter() - start
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    rng = random.Random(args.seed)
+    docs = [_make_document(args.chars, args.hit_rate, rng) for _ in range(args.docs)]
+    matcher = TermMatcher(_CATEGORIES)
+    paragraphs = [p for doc in docs for text in doc["placeholders"].values() for p in text.split("\n\n")]
+
+    mismatches = sum(1 for p in paragraphs if _naive_hits(p) != matcher.hits(p))
+    start = time.perf_counter()
+    for p in paragraphs:
+        _naive_hits(p)
+    naive_s = time.perf_counter() - start
+    start = time.perf_counter()
+    for p in paragraphs:
+        matcher.hits(p)
+    matcher_s = time.perf_counter() - start
+
+    backend = "pyahocorasick" if matcher._automaton is not None else "regex"
+    print(f"[Info] docs={len(docs)} chars/doc={args.chars} paragraphs={len(paragraphs)} backend={backend}")
+    print(f"[Scan] naive any(): {naive_s * 1000:.1f} ms")
+    print(f"[Scan] TermMatcher: {matcher_s * 1000:.1f} ms ({naive_s / matcher_s if matcher_s else 0:.2f}x)")
+    print(f"[Scan] mismatched paragraphs: {mismatches}")
+
+    ledger = {"references": [{"ref_id": "REF-01", "title": "性能测试报告", "date": "2025-03-01"}]}
+    payload = {"ledger": ledger, "llm_output": None}
+    timings = {
+        "R5 trade boundary": _timed(
+            lambda d: re_mod.rule_trade_boundary_sentence({**payload, "llm_output": d}), docs
+        ),
+        "R6 strong claim": _timed(
+            lambda d: re_mod.rule_strong_claim_requires_evidence({**payload, "llm_output": d}), docs
+        ),
+        "soft metrics": _timed(lambda d: compute_soft_metrics(PipelineContext(ledger=ledger, llm_output=d)), docs),
+        "postprocess": _timed(lambda d: postprocess_llm_output(copy.deepcopy(d)), docs),
+    }
+    for name, elapsed in timings.items():
+        print(f"[Rule] {name}: {elapsed / len(docs) * 1000:.1f} ms/doc")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
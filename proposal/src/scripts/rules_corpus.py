@@ -0,0 +1,326 @@
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from proposal_app.proposal.cluster_defs import PLACEHOLDER_FIELDS
+
+_PHASES = (
+    ("项目启动与PoC验证", "完成需求澄清、环境准备与PoC验证", "PoC报告、需求基线、数据接入清单"),
+    ("方案设计与开发实现", "完成总体设计、核心功能开发与联调", "总体设计文档、核心功能版本、联调记录"),
+    ("测试与性能验证", "完成系统测试、性能压测与安全测试", "测试报告、性能报告、安全整改清单"),
+    ("试点上线与验收准备", "完成试点上线、用户培训与验收资料准备", "上线清单、培训材料、验收用例"),
+    ("正式验收与移交运维", "完成正式验收、移交运维与持续支持启动", "验收证书、运维手册、支持SLA确认"),
+)
+_REF_KINDS = (
+    ("性能测试报告", "测试报告"),
+    ("压测报告", "测试报告"),
+    ("需求评审会议纪要", "纪要"),
+    ("PoC联调记录", "PoC"),
+    ("合作意向书", "合同"),
+    ("UAT验收报告", "验收"),
+    ("等保测评报告", "测评"),
+    ("数字化发展规划", "政策"),
+)
+_FILLER = (
+    "平台围绕数据采集、监测分析与可视化展示建设统一能力",
+    "系统按照分层架构设计，接入层、服务层与数据层职责清晰",
+    "运维团队提供7x24小时监控与告警响应",
+    "数据治理遵循统一编码规则与主数据管理要求",
+    "接口采用RESTful风格并提供鉴权与限流能力",
+    "项目组按周例会同步进度并跟踪风险闭环",
+    "通过灰度发布降低上线风险并保留回滚方案",
+    "核心业务流程覆盖申报、审核、核验与归档",
+)
+_SPICE = (
+    "平台仅提供存证核验与溯源查询，不提供撮合清结算，不对接外部交易平台。",
+    "系统支撑碳资产交易相关数据的上链存证。",
+    "依据{ref}（{date}），系统已通过压测，TPS达到{n}。",
+    "计划在阶段3完成性能验证，目标响应时间不高于{n}毫秒。",
+    "该方案在行业内处于领先水平，能力极其完善。",
+    "{risk}（{desc}）触发后按应急预案在{n}小时内处置。",
+    "关键节点安排在{date}完成评审。",
+    "{{\"metric\": \"availability\", \"target\": \"99.9%\"}}",
+)
+
+
+def _fmt(d: date) -> str:
+    return d.strftime("%Y-%m-%d")
+
+
+def _milestones(start: date, end: date, extra: int = 0) -> list[dict[str, str]]:
+    total_days = max((end - start).days, 1)
+    step = max(total_days // len(_PHASES), 1)
+    rows: list[dict[str, str]] = []
+    cur = start
+    for idx, (phase, tasks, deliverables) in enumerate(_PHASES):
+        seg_end = end if idx == len(_PHASES) - 1 else min(cur + timedelta(days=step), end)
+        rows.append(
+            {
+                "phase": phase,
+                "tasks": tasks,
+                "start_date": _fmt(cur),
+                "end_date": _fmt(seg_end),
+                "deliverables": deliverables,
+            }
+        )
+        cur = min(seg_end + timedelta(days=1), end)
+    # Sub-phase rows follow the five phases and split them evenly, so every
+    # row stays inside its parent phase and the delivery window.
+    for idx in range(extra):
+        parent = rows[idx % len(_PHASES)]
+        p_start = date.fromisoformat(parent["start_date"])
+        p_days = max((date.fromisoformat(parent["end_date"]) - p_start).days, 0)
+        part, parts = idx // len(_PHASES), (extra + len(_PHASES) - 1 - idx % len(_PHASES)) // len(_PHASES)
+        sub_start = p_start + timedelta(days=p_days * part // parts)
+        sub_end = p_start + timedelta(days=p_days * (part + 1) // parts)
+        rows.append(
+            {
+                "phase": f"{parent['phase']}-子阶段{part + 1}",
+                "tasks": parent["tasks"],
+                "start_date": _fmt(sub_start),
+                "end_date": _fmt(sub_end),
+                "deliverables": parent["deliverables"],
+            }
+        )
+    return rows
+
+
+def make_ledger(
+    rng: random.Random,
+    *,
+    references: int = 6,
+    risks: int = 5,
+    sub_phases: int = 0,
+    checkpoints: int = 0,
+    defect_rate: float = 0.0,
+) -> dict[str, Any]:
+    start = date(2025, 1, 1) + timedelta(days=rng.randint(0, 180))
+    end = start + timedelta(days=rng.randint(240, 540))
+    milestones = _milestones(start, end, sub_phases)
+    m = [(row["start_date"], row["end_date"]) for row in milestones]
+    m3_start = date.fromisoformat(m[2][0])
+    m5_start = date.fromisoformat(m[4][0])
+    ledger: dict[str, Any] = {
+        "delivery_window": {"start": _fmt(start), "end": _fmt(end)},
+        "poc_window": {"start": m[1][0], "end": m[1][1]},
+        "key_timepoints": {
+            "kickoff": m[0][0],
+            "delivery_window_start": m[0][0],
+            "interface_freeze": m[0][1],
+            "poc_start": m[1][0],
+            "poc_end": m[1][1],
+            "full_function_complete": _fmt(m3_start + timedelta(days=5)),
+            "integration_complete": m[2][1],
+            "uat_start": m[3][0],
+            "uat_pass": m[3][1],
+            "launch_window_start": m[4][0],
+            "stabilization_window": {"start": _fmt(m5_start + timedelta(days=3)), "end": m[4][1]},
+            "handover_complete": m[4][1],
+            "delivery_window_end": m[4][1],
+        },
+        "scope_boundary": {
+            "inclusions": ["数据采集与监测", "存证核验与溯源查询", "统计分析与报表"],
+            "exclusions": ["撮合清结算", "对接外部交易平台"],
+        },
+        "acceptance_criteria": {
+            "acceptance_definition": "核心功能通过UAT且性能指标达到台账口径",
+            "exit_criteria": "严重缺陷清零，一般缺陷不超过5个",
+        },
+        "performance_capacity": {
+            "response_time": "核心查询P95不高于2秒",
+            "user_concurrency": "并发用户500",
+            "device_connections": "设备连接1万",
+            "api_qps": "接口峰值QPS 300",
+        },
+        "sla_support": {
+            "availability_target": "99.9%",
+            "rto_target": "4小时",
+            "response_target": "30分钟响应",
+            "support_window": "7x24小时",
+        },
+        "compliance_requirements": {
+            "data_residency": "数据境内存储",
+            "regulatory_requirements": "满足等保二级要求",
+            "security_controls": "统一身份认证与操作审计",
+            "retention": {
+                "business_data": "5年",
+                "audit_log": "3年",
+                "ops_log": "1年",
+                "device_raw": "180天",
+                "blockchain_data": "长期",
+            },
+        },
+        "budget_resources": {"budget_total": "300万", "resource_constraints": "研发12人，服务器8台"},
+        "references": [],
+        "risk": {"register": [], "monitoring_plan": "", "contingency_plans": ""},
+        "tables": {"milestones": milestones},
+    }
+    key_timepoints = ledger["key_timepoints"]
+    for idx in range(checkpoints):
+        key_timepoints[f"review_checkpoint_{idx + 1:03d}"] = _fmt(start + timedelta(days=rng.randint(0, (end - start).days)))
+    for idx in range(references):
+        title, kind = _REF_KINDS[idx % len(_REF_KINDS)]
+        ledger["references"].append(
+            {
+                "ref_id": f"REF-{idx + 1:03d}",
+                "title": f"{title}{idx + 1}",
+                "type": kind,
+                "date": _fmt(start + timedelta(days=rng.randint(0, 60))),
+                "version": "V1.0",
+                "note": "",
+            }
+        )
+    register = ledger["risk"]["register"]
+    for idx in range(risks):
+        register.append(
+            {
+                "id": f"R{idx + 1:02d}",
+                "description": f"第{idx + 1}类接口延期风险",
+                "probability": rng.choice(["低", "中", "高"]),
+                "impact": rng.choice(["低", "中", "高"]),
+                "level": rng.choice(["低", "中", "高"]),
+                "trigger": f"接口联调延期超过{rng.randint(2, 10)}天",
+                "mitigation": "提前冻结接口并准备模拟服务",
+            }
+        )
+    ids = "、".join(item["id"] for item in register[:10])
+    ledger["risk"]["monitoring_plan"] = f"每周跟踪{ids}的触发条件"
+    ledger["risk"]["contingency_plans"] = f"{ids}触发后启动应急预案"
+    if defect_rate > 0:
+        _inject_ledger_defects(rng, ledger, defect_rate)
+    return ledger
+
+
+def _inject_ledger_defects(rng: random.Random, ledger: dict[str, Any], rate: float) -> None:
+    if rng.random() < rate:
+        ledger["key_timepoints"]["uat_start"] = ""
+    if rng.random() < rate:
+        ledger["poc_window"]["end"] = ledger["delivery_window"]["end"][:4] + "-13-01"
+    if rng.random() < rate:
+        ledger["sla_support"]["rto_target"] = ""
+    if rng.random() < rate:
+        ledger["tables"]["milestones"][2]["start_date"] = ledger["tables"]["milestones"][2]["end_date"]
+
+
+def _paragraph(rng: random.Random, ledger: dict[str, Any], spice_rate: float) -> str:
+    refs = ledger.get("references") or [{"title": "测试报告", "date": "2025-01-01"}]
+    register = (ledger.get("risk") or {}).get("register") or [{"id": "R01", "description": "接口延期风险"}]
+    window = ledger["delivery_window"]
+    parts: list[str] = []
+    for _ in range(rng.randint(2, 6)):
+        if rng.random() < spice_rate:
+            ref = rng.choice(refs)
+            risk = rng.choice(register)
+            in_window = rng.random() < 0.9
+            dt = window["start"] if in_window else "2030-01-01"
+            parts.append(
+                rng.choice(_SPICE).format(
+                    ref=ref.get("title", ""),
+                    date=ref.get("date", dt) if rng.random() < 0.5 else dt,
+                    n=rng.randint(1, 5000),
+                    risk=risk["id"],
+                    desc=risk["description"],
+                )
+            )
+        else:
+            parts.append(rng.choice(_FILLER) + "。")
+    return "".join(parts)
+
+
+def make_llm_output(
+    rng: random.Random,
+    ledger: dict[str, Any],
+    *,
+    target_chars: int = 10_000,
+    spice_rate: float = 0.15,
+) -> dict[str, Any]:
+    keys = list(PLACEHOLDER_FIELDS)
+    per_key = max(target_chars // len(keys), 40)
+    placeholders: dict[str, str] = {}
+    for key in keys:
+        paragraphs: list[str] = []
+        size = 0
+        while size < per_key:
+            p = _paragraph(rng, ledger, spice_rate)
+            paragraphs.append(p)
+            size += len(p) + 2
+        placeholders[key] = "\n\n".join(paragraphs)
+    register = (ledger.get("risk") or {}).get("register") or []
+    tables = {
+        "milestones": [dict(row) for row in (ledger.get("tables") or {}).get("milestones", [])],
+        "risk_register": [dict(item) for item in register],
+        "references_list": [
+            {k: ref.get(k, "") for k in ("title", "type", "date", "version", "note")} for ref in ledger.get("references", [])
+        ],
+    }
+    return {"placeholders": placeholders, "tables": tables}
+
+
+def make_case(seed: int, target_chars: int, *, defect_rate: float = 0.2) -> tuple[dict[str, Any], dict[str, Any]]:
+    # References, risks, milestone rows and timepoints grow with document size,
+    # roughly like real proposals.
+    rng = random.Random(seed)
+    references = min(4 + target_chars // 20_000, 400)
+    risks = min(3 + target_chars // 50_000, 99)
+    sub_phases = min(target_chars // 20_000, 200)
+    checkpoints = min(target_chars // 10_000, 300)
+    ledger = make_ledger(
+        rng,
+        references=references,
+        risks=risks,
+        sub_phases=sub_phases,
+        checkpoints=checkpoints,
+        defect_rate=defect_rate,
+    )
+    llm_output = make_llm_output(rng, ledger, target_chars=target_chars)
+    return ledger, llm_output
+
+
+def parse_size(text: str) -> int:
+    s = text.strip().lower()
+    scale = 1
+    if s.endswith("k"):
+        scale, s = 1_000, s[:-1]
+    elif s.endswith("m"):
+        scale, s = 1_000_000, s[:-1]
+    return int(float(s) * scale)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="rules-corpus")
+    parser.add_argument("--out", default="debug/corpus", help="Output dir; one debug-style subdir per case")
+    parser.add_argument("--sizes", default="10k,100k,1m", help="Comma-separated llm_output sizes in chars")
+    parser.add_argument("--per-size", type=int, default=1, help="Cases per size")
+    parser.add_argument("--seed", type=int, default=20250101)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    out_dir = Path(args.out).expanduser()
+    for size_text in args.sizes.split(","):
+        size = parse_size(size_text)
+        for idx in range(args.per_size):
+            ledger, llm_output = make_case(args.seed + idx, size)
+            case_dir = out_dir / f"{size_text.strip()}_{idx:02d}"
+            case_dir.mkdir(parents=True, exist_ok=True)
+            with open(case_dir / "ledger_output.json", "w", encoding="utf-8") as f:
+                json.dump(ledger, f, ensure_ascii=False, indent=2)
+            with open(case_dir / "llm_output.json", "w", encoding="utf-8") as f:
+                json.dump(llm_output, f, ensure_ascii=False, indent=2)
+            print(f"[Info] wrote {case_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import json
+import os
+import random
+import re
+import time
+from pathlib import Path
+
+import pytest
+
+from proposal_app.proposal import term_matcher
+from proposal_app.proposal.rules_engine import PipelineContext, RULES, RuleExecutor, Stage, run_rules
+from proposal_app.proposal.term_matcher import TermMatcher
+from rules_corpus import make_case, parse_size
+
+_BASELINE = Path(__file__).resolve().parents[1] / "src" / "scripts" / "baselines" / "rules_engine.json"
+_SEED = 20250101
+_ROUNDS = 5
+# Allowed slowdown ratio; slowdowns under _MIN_DELTA_MS are noise.
+_TOLERANCE = 0.3
+_MIN_DELTA_MS = 1.0
+
+
+def _calibrate(rounds: int = 5) -> float:
+    # Fixed pure-Python workload used to rescale baselines recorded on a different machine.
+    text = "平台围绕数据采集与监测分析建设统一能力，2025-01-01完成评审。" * 2000
+    pattern = re.compile(r"\d{4}-\d{2}-\d{2}")
+    samples: list[float] = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        counts: dict[str, int] = {}
+        for part in text.split("。"):
+            for token in pattern.findall(part):
+                counts[token] = counts.get(token, 0) + 1
+            counts[part[:4]] = counts.get(part[:4], 0) + 1
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return min(samples)
+
+
+def _case(name: str) -> tuple[PipelineContext, Stage, int]:
+    stage_text, size_text = name.split("@")
+    stage = Stage(stage_text)
+    ledger, llm_output = make_case(_SEED, parse_size(size_text))
+    chars = sum(len(v) for v in llm_output["placeholders"].values())
+    ctx = PipelineContext(ledger=ledger, llm_output=llm_output if stage == Stage.DOC_POST else None)
+    return ctx, stage, chars
+
+
+def _min_ms(ctx: PipelineContext, stage: Stage) -> float:
+    run_rules(ctx, RULES, stage)
+    samples: list[float] = []
+    for _ in range(_ROUNDS):
+        start = time.perf_counter()
+        run_rules(ctx, RULES, stage)
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return min(samples)
+
+
+def _baseline_cases() -> dict[str, dict]:
+    with open(_BASELINE, "r", encoding="utf-8") as f:
+        return json.load(f)["cases"]
+
+
+@pytest.fixture(scope="module")
+def calibration() -> tuple[float, float]:
+    with open(_BASELINE, "r", encoding="utf-8") as f:
+        base_cal = float(json.load(f)["calibration_ms"])
+    return _calibrate(), base_cal
+
+
+@pytest.mark.parametrize("name", list(_baseline_cases()))
+def test_run_rules_within_baseline(name: str, calibration: tuple[float, float]) -> None:
+    base = _baseline_cases()[name]
+    ctx, stage, chars = _case(name)
+    assert chars == base["chars"], "rules_corpus output changed; re-record the baseline"
+    elapsed = _min_ms(ctx, stage)
+    cal, base_cal = calibration
+    scale = cal / base_cal
+    allowed = max(base["min_ms"] * scale * (1.0 + _TOLERANCE), base["min_ms"] * scale + _MIN_DELTA_MS)
+    assert elapsed <= allowed, (
+        f"{name}: {elapsed:.2f} ms > allowed {allowed:.2f} ms (baseline {base['min_ms']:.2f} ms x {scale:.2f})"
+    )
+
+
+@pytest.mark.skipif(not os.getenv("PROPOSAL_UPDATE_RULES_BASELINE"), reason="set PROPOSAL_UPDATE_RULES_BASELINE=1")
+def test_update_baseline() -> None:
+    cases: dict[str, dict] = {}
+    for size_text in ("10k", "100k", "1m", "3m"):
+        for stage in (Stage.LEDGER, Stage.DOC_POST):
+            name = f"{stage.value}@{size_text}"
+            ctx, _, chars = _case(name)
+            cases[name] = {"min_ms": round(_min_ms(ctx, stage), 3), "chars": chars}
+    with open(_BASELINE, "w", encoding="utf-8") as f:
+        json.dump({"calibration_ms": round(_calibrate(), 3), "cases": cases}, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+
+@pytest.mark.parametrize("executor", [RuleExecutor.THREAD, RuleExecutor.PROCESS])
+@pytest.mark.parametrize("stage", [Stage.LEDGER, Stage.DOC_POST])
+def test_pool_executors_match_serial(executor: RuleExecutor, stage: Stage) -> None:
+    ledger, llm_output = make_case(_SEED, parse_size("100k"))
+    ctx = PipelineContext(ledger=ledger, llm_output=llm_output if stage == Stage.DOC_POST else None)
+    serial = run_rules(ctx, RULES, stage)
+    assert serial
+    assert run_rules(ctx, RULES, stage, executor=executor, max_workers=2) == serial
+
+
+_CATEGORIES = {
+    "trade": ("交易", "撮合", "清结算", "撮合交易"),
+    "claim": ("领先", "领先水平", "最先进", "第一"),
+    "boundary": ("不提供", "仅提供", "不对接"),
+    "empty": (),
+}
+_WORDS = [t for terms in _CATEGORIES.values() for t in terms] + ["平台", "数据", "系统", "能力", "服务", "，", "。"]
+
+
+def _texts(count: int = 300) -> list[str]:
+    rng = random.Random(_SEED)
+    return [""] + ["".join(rng.choice(_WORDS) for _ in range(rng.randint(1, 40))) for _ in range(count)]
+
+
+def _regex_matcher(monkeypatch: pytest.MonkeyPatch) -> TermMatcher:
+    monkeypatch.setattr(term_matcher, "ahocorasick", None)
+    matcher = TermMatcher(_CATEGORIES)
+    assert matcher._automaton is None
+    return matcher
+
+
+def test_regex_fallback_matches_substring_search(monkeypatch: pytest.MonkeyPatch) -> None:
+    regex_matcher = _regex_matcher(monkeypatch)
+    for text in _texts():
+        expected = frozenset(name for name, terms in _CATEGORIES.items() if any(t in text for t in terms))
+        assert regex_matcher.hits(text) == expected
+        assert regex_matcher.first(text) == next((name for name in _CATEGORIES if name in expected), None)
+    assert regex_matcher.count("撮合交易与交易撮合", "trade") == 3
+    assert regex_matcher.count("平台", "empty") == 0
+
+
+def test_automaton_matches_regex_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("ahocorasick")
+    matcher = TermMatcher(_CATEGORIES)
+    assert matcher._automaton is not None
+    regex_matcher = _regex_matcher(monkeypatch)
+    order = ("boundary", "claim", "trade")
+    for text in _texts():
+        assert matcher.hits(text) == regex_matcher.hits(text)
+        assert matcher.first(text, order) == regex_matcher.first(text, order)
+        for name in _CATEGORIES:
+            assert matcher.count(text, name) == regex_matcher.count(text, name)
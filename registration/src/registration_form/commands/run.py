@@ -9,6 +9,7 @@ def register(subparsers: argparse._SubParsersAction) -> None:
     parser = subparsers.add_parser("run", help="Generate registration form")
     parser.add_argument("--config", default="pyproject.toml", help="Config TOML path")
     parser.add_argument("--input-json", required=True, help="Input JSON path")
+    parser.add_argument("--reuse", action="store_true", help="Skip generation when the spec and inputs are unchanged since the last run")
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
     parser.set_defaults(func=handle)
 
@@ -10,7 +10,8 @@ from .renderer import generate_document
 from ..infra.fs import detect_dev_lang, detect_platform, load_yaml_config, read_text_content
 from ..infra.path_utils import normalize_path
 from ..infra.platform_pool import select_platform_profile_by_domain
-from ..infra.registration_llm import infer_registration_fields_with_llm
+from ..infra.registration_llm import REGISTRATION_FOCUS, infer_registration_fields_with_llm
+from ..infra.spec_fingerprint import fingerprint_text, inputs_digest, record_run, reusable_output
 from ..utils.format import build_filename
 
 logger = logging.getLogger(__name__)
@@ -46,11 +47,26 @@ def run_from_args(args) -> int:
     app_short_name = ""
 
     source_text = (model.source_text or "").strip()
+    prompt_text = source_text
     if not source_text and model.spec_path:
-        source_text = read_text_content(normalize_path(model.spec_path))
+        spec_path = normalize_path(model.spec_path)
+        # The keyword heuristics read the head of the spec; only the LLM prompt gets the focused budget.
+        source_text = read_text_content(spec_path)
+        prompt_text = read_text_content(spec_path, focus=REGISTRATION_FOCUS)
+
+    out_dir = normalize_path(model.resolved_output_dir())
+    spec_fp = fingerprint_text(source_text if prompt_text == source_text else f"{source_text}\n{prompt_text}")
+    contact_path = normalize_path(model.contact_info) if model.contact_info else cfg.doccollate.contact_info
+    inputs = inputs_digest(payload, cfg.config_path, cfg.templates.registration, contact_path, cfg.llm.model)
+    run_key = str(normalize_path(args.input_json))
+    if getattr(args, "reuse", False):
+        previous = reusable_output(out_dir, "registration", run_key, inputs, spec_fp)
+        if previous:
+            logger.info("[output] spec and inputs unchanged, reusing %s", previous)
+            return 0
 
     try:
-        llm_result = infer_registration_fields_with_llm(cfg.llm, source_text)
+        llm_result = infer_registration_fields_with_llm(cfg.llm, prompt_text)
     except Exception as exc:
         logger.error("Registration LLM inference failed: %s", exc)
         return 2
@@ -82,7 +98,7 @@ def run_from_args(args) -> int:
         or "企业管理"
     )
 
-    contact_config = load_yaml_config(normalize_path(model.contact_info) if model.contact_info else cfg.doccollate.contact_info)
+    contact_config = load_yaml_config(contact_path)
     company_profile = _pick_company_profile(contact_config, model.company or "")
     contact_info = company_profile.get("contact_info", {}) if isinstance(company_profile, dict) else {}
     holder_name = (
@@ -119,12 +135,12 @@ def run_from_args(args) -> int:
         logger.error("Missing registration template path")
         return 2
 
-    out_dir = normalize_path(model.resolved_output_dir())
     out_dir.mkdir(parents=True, exist_ok=True)
     out_path = out_dir / build_filename("产品测试登记表", output_model.app__name, output_model.app__version)
 
     logger.info("Rendering registration form")
     generate_document(template, out_path, output_model.model_dump())
+    record_run(out_dir, "registration", run_key, inputs, spec_fp, out_path)
     logger.info("[output] generated_file=%s", out_path)
     logger.info("[output] output_dir=%s", out_dir)
     return 0
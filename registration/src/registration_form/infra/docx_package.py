@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import io
+import logging
+import zipfile
+import zlib
+from pathlib import Path
+from typing import IO
+
+from .zip_raw import can_copy_raw, copy_raw, raw_copy_supported
+
+logger = logging.getLogger(__name__)
+
+# The fast path drives python-docx's PackageWriter statics (_write_content_types_stream,
+# _write_pkg_rels, _write_parts), present from python-docx 0.8.x through 1.2 and
+# checked here with 1.2.0; see zip_raw for the zipfile side. If either has moved,
+# save_docx falls back to Document.save().
+
+
+class _PassthroughZipWriter:
+    """
+    Stand-in for python-docx's zip writer.
+
+    Members whose bytes match the source package entry (same name, size and
+    CRC) are copied as the already-compressed bytes; everything else is
+    deflated as usual.
+    """
+
+    def __init__(self, target: str | Path | IO[bytes], source: str | Path | bytes) -> None:
+        self._src_fp = io.BytesIO(source) if isinstance(source, bytes) else open(source, "rb")
+        try:
+            self._src = zipfile.ZipFile(self._src_fp)
+        except Exception:
+            self._src_fp.close()
+            raise
+        self._zip = zipfile.ZipFile(target, "w", compression=zipfile.ZIP_DEFLATED)
+        self.copied = 0
+        self.written = 0
+
+    def write(self, pack_uri, blob: bytes) -> None:
+        name = pack_uri.membername
+        info = self._src.NameToInfo.get(name)
+        if (
+            info is not None
+            and can_copy_raw(info)
+            and info.file_size == len(blob)
+            and info.CRC == zlib.crc32(blob)
+        ):
+            copy_raw(self._src_fp, info, self._zip)
+            self.copied += 1
+            return
+        self._zip.writestr(name, blob)
+        self.written += 1
+
+    def close(self) -> None:
+        try:
+            self._zip.close()
+        finally:
+            self._src.close()
+            self._src_fp.close()
+
+
+def _save_passthrough(doc, out_path: str | Path | IO[bytes], source: str | Path | bytes) -> tuple[int, int]:
+    from docx.opc.pkgwriter import PackageWriter
+
+    package = doc.part.package
+    parts = list(package.iter_parts())
+    writer = _PassthroughZipWriter(out_path, source)
+    try:
+        PackageWriter._write_content_types_stream(writer, parts)
+        PackageWriter._write_pkg_rels(writer, package.rels)
+        PackageWriter._write_parts(writer, parts)
+    finally:
+        writer.close()
+    return writer.copied, writer.written
+
+
+def save_docx(doc, out_path: str | Path | IO[bytes], source: str | Path | bytes) -> tuple[int, int]:
+    """
+    Save a python-docx Document that was loaded from `source` (a path or the
+    package bytes).
+
+    Only parts whose serialized bytes differ from the source package are
+    recompressed; images, fonts and untouched XML parts are copied verbatim.
+    Returns (copied, rewritten) member counts, or (0, 0) when the library
+    internals this relies on are missing and Document.save() was used instead.
+    """
+    if raw_copy_supported():
+        try:
+            return _save_passthrough(doc, out_path, source)
+        except (AttributeError, TypeError) as exc:
+            logger.debug("Passthrough DOCX save unavailable (%s); using Document.save()", exc)
+            if hasattr(out_path, "seek"):
+                out_path.seek(0)
+                out_path.truncate()
+    doc.save(out_path)
+    return 0, 0
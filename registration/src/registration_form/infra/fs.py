@@ -3,13 +3,22 @@ from __future__ import annotations
 import logging
 import re
 from pathlib import Path
+from typing import Sequence
 
 import yaml
 
+from .docx_text import docx_text
+from .mapped_text import MappedText
 from .path_utils import normalize_path
+from .spec_budget import fit_to_budget
+from .spec_cache import DOCX_TEXT, cached_spec_text
 
 logger = logging.getLogger(__name__)
 
+# With focus keywords, how much of a spec (in multiples of max_chars) is read
+# before fit_to_budget picks sections.
+_FOCUS_READ_MULTIPLE = 8
+
 
 def load_yaml_config(path: Path) -> dict:
     p = normalize_path(path)
@@ -23,20 +32,24 @@ def load_yaml_config(path: Path) -> dict:
         return {}
 
 
-def read_text_content(path: Path, max_chars: int = 40000) -> str:
+def read_text_content(path: Path, max_chars: int = 40000, focus: Sequence[str] = ()) -> str:
+    """
+    Spec text capped at max_chars. Without `focus` the head of the document is
+    kept; with focus keywords up to _FOCUS_READ_MULTIPLE times max_chars is read
+    and the budget is spread over its sections by relevance (see
+    spec_budget.fit_to_budget).
+    """
     p = normalize_path(path)
     if not p.exists() or not p.is_file():
         return ""
     ext = p.suffix.lower()
+    limit = max_chars * _FOCUS_READ_MULTIPLE if focus else max_chars
     try:
         if ext == ".md":
-            return p.read_text(encoding="utf-8")[:max_chars]
+            with MappedText(p) as mapped:
+                return fit_to_budget(mapped.head(limit), max_chars, focus)
         if ext == ".docx":
-            from docx import Document
-
-            doc = Document(p)
-            parts = [para.text.strip() for para in doc.paragraphs if para.text.strip()]
-            return "\n".join(parts)[:max_chars]
+            return fit_to_budget(cached_spec_text(p, DOCX_TEXT, docx_text)[:limit], max_chars, focus)
     except Exception as exc:
         logger.warning("Failed to read spec text from %s: %s", p, exc)
     return ""
@@ -4,6 +4,7 @@ import json
 from urllib import error, request
 
 from ..core.config import LLMConfig
+from .spec_budget import fit_to_budget
 
 DEV_LANG_OPTIONS = [
     "Java",
@@ -16,6 +17,31 @@ DEV_LANG_OPTIONS = [
     "多语言混合",
 ]
 
+PROMPT_CHARS = 12000
+# Spec sections that state the business domain and the tech stack; they get the prompt budget first.
+REGISTRATION_FOCUS = (
+    "概述",
+    "简介",
+    "背景",
+    "行业",
+    "领域",
+    "业务",
+    "用户",
+    "技术",
+    "架构",
+    "开发环境",
+    "开发语言",
+    "编程语言",
+    "框架",
+    "java",
+    "python",
+    "javascript",
+    "typescript",
+    "c++",
+    "c#",
+    "rust",
+)
+
 
 def _build_prompt(source_text: str) -> str:
     langs = "、".join(DEV_LANG_OPTIONS)
@@ -26,7 +52,7 @@ def _build_prompt(source_text: str) -> str:
         "{\"product__app_domain\":\"\",\"env__dev_lang\":\"\"}。"
         f"其中 env__dev_lang 只能是：{langs}。"
         "product__app_domain 请给出简洁领域词（如：金融、医疗卫生、教育、互联网服务等）。\n\n"
-        f"说明书内容：\n{source_text[:12000]}"
+        f"说明书内容：\n{fit_to_budget(source_text, PROMPT_CHARS, REGISTRATION_FOCUS)}"
     )
 
 